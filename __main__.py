@@ -0,0 +1,198 @@
+import argparse
+import sys
+
+from .convert import COLUMNS, DEFAULT_COLUMNS, FORMATS, ConvertStats, convert_stream
+
+
+def _infer_format(paths) -> str:
+    for path in paths:
+        if path.endswith((".jsonl", ".ndjson")):
+            return "jsonl"
+
+    return "csv"
+
+
+def _convert(args) -> int:
+    paths = args.inputs or ["-"]
+    file_format = args.input_format or _infer_format(paths)
+    columns = args.columns or list(DEFAULT_COLUMNS)
+
+    output = sys.stdout if args.output in (None, "-") else open(args.output, "w", encoding = "utf-8", newline = "")
+    stats = ConvertStats()
+    try:
+        for index, path in enumerate(paths):
+            input = sys.stdin if path == "-" else open(path, encoding = "utf-8", newline = "")
+            try:
+                convert_stream(input, output, file_format, args.date_column, columns, args.chunk_size, args.workers,
+                               args.max_pending, stats, header = index == 0)
+            finally:
+                if input is not sys.stdin:
+                    input.close()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    print(f"converted {stats.rows} rows ({stats.errors} invalid) in {stats.seconds:.2f}s, "
+          f"{stats.rows_per_second:,.0f} rows/s", file = sys.stderr)
+
+    return 0
+
+
+def _almanac(args) -> int:
+    from .almanac import almanac, write_csv, write_json
+
+    end_year = args.start_year if args.end_year is None else args.end_year
+    if end_year < args.start_year:
+        raise SystemExit("end_year must not be less than start_year")
+
+    columns = almanac(range(args.start_year, end_year + 1))
+    write = write_json if args.format == "json" else write_csv
+
+    output = sys.stdout if args.output in (None, "-") else open(args.output, "w", encoding = "utf-8", newline = "")
+    try:
+        rows = write(columns, output)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    print(f"wrote {rows} days for Myanmar years {args.start_year}-{end_year}", file = sys.stderr)
+
+    return 0
+
+
+def _ics(args) -> int:
+    from datetime import date
+
+    from .enums.astro_flags import AstroFlags
+    from .enums.holiday import Holiday
+    from .ical import DEFAULT_ASTRO_FLAGS, write_ics
+
+    try:
+        holidays = () if args.no_holidays else None if args.holidays is None else [Holiday[name] for name in args.holidays]
+        astro_flags = DEFAULT_ASTRO_FLAGS if args.astro is None else AstroFlags.NoAstroDay
+        for name in args.astro or ():
+            astro_flags |= AstroFlags[name]
+    except KeyError as error:
+        raise SystemExit(f"unknown holiday or astro day: {error}")
+
+    output = sys.stdout if args.output in (None, "-") else open(args.output, "w", encoding = "utf-8", newline = "")
+    try:
+        events = write_ics(output, date.fromisoformat(args.start), date.fromisoformat(args.end), holidays, astro_flags, args.name)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    print(f"wrote {events} events from {args.start} to {args.end}", file = sys.stderr)
+
+    return 0
+
+
+def _parse(args) -> int:
+    import csv
+    from itertools import islice
+
+    from .julian_day import jdn_to_iso_date
+    from .parser import FAILED, ParseResult, parse_many
+
+    output = sys.stdout if args.output in (None, "-") else open(args.output, "w", encoding = "utf-8", newline = "")
+    writer = csv.writer(output, lineterminator = "\n")
+    writer.writerow(["text", "jdn", "date", "error"])
+    lines = errors = 0
+    try:
+        for path in args.inputs or ["-"]:
+            input = sys.stdin if path == "-" else open(path, encoding = "utf-8")
+            try:
+                while True:
+                    chunk = [line.rstrip("\r\n") for line in islice(input, args.chunk_size)]
+                    if not chunk:
+                        break
+
+                    result = parse_many(chunk, ParseResult())
+                    reasons = {index: reason for index, _, reason in result.errors}
+                    for index, (text, jdn) in enumerate(zip(chunk, result.jdns)):
+                        if jdn == FAILED:
+                            writer.writerow([text, "", "", reasons[index]])
+                            continue
+
+                        writer.writerow([text, jdn, jdn_to_iso_date(jdn), ""])
+
+                    lines += len(chunk)
+                    errors += len(result.errors)
+            finally:
+                if input is not sys.stdin:
+                    input.close()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    print(f"parsed {lines - errors} of {lines} lines ({errors} failed)", file = sys.stderr)
+
+    return 0
+
+
+def _serve(args) -> int:
+    from .server import serve
+
+    print(f"serving on http://{args.host}:{args.port}", file = sys.stderr)
+    serve(args.host, args.port, args.verbose, args.cache_size)
+
+    return 0
+
+
+def main(argv = None) -> int:
+    parser = argparse.ArgumentParser(prog = "python -m mm_calendar")
+    commands = parser.add_subparsers(dest = "command", required = True)
+
+    convert = commands.add_parser("convert", help = "add Myanmar calendar columns to CSV or JSON Lines dates",
+                                  description = "Columns: " + ", ".join(COLUMNS) + ", or any get_date_str format such as '&y &M &P &f'.")
+    convert.add_argument("inputs", nargs = "*", help = "input files (default: stdin)")
+    convert.add_argument("--input-format", "-f", choices = sorted(FORMATS), help = "default: jsonl for .jsonl/.ndjson files, otherwise csv")
+    convert.add_argument("--date-column", "-d", default = "date", help = "CSV column name or index, or JSON key, holding YYYY-MM-DD dates")
+    convert.add_argument("--column", "-c", dest = "columns", action = "append", help = "output column (repeatable, default: %s)" % ", ".join(DEFAULT_COLUMNS))
+    convert.add_argument("--output", "-o", help = "output file (default: stdout)")
+    convert.add_argument("--chunk-size", type = int, default = 10000)
+    convert.add_argument("--workers", "-j", type = int, help = "worker processes (default: CPU count, 1 runs in-process)")
+    convert.add_argument("--max-pending", type = int, help = "chunks in flight at once (default: workers x 2)")
+    convert.set_defaults(handler = _convert)
+
+    almanac = commands.add_parser("almanac", help = "write every day of Myanmar years as almanac columns",
+                                  description = "Columns: jdn, date, Myanmar fields, sasana year, Mahabote, Nakhat, dragon head direction, astro days and holidays.")
+    almanac.add_argument("start_year", type = int, help = "first Myanmar year")
+    almanac.add_argument("end_year", type = int, nargs = "?", help = "last Myanmar year (default: start_year)")
+    almanac.add_argument("--format", "-f", choices = ("csv", "json"), default = "csv", help = "csv rows or one columnar JSON object")
+    almanac.add_argument("--output", "-o", help = "output file (default: stdout)")
+    almanac.set_defaults(handler = _almanac)
+
+    ics = commands.add_parser("ics", help = "export holidays, Sabbath and astro days as an iCalendar (.ics) file",
+                              description = "Writes one all-day event per holiday and one per day for the chosen astro days, from START up to (not including) END.")
+    ics.add_argument("start", help = "first date (YYYY-MM-DD)")
+    ics.add_argument("end", help = "end date, not included (YYYY-MM-DD)")
+    ics.add_argument("--holiday", dest = "holidays", action = "append", help = "Holiday name to include (repeatable, default: all)")
+    ics.add_argument("--no-holidays", action = "store_true", help = "leave out holidays")
+    ics.add_argument("--astro", action = "append", help = "AstroFlags name to include (repeatable, default: Sabbath and SabbathEve)")
+    ics.add_argument("--name", help = "calendar name shown by calendar apps")
+    ics.add_argument("--output", "-o", help = "output file (default: stdout)")
+    ics.set_defaults(handler = _ics)
+
+    parse = commands.add_parser("parse", help = "parse Myanmar date strings (get_date_str/get_short_date_str output) back to dates",
+                                description = "Reads one Myanmar date per line and writes CSV rows of text, jdn, date and error.")
+    parse.add_argument("inputs", nargs = "*", help = "input files (default: stdin)")
+    parse.add_argument("--output", "-o", help = "output file (default: stdout)")
+    parse.add_argument("--chunk-size", type = int, default = 10000)
+    parse.set_defaults(handler = _parse)
+
+    serve = commands.add_parser("serve", help = "run a local HTTP conversion service",
+                                description = "Endpoints: /convert, /reverse, /format, /holidays (GET with a query string, or POST a JSON batch).")
+    serve.add_argument("--host", default = "127.0.0.1")
+    serve.add_argument("--port", "-p", type = int, default = 8000)
+    serve.add_argument("--cache-size", type = int, help = "response cache entries (default: 65536)")
+    serve.add_argument("--verbose", "-v", action = "store_true", help = "log every request to stderr")
+    serve.set_defaults(handler = _serve)
+
+    args = parser.parse_args(argv)
+
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+import csv
+import json
+from array import array
+from typing import Dict, TextIO, Union
+
+from .astro import get_astro_flags
+from .enums.direction import Direction
+from .enums.mahabote import MahaBote
+from .enums.mm_week_day import MMWeekDay
+from .enums.moon_phase import MoonPhase
+from .enums.myanmar_month import MyanmarMonth
+from .enums.nakhat import Nakhat
+from .holidays import HolidayCalendar
+from .julian_day import jdn_to_ymd
+from .month_info import iter_months
+from .year_info import iter_year_info
+
+# မြန်မာနှစ် အပိုင်းအခြား တစ်ခုလုံးရဲ့ ရက်တိုင်းအတွက် ပြက္ခဒိန် (almanac) column တွေကို တစ်ခါတည်း တွက်ပါတယ်။
+# ရက်တစ်ရက်ချင်း MMDate မဆောက်ဘဲ နှစ်အလိုက် တန်ဖိုး (နှစ်အမျိုးအစား၊ နက္ခတ်) နဲ့ လအလိုက် တန်ဖိုး (လ၊ လရဲ့ ရက်အရေအတွက်၊ နဂါးခေါင်းလှည့်ရာ)
+# တွေကို တစ်ကြိမ်ပဲ တွက်ပြီး ရက်အလိုက် တန်ဖိုးတွေကိုပဲ ရက်တိုင်း တွက်ပါတယ်။
+#
+# ရလဒ်က column နာမည် -> တန်ဖိုး dict ဖြစ်ပြီး row တစ်ခုက ရက်တစ်ရက် ဖြစ်ပါတယ်။ ကိန်းဂဏန်း column တွေက array၊
+# ကျန်တာတွေက list ဖြစ်ပြီး enum တွေကို convert.COLUMNS လိုပဲ နာမည် (string) နဲ့ ထည့်ပါတယ်။
+# astro နဲ့ holidays က နာမည် tuple တွေ ဖြစ်ပြီး တူတဲ့ tuple ကို ရက်တွေကြား မျှသုံးပါတယ်။
+
+COLUMNS = (
+    "jdn", "date", "week_day", "year", "sasana_year", "year_type", "month", "day", "month_length", "moon_phase",
+    "fornight_day", "mahabote", "nakhat", "dragon_head_direction", "astro", "holidays",
+)
+
+_INT_COLUMNS = {"jdn": "q", "year": "l", "sasana_year": "l", "day": "b", "month_length": "b", "fornight_day": "b"}
+
+_MOON_PHASES = tuple(moon_phase.name for moon_phase in MoonPhase)
+_WEEK_DAYS = tuple(week_day.name for week_day in MMWeekDay)
+_MAHABOTES = tuple(mahabote.name for mahabote in MahaBote)
+_NAKHATS = tuple(nakhat.name for nakhat in Nakhat)
+_DIRECTIONS = tuple(direction.name for direction in Direction)
+
+
+def _astro_names(flags) -> tuple:
+    return tuple(flag.name for flag in type(flags) if flag and flag in flags)
+
+
+def _dragon_head_direction(month: MyanmarMonth) -> str:
+    # first waso is considered as waso
+    month_value = MyanmarMonth.Waso.value if month == MyanmarMonth.FirstWaso else month.value
+
+    return _DIRECTIONS[(int) ((month_value % 12) / 3)]
+
+
+def _year_range(year_range: Union[int, range]) -> range:
+    if isinstance(year_range, int):
+        return range(year_range, year_range + 1)
+
+    if not isinstance(year_range, range):
+        raise TypeError(f"year_range must be a Myanmar year or a range of Myanmar years, got {type(year_range).__name__}")
+
+    if year_range.step != 1 or not year_range:
+        raise ValueError("year_range must be a non-empty range with step 1")
+
+    return year_range
+
+
+# year_range (မြန်မာနှစ် တစ်နှစ် ဒါမှမဟုတ် range) ထဲက နှစ်တွေရဲ့ နှစ်ဆန်းတစ်ရက်ကနေ နှစ်ကုန်ရက်အထိ ရက်တိုင်းကို
+# COLUMNS အစဉ်အတိုင်း column တွေအဖြစ် ပြန်ပေးပါတယ်။ ဥပမာ almanac(range(1386, 1388)) က ၁၃၈၆ နဲ့ ၁၃၈၇ ခုနှစ် ဖြစ်ပါတယ်။
+def almanac(year_range: Union[int, range]) -> Dict[str, Union[array, list]]:
+    year_range = _year_range(year_range)
+    start_year, end_year = year_range[0], year_range[-1]
+
+    # နှစ်အလိုက် တန်ဖိုးတွေကို တစ်ကြိမ်တည်း ဖြတ်တွက်ပြီး YearInfoCache ထဲ ကြိုထည့်ထားပါတယ်။
+    for _ in iter_year_info(start_year, end_year + 1):
+        pass
+
+    columns = {name: array(_INT_COLUMNS[name]) if name in _INT_COLUMNS else [] for name in COLUMNS}
+    jdns, dates, week_days = columns["jdn"], columns["date"], columns["week_day"]
+    years, sasana_years, year_types = columns["year"], columns["sasana_year"], columns["year_type"]
+    months, days, month_lengths = columns["month"], columns["day"], columns["month_length"]
+    moon_phases, fornight_days = columns["moon_phase"], columns["fornight_day"]
+    mahabotes, nakhats, directions = columns["mahabote"], columns["nakhat"], columns["dragon_head_direction"]
+    astro, holidays = columns["astro"], columns["holidays"]
+
+    astro_names = {}
+    holiday_names = {(): ()}
+    en_year = None
+    year_holidays = None
+
+    for month_info in iter_months(start_year, end_year):
+        year = month_info.year
+        month = month_info.month
+        month_value = month.value
+        month_length = month_info.length
+        first_day = month_info.first_jdn - month_info.start_jdn + 1
+        count = month_info.last_jdn - month_info.first_jdn + 1
+
+        # လတစ်လလုံး တူတဲ့ တန်ဖိုးတွေ
+        years.extend([year] * count)
+        year_types.extend([month_info.year_type.name] * count)
+        months.extend([month.name] * count)
+        month_lengths.extend([month_length] * count)
+        nakhats.extend([_NAKHATS[year % 3]] * count)
+        directions.extend([_dragon_head_direction(month)] * count)
+
+        for day in range(first_day, first_day + count):
+            jdn = month_info.start_jdn + day - 1
+            week_day = (jdn + 2) % 7
+            y, m, d = jdn_to_ymd(jdn)
+
+            jdns.append(jdn)
+            dates.append(f"{y:04d}-{m:02d}-{d:02d}")
+            week_days.append(_WEEK_DAYS[week_day])
+            days.append(day)
+            moon_phases.append(_MOON_PHASES[(int) ((day + 1) / 16) + (int) (day / 16) + (int) (day / month_length)])
+            fornight_days.append(day - 15 * ((int) (day / 16)))
+            mahabotes.append(_MAHABOTES[(year - week_day) % 7])
+
+            buddhist_era_offset = 1181 if month == MyanmarMonth.Tagu or (month == MyanmarMonth.Kason and day < 16) else 1182
+            sasana_years.append(year + buddhist_era_offset)
+
+            flags = get_astro_flags(month_value, week_day, day, month_length)
+            names = astro_names.get(flags)
+            if names is None:
+                names = astro_names[flags] = _astro_names(flags)
+
+            astro.append(names)
+
+            # ရုံးပိတ်ရက်တွေကို ခရစ်နှစ် တစ်နှစ်စာ ဇယား (HolidayCalendar) ကနေ ယူပါတယ်။
+            if y != en_year:
+                en_year = y
+                year_holidays = HolidayCalendar.get_year_holidays(en_year).holidays
+
+            day_holidays = year_holidays.get(jdn, ())
+            names = holiday_names.get(day_holidays)
+            if names is None:
+                names = holiday_names[day_holidays] = tuple(holiday.name for holiday in day_holidays)
+
+            holidays.append(names)
+
+    return columns
+
+
+def _value(value):
+    return ";".join(value) if isinstance(value, tuple) else value
+
+
+# column တွေကို header ပါတဲ့ CSV အဖြစ် ရေးပါတယ်။ astro နဲ့ holidays ကို convert လိုပဲ ; နဲ့ ဆက်ပါတယ်။
+def write_csv(columns: Dict[str, Union[array, list]], output: TextIO) -> int:
+    writer = csv.writer(output, lineterminator = "\n")
+    writer.writerow(columns)
+
+    rows = 0
+    for row in zip(*columns.values()):
+        writer.writerow([_value(value) for value in row])
+        rows += 1
+
+    return rows
+
+
+# column တွေကို {"column": [တန်ဖိုးများ], ...} ပုံစံ JSON object တစ်ခုအဖြစ် ရေးပါတယ်။
+def write_json(columns: Dict[str, Union[array, list]], output: TextIO) -> int:
+    json.dump({name: values.tolist() if isinstance(values, array) else values for name, values in columns.items()},
+              output, ensure_ascii = False)
+    output.write("\n")
+
+    return len(columns["jdn"])
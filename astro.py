@@ -0,0 +1,161 @@
+from .enums.astro_flags import AstroFlags
+from .translations import ASTRO_DAY_MAPPING
+
+# ရက်ရာဇာ၊ ပြဿဒါး စတဲ့ ရက်တွေက (လ၊ နေ့၊ ရက်၊ လရဲ့ ရက်အရေအတွက်) ပေါ်မှာပဲ မူတည်တာမို့
+# ဖြစ်နိုင်တဲ့ အတွဲတိုင်းအတွက် AstroFlags bitmask ကို ဇယားတစ်ခုမှာ ကြိုတွက်ထားပြီး တစ်ကြိမ်တည်း ရှာပါတယ်။
+# month: MyanmarMonth value (0-14), week_day: MMWeekDay value (0-6), day: 1-31, month_length: 29-31
+
+_ASTRO_FLAGS = tuple(flag for flag in AstroFlags if flag)
+
+_THAMA_PHYU_DAYS = ((1, 0), (2, 1), (6, 0), (6, 0), (5, 0), (6, 3), (7, 3))
+_AMYEITTASOTE_DAYS = (5, 8, 3, 7, 2, 4, 1)
+_WARAMEITTU_GYI_DAYS = (7, 1, 4, 8, 9, 6, 3)
+_YAT_POTE_DAYS = (8, 1, 4, 6, 9, 8, 7)
+_NAGA_POR_DAYS = ((26, 17), (21, 19), (2, 1), (10, 0), (18, 9), (2, 0), (21, 0))
+_PYATHADA_MONTHS = (1, 3, 3, 0, 2, 1, 2)
+_SHAN_YAT_DAYS = (8, 8, 2, 2, 9, 3, 3, 5, 1, 4, 7, 4)
+
+
+# နှောင်းလတွေကို ၁-၁၂ ပြန်ပြောင်းပြီး ပထမဝါဆိုကို ဝါဆိုလို့ ယူပါတယ်။
+def _to_twelve_months(month: int) -> int:
+    month_type = (int) (month / 13)
+    month = month % 13 + month_type # to 1-12 with month type
+
+    return 4 if month <= 0 else month # first waso is considered waso
+
+
+def _fornight_day(day: int) -> int:
+    return (int) (day - 15 * ((int) (day / 16)))
+
+
+def is_sabbath_eve(month: int, week_day: int, day: int, month_length: int) -> bool:
+    return (day in (7, 14, 22)) or day == month_length - 1
+
+
+def is_sabbath(month: int, week_day: int, day: int, month_length: int) -> bool:
+    return (day in (8, 15, 23)) or day == month_length
+
+
+def is_yatyaza(month: int, week_day: int, day: int, month_length: int) -> bool:
+    m1 = month % 4
+    wd1 = ((int) (m1 / 2)) + 4
+    wd2 = ((1 - ((int)(m1 / 2))) + m1 % 2) * (1 + 2 * (m1 % 2))
+
+    return week_day in (wd1, wd2)
+
+
+def is_pyathada(month: int, week_day: int, day: int, month_length: int) -> bool:
+    return month % 4 == _PYATHADA_MONTHS[week_day]
+
+
+def is_thama_nyo(month: int, week_day: int, day: int, month_length: int) -> bool:
+    month = _to_twelve_months(month)
+    m1 = month - 1 - ((int) (month / 9))
+    wd1 = ((m1 * 2) - ((int) (m1 / 8))) % 7
+    wd2 = (week_day + 7 - wd1) % 7
+
+    return wd2 <= 1
+
+
+def is_thama_phyu(month: int, week_day: int, day: int, month_length: int) -> bool:
+    fornight_day = _fornight_day(day)
+    if fornight_day in _THAMA_PHYU_DAYS[week_day]:
+        return True
+
+    return fornight_day == 4 and week_day == 5 # Thursday
+
+
+def is_amyeittasote(month: int, week_day: int, day: int, month_length: int) -> bool:
+    return _fornight_day(day) == _AMYEITTASOTE_DAYS[week_day]
+
+
+def is_warameittu_gyi(month: int, week_day: int, day: int, month_length: int) -> bool:
+    return _fornight_day(day) == _WARAMEITTU_GYI_DAYS[week_day]
+
+
+def is_warameittu_nge(month: int, week_day: int, day: int, month_length: int) -> bool:
+    return 12 - _fornight_day(day) == (week_day + 6) % 7
+
+
+def is_yat_pote(month: int, week_day: int, day: int, month_length: int) -> bool:
+    return _fornight_day(day) == _YAT_POTE_DAYS[week_day]
+
+
+def is_naga_por(month: int, week_day: int, day: int, month_length: int) -> bool:
+    if day in _NAGA_POR_DAYS[week_day]:
+        return True
+
+    return (day == 2 and week_day == 1) or (day in (12, 4, 18) and week_day == 2)
+
+
+def is_yat_yotema(month: int, week_day: int, day: int, month_length: int) -> bool:
+    month = _to_twelve_months(month)
+    m1 = month if month % 2 else (month + 9) % 12
+    m1 = (m1 + 4) % 12 + 1
+
+    return _fornight_day(day) == m1
+
+
+def is_maha_yat_kyan(month: int, week_day: int, day: int, month_length: int) -> bool:
+    # first waso is considered as waso
+    if month == 0:
+        month = 4
+
+    m1 = ((int) ((month % 12) / 2)) + 4
+    m1 = (m1 % 6) + 1
+
+    return _fornight_day(day) == m1
+
+
+def is_shan_yat(month: int, week_day: int, day: int, month_length: int) -> bool:
+    return _fornight_day(day) == _SHAN_YAT_DAYS[_to_twelve_months(month) - 1]
+
+
+# AstroFlags အစဉ်အတိုင်း
+_PREDICATES = (
+    is_sabbath_eve, is_sabbath, is_yatyaza, is_pyathada, is_thama_nyo, is_thama_phyu, is_amyeittasote,
+    is_warameittu_gyi, is_warameittu_nge, is_yat_pote, is_naga_por, is_yat_yotema, is_maha_yat_kyan, is_shan_yat,
+)
+
+_table = None
+
+
+def _index(month: int, week_day: int, day: int, month_length: int) -> int:
+    return ((month * 7 + week_day) * 32 + day) * 3 + month_length - 29
+
+
+def _build_table() -> list:
+    table = [AstroFlags.NoAstroDay] * _index(15, 0, 0, 29)
+    for month in range(15):
+        for week_day in range(7):
+            for day in range(1, 32):
+                for month_length in (29, 30, 31):
+                    flags = AstroFlags.NoAstroDay
+                    for flag, predicate in zip(_ASTRO_FLAGS, _PREDICATES):
+                        if predicate(month, week_day, day, month_length):
+                            flags |= flag
+
+                    table[_index(month, week_day, day, month_length)] = flags
+
+    return table
+
+
+def get_astro_flags(month: int, week_day: int, day: int, month_length: int) -> AstroFlags:
+    global _table
+    if _table is None:
+        _table = _build_table()
+
+    return _table[_index(month, week_day, day, month_length)]
+
+
+_astro_day_names = {}
+
+
+def get_astro_day_names(flags: AstroFlags) -> tuple:
+    names = _astro_day_names.get(flags)
+    if names is None:
+        value = int(flags)
+        names = tuple(name for index, name in enumerate(ASTRO_DAY_MAPPING) if value >> index & 1)
+        _astro_day_names[flags] = names
+
+    return names
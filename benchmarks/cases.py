@@ -0,0 +1,197 @@
+import io
+from datetime import date
+from typing import Callable, List
+
+from ..almanac import almanac
+from ..enums.moon_phase import MoonPhase
+from ..enums.myanmar_month import MyanmarMonth
+from ..holidays import HolidayCalendar
+from ..ical import write_ics
+from ..julian_day import jdn_to_date
+from ..mm_date import MMDate, MMDateCache
+from ..parser import parse_many
+from ..watat_strategy.watat_strategy_factory import WatatStrategyFactory
+from ..year_info import YearInfoCache, iter_year_info
+
+# ခေတ် နဲ့ မကရန္တ နယ်နိမိတ် တစ်ဖက်တစ်ချက်က နှစ်တွေ
+# (မကရန္တ ၁/၂၊ ပထမခေတ် သင်္ကြန် စနှစ်၊ ဒုတိယခေတ်၊ တတိယခေတ်)
+BOUNDARY_YEARS = (797, 798, 1099, 1100, 1216, 1217, 1311, 1312)
+
+ADD_DAYS_WALK = 365
+YEAR_RUN = 100
+
+
+# benchmark တစ်ခုဖြစ်ပြီး make(year) က တိုင်းမယ့် (argument မပါတဲ့) function ကို ပြန်ပေးပါတယ်။
+# cold ဆိုရင် ခေါ်တိုင်း cache တွေကို ရှင်းပြီးမှ တိုင်းပါတယ်။
+class Case:
+    __slots__ = ('name', 'make', 'cold')
+
+    def __init__(self, name: str, make: Callable[[int], Callable[[], object]], cold: bool = False) -> None:
+        self.name = name
+        self.make = make
+        self.cold = cold
+
+    def key(self, year: int) -> str:
+        return f"{self.name}[{year}]"
+
+
+def clear_caches() -> None:
+    YearInfoCache.clear()
+    HolidayCalendar.clear()
+    WatatStrategyFactory.clear()
+    MMDateCache.clear()
+
+
+# ဒီနှစ်ရဲ့ တန်ခူးလဆန်း ၁ ရက်ကနေ ရက် ၁၀၀ ကြာတဲ့ ခရစ်နှစ် ရက်စွဲ (ဝါဆိုလ ဝန်းကျင်)
+def sample_date(year: int) -> date:
+    jdn = YearInfoCache.get(year).first_day_of_tagu + 100
+
+    return jdn_to_date(jdn)
+
+
+def _construct(year: int):
+    en_date = sample_date(year)
+
+    return lambda: MMDate(en_date)
+
+
+def _construct_and_read(year: int):
+    en_date = sample_date(year)
+
+    def run():
+        mm_date = MMDate(en_date)
+        return mm_date.year_type, mm_date.month, mm_date.day, mm_date.moon_phase
+
+    return run
+
+
+def _from_mm_date(year: int):
+    return lambda: MMDate.from_mm_date(year, MyanmarMonth.Waso, 20)
+
+
+def _from_mm_date_fd(year: int):
+    return lambda: MMDate.from_mm_date_fd(year, MyanmarMonth.Waso, MoonPhase.Waning, 5)
+
+
+def _add_days_walk(year: int):
+    en_date = sample_date(year)
+
+    def run():
+        mm_date = MMDate(en_date)
+        for _ in range(ADD_DAYS_WALK):
+            mm_date = mm_date.add_days(1)
+            mm_date.day
+
+        return mm_date
+
+    return run
+
+
+def _add_months(months: int):
+    def make(year: int):
+        mm_date = MMDate(sample_date(year))
+
+        return lambda: mm_date.add_months(months)
+
+    return make
+
+
+def _add_years(year: int):
+    mm_date = MMDate(sample_date(year))
+
+    return lambda: mm_date.add_years(10)
+
+
+def _diff_months(year: int):
+    mm_date = MMDate(sample_date(year))
+    other = MMDate(sample_date(year - 10))
+
+    return lambda: mm_date.diff(other, "months")
+
+
+def _property(name: str):
+    def make(year: int):
+        mm_date = MMDate(sample_date(year))
+
+        return lambda: getattr(mm_date, name)
+
+    return make
+
+
+def _get_holidays(year: int):
+    en_date = sample_date(year)
+
+    return lambda: MMDate(en_date).get_holidays()
+
+
+def _get_date_str(format: str):
+    def make(year: int):
+        en_date = sample_date(year)
+
+        return lambda: MMDate(en_date).get_date_str(format)
+
+    return make
+
+
+# year နောက်က YEAR_RUN နှစ်စာ YearInfo ကို တစ်နှစ်ချင်း cache ကနေ ယူတာနဲ့ iter_year_info နဲ့ တစ်ကြိမ်တည်း တွက်တာ
+def _year_info_loop(year: int):
+    return lambda: [YearInfoCache.get(run_year) for run_year in range(year, year + YEAR_RUN)]
+
+
+def _iter_year_info(year: int):
+    return lambda: list(iter_year_info(year, year + YEAR_RUN - 1))
+
+
+def _almanac(year: int):
+    return lambda: almanac(year)
+
+
+def _write_ics(year: int):
+    en_year = sample_date(year).year
+
+    return lambda: write_ics(io.StringIO(), date(en_year, 1, 1), date(en_year + 1, 1, 1))
+
+
+# year ရဲ့ ရက်တိုင်းကို get_short_date_str နဲ့ ရေးထားတဲ့ စာကြောင်းတွေ
+def _parse_many(year: int):
+    start_jdn = YearInfoCache.get(year).new_year_day
+    lines = [MMDate.from_jdn(jdn).get_short_date_str() for jdn in range(start_jdn, YearInfoCache.get(year + 1).new_year_day)]
+
+    return lambda: parse_many(lines)
+
+
+def _get_strategy(year: int):
+    return lambda: WatatStrategyFactory.get_strategy(year)
+
+
+def _create_strategy(year: int):
+    return lambda: WatatStrategyFactory._create_strategy(year)
+
+
+CASES: List[Case] = [
+    Case("construct", _construct),
+    Case("construct_cold", _construct_and_read, cold = True),
+    Case("construct_and_read", _construct_and_read),
+    Case("from_mm_date", _from_mm_date),
+    Case("from_mm_date_fd", _from_mm_date_fd),
+    Case("add_days_walk_365", _add_days_walk),
+    Case("add_months_1", _add_months(1)),
+    Case("add_months_120", _add_months(120)),
+    Case("add_years_10", _add_years),
+    Case("diff_months_10_years", _diff_months),
+    Case("property_year_type", _property("year_type")),
+    Case("property_month", _property("month")),
+    Case("property_day", _property("day")),
+    Case("property_moon_phase", _property("moon_phase")),
+    Case("get_holidays", _get_holidays),
+    Case("get_holidays_cold", _get_holidays, cold = True),
+    Case("get_date_str", _get_date_str("&y &M &P &f")),
+    Case("get_date_str_astro", _get_date_str("&yyyy-&mm-&dd &W &A &D")),
+    Case("year_info_loop_100_cold", _year_info_loop, cold = True),
+    Case("iter_year_info_100_cold", _iter_year_info, cold = True),
+    Case("almanac_year", _almanac),
+    Case("write_ics_year", _write_ics),
+    Case("parse_many_year", _parse_many),
+    Case("get_strategy", _get_strategy),
+    Case("create_strategy", _create_strategy),
+]
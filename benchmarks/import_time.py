@@ -0,0 +1,112 @@
+import argparse
+import json
+import subprocess
+import sys
+
+# python -m mm_calendar.benchmarks.import_time [--repeat 7] [--output results.json]
+# module တစ်ခုစီကို python -X importtime နဲ့ process အသစ်ထဲမှာ import လုပ်ပြီး interpreter အလွတ် (python -c pass) ထက်
+# ပိုကုန်တဲ့ import ကြာချိန် (ms) ကို repeat ကြိမ်ထဲက အနည်းဆုံးနဲ့ ယူပါတယ်။ budget ကျော်ရင် ဒါမှမဟုတ်
+# lazy ဖြစ်ရမယ့် module တွေ ပါလာရင် exit code 1 ပြန်ပေးပါတယ်။
+#
+# Budget (ms) - CPython 3.11၊ single core VM ပေါ်မှာ တိုင်းထားတဲ့ တန်ဖိုး (ကွင်းထဲမှာ) ထက် နည်းနည်း ချန်ထားပါတယ်။
+#   mm_calendar.mm_date    20  (~13)  ရက်စွဲ ပြောင်းရုံပဲ လိုတဲ့ core (typing/re၊ ရုံးပိတ်ရက်၊ ဗေဒင်၊ format module တွေ မပါရ)
+#   mm_calendar.convert    40  (~25)  convert CLI (csv၊ json၊ format module တွေ ပါပြီး process pool က workers > 1 မှ ပါပါတယ်)
+#   mm_calendar.server    100  (~68)  HTTP server (http.server၊ email စတဲ့ standard library module တွေ ပါပါတယ်)
+
+BUDGETS_MS = {
+    "mm_calendar.mm_date": 20.0,
+    "mm_calendar.convert": 40.0,
+    "mm_calendar.server": 100.0,
+}
+
+# core ကို import လုပ်ရုံနဲ့ မပါလာရတဲ့ module တွေ (ပထမဆုံး သုံးတော့မှ import လုပ်ရမယ့် module တွေ)
+LAZY_MODULES = {
+    "mm_calendar.mm_date": (
+        "typing",
+        "re",
+        "mm_calendar.astro",
+        "mm_calendar.date_format",
+        "mm_calendar.date_range",
+        "mm_calendar.holidays",
+        "mm_calendar.thingyan",
+        "mm_calendar.enums.holiday",
+        "mm_calendar.watat_strategy.first_era_makaranta1_strategy",
+        "mm_calendar.watat_strategy.first_era_makaranta2_strategy",
+        "mm_calendar.watat_strategy.first_era_watat_strategy",
+        "mm_calendar.watat_strategy.second_era_watat_strategy",
+        "mm_calendar.watat_strategy.third_era_watat_strategy",
+    ),
+}
+
+_LIST_MODULES = "import sys; print('\\n'.join(sys.modules))"
+
+
+def _import_times(code: str) -> dict:
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output = True, text = True, check = True)
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        self_us, _, name = line[len("import time:"):].split("|")
+        if self_us.strip().isdigit():
+            times[name.strip()] = int(self_us)
+
+    return times
+
+
+# interpreter အလွတ်မှာ မပါတဲ့ (ဒီ import ကြောင့် ပါလာတဲ့) module တွေရဲ့ self ကြာချိန် ပေါင်းလဒ် (microsecond)
+def measure(module: str, repeat: int = 7) -> dict:
+    baseline = set(_import_times("pass"))
+    totals = []
+    own = []
+    for _ in range(repeat):
+        times = _import_times(f"import {module}")
+        totals.append(sum(us for name, us in times.items() if name not in baseline))
+        own.append(sum(us for name, us in times.items() if name.split(".")[0] == "mm_calendar"))
+
+    return {"import_ms": round(min(totals) / 1000, 3), "package_ms": round(min(own) / 1000, 3)}
+
+
+def loaded_modules(module: str) -> set:
+    output = subprocess.run([sys.executable, "-c", f"import {module}; {_LIST_MODULES}"], capture_output = True, text = True, check = True).stdout
+    baseline = subprocess.run([sys.executable, "-c", _LIST_MODULES], capture_output = True, text = True, check = True).stdout
+
+    return set(output.split()) - set(baseline.split())
+
+
+def run(repeat: int = 7, verbose: bool = True) -> dict:
+    results = {}
+    for module, budget in BUDGETS_MS.items():
+        result = measure(module, repeat)
+        result["budget_ms"] = budget
+        result["eager"] = sorted(set(LAZY_MODULES.get(module, ())) & loaded_modules(module))
+        result["ok"] = result["import_ms"] <= budget and not result["eager"]
+        results[module] = result
+
+        if verbose:
+            status = "ok" if result["ok"] else "OVER BUDGET" if not result["eager"] else "eager: " + ", ".join(result["eager"])
+            print(f"{module:<28} {result['import_ms']:>8.2f} ms (package {result['package_ms']:.2f} ms, budget {budget:.0f} ms)  {status}",
+                  file = sys.stderr)
+
+    return results
+
+
+def main(argv = None) -> int:
+    parser = argparse.ArgumentParser(prog = "python -m mm_calendar.benchmarks.import_time", description = "Check mm_calendar import time budgets.")
+    parser.add_argument("--repeat", type = int, default = 7, help = "fresh interpreters per module (the fastest is reported)")
+    parser.add_argument("--output", "-o", help = "write results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat)
+
+    if args.output:
+        with open(args.output, "w", encoding = "utf-8") as file:
+            json.dump(results, file, indent = 2, sort_keys = True)
+
+    return 0 if all(result["ok"] for result in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+import argparse
+import http.client
+import json
+import random
+import statistics
+import sys
+import threading
+import time
+from datetime import date, timedelta
+from typing import List, Optional
+from urllib.parse import urlsplit
+
+# python -m mm_calendar.benchmarks.load_test [--url http://127.0.0.1:8000] [--requests 2000] [--concurrency 8] [--batch 1]
+# --url မပေးရင် localhost မှာ server ကို ဒီ process ထဲမှာပဲ (လွတ်တဲ့ port နဲ့) စပြီး တိုင်းပါတယ်။
+# client တစ်ခုစီက keep-alive connection တစ်ခုတည်းကို ပြန်သုံးပြီး ရလဒ်ကို latency p50/p90/p99 (ms) နဲ့ requests/sec အဖြစ် JSON ထုတ်ပေးပါတယ်။
+# batch က request တစ်ခုမှာ ပါမယ့် ရက်အရေအတွက် ဖြစ်ပြီး 1 ဆိုရင် GET /convert ကို သုံးပါတယ်။
+
+
+def _random_dates(count: int, first_year: int, last_year: int, rng: random.Random) -> List[str]:
+    start = date(first_year, 1, 1)
+    span = (date(last_year, 12, 31) - start).days
+
+    return [(start + timedelta(days = rng.randrange(span + 1))).isoformat() for _ in range(count)]
+
+
+def _client(host: str, port: int, requests: List[tuple], latencies: List[float], errors: List[str]) -> None:
+    connection = http.client.HTTPConnection(host, port, timeout = 30)
+    try:
+        for method, path, body in requests:
+            headers = {"Content-Type": "application/json"} if body is not None else {}
+            start = time.perf_counter()
+            try:
+                connection.request(method, path, body, headers)
+                response = connection.getresponse()
+                response.read()
+            except (OSError, http.client.HTTPException) as error:
+                errors.append(repr(error))
+                connection.close()
+                continue
+
+            latencies.append(time.perf_counter() - start)
+            if response.status != 200:
+                errors.append(f"HTTP {response.status}")
+    finally:
+        connection.close()
+
+
+def _percentile(values: List[float], percent: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+
+    return statistics.quantiles(values, n = 100, method = "inclusive")[percent - 1]
+
+
+def run(url: str, requests: int = 2000, concurrency: int = 8, batch: int = 1, fields: Optional[str] = None,
+        first_year: int = 1900, last_year: int = 2100, seed: int = 0) -> dict:
+    parts = urlsplit(url)
+    rng = random.Random(seed)
+    dates = _random_dates(requests * batch, first_year, last_year, rng)
+
+    # request တွေကို အရင် ပြင်ထားပြီး client တွေကို အလှည့်ကျ ခွဲပေးပါတယ်။
+    planned = []
+    for index in range(requests):
+        chunk = dates[index * batch:(index + 1) * batch]
+        if batch == 1:
+            query = f"date={chunk[0]}" + (f"&fields={fields}" if fields else "")
+            planned.append(("GET", f"/convert?{query}", None))
+        else:
+            body = {"dates": chunk}
+            if fields:
+                body["fields"] = fields.split(",")
+
+            planned.append(("POST", "/convert", json.dumps(body)))
+
+    latencies: List[List[float]] = [[] for _ in range(concurrency)]
+    errors: List[str] = []
+    threads = [
+        threading.Thread(target = _client, args = (parts.hostname, parts.port or 80, planned[index::concurrency], latencies[index], errors))
+        for index in range(concurrency)
+    ]
+
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    seconds = time.perf_counter() - started
+    all_latencies = [latency for client in latencies for latency in client]
+
+    return {
+        "url": url,
+        "requests": requests,
+        "concurrency": concurrency,
+        "batch": batch,
+        "errors": len(errors),
+        "seconds": round(seconds, 3),
+        "requests_per_second": round(len(all_latencies) / seconds, 1),
+        "dates_per_second": round(len(all_latencies) * batch / seconds, 1),
+        "p50_ms": round(_percentile(all_latencies, 50) * 1000, 3),
+        "p90_ms": round(_percentile(all_latencies, 90) * 1000, 3),
+        "p99_ms": round(_percentile(all_latencies, 99) * 1000, 3),
+        "max_ms": round(max(all_latencies, default = 0.0) * 1000, 3),
+    }
+
+
+def main(argv = None) -> int:
+    parser = argparse.ArgumentParser(prog = "python -m mm_calendar.benchmarks.load_test", description = "Load test the mm_calendar HTTP service.")
+    parser.add_argument("--url", help = "server to test (default: start one in-process on a free localhost port)")
+    parser.add_argument("--requests", "-n", type = int, default = 2000)
+    parser.add_argument("--concurrency", "-c", type = int, default = 8, help = "keep-alive client connections")
+    parser.add_argument("--batch", "-b", type = int, default = 1, help = "dates per request (1 uses GET, more uses a POST batch)")
+    parser.add_argument("--fields", help = "comma separated fields (default: the server's default columns)")
+    parser.add_argument("--years", type = int, nargs = 2, default = (1900, 2100), metavar = ("FIRST", "LAST"), help = "western year range for random dates")
+    parser.add_argument("--seed", type = int, default = 0)
+    args = parser.parse_args(argv)
+
+    if args.requests < 1 or args.concurrency < 1 or args.batch < 1:
+        parser.error("--requests, --concurrency and --batch must be positive")
+
+    server = None
+    url = args.url
+    if url is None:
+        from ..server import make_server
+
+        server = make_server("127.0.0.1", 0)
+        threading.Thread(target = server.serve_forever, daemon = True).start()
+        url = "http://%s:%d" % server.server_address
+
+    try:
+        result = run(url, args.requests, args.concurrency, args.batch, args.fields, args.years[0], args.years[1], args.seed)
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    json.dump(result, sys.stdout, indent = 2)
+    print()
+
+    return 1 if result["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
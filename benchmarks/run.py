@@ -0,0 +1,133 @@
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from timeit import Timer
+from typing import List, Optional
+
+from .cases import BOUNDARY_YEARS, CASES, Case, clear_caches
+
+# python -m mm_calendar.benchmarks.run [--output results.json] [--compare baseline.json] [--filter name]
+# network မလိုဘဲ ဒီ package တစ်ခုတည်းနဲ့ run လို့ရပါတယ်။
+# ရလဒ်ကို benchmark[နှစ်] အလိုက် ခေါ်မှု တစ်ကြိမ်စာ microsecond (best/median) နဲ့ JSON အဖြစ် သိမ်းပါတယ်။
+
+
+def _time_warm(fn, repeat: int, min_time: float) -> List[float]:
+    timer = Timer(fn)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+
+        number *= 2 if elapsed * 10 > min_time else 10
+
+    return [elapsed / number for elapsed in timer.repeat(repeat, number)]
+
+
+# cold benchmark တွေမှာ cache ရှင်းတဲ့ အချိန်ကို မပါအောင် ခေါ်မှု တစ်ကြိမ်ချင်းစီကို တိုင်းပါတယ်။
+def _time_cold(fn, repeat: int, min_time: float) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        total = 0.0
+        number = 0
+        while total < min_time:
+            clear_caches()
+            start = time.perf_counter()
+            fn()
+            total += time.perf_counter() - start
+            number += 1
+
+        timings.append(total / number)
+
+    return timings
+
+
+def run_case(case: Case, year: int, repeat: int, min_time: float) -> dict:
+    clear_caches()
+    fn = case.make(year)
+    fn() # warm up
+
+    timings = (_time_cold if case.cold else _time_warm)(fn, repeat, min_time)
+
+    return {
+        "best_us": round(min(timings) * 1e6, 4),
+        "median_us": round(statistics.median(timings) * 1e6, 4),
+        "repeat": repeat,
+    }
+
+
+def run(filter: Optional[str] = None, repeat: int = 5, min_time: float = 0.05, years = BOUNDARY_YEARS, verbose: bool = True) -> dict:
+    results = {}
+    for case in CASES:
+        if filter and filter not in case.name:
+            continue
+
+        for year in years:
+            key = case.key(year)
+            results[key] = run_case(case, year, repeat, min_time)
+
+            if verbose:
+                print(f"{key:<32} {results[key]['best_us']:>12.3f} us", file = sys.stderr)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec = "seconds"),
+            "repeat": repeat,
+            "min_time": min_time,
+        },
+        "results": results,
+    }
+
+
+# ratio က (ယခု / baseline) ဖြစ်ပြီး ၁ ထက်ငယ်ရင် မြန်လာတာ ဖြစ်ပါတယ်။
+def compare(current: dict, baseline: dict) -> List[tuple]:
+    rows = []
+    for key, result in current["results"].items():
+        base = baseline["results"].get(key)
+        if base is None:
+            continue
+
+        rows.append((key, base["best_us"], result["best_us"], result["best_us"] / base["best_us"]))
+
+    return rows
+
+
+def main(argv = None) -> int:
+    parser = argparse.ArgumentParser(prog = "python -m mm_calendar.benchmarks.run", description = "Run mm_calendar benchmarks.")
+    parser.add_argument("--output", "-o", help = "write results as JSON to this file")
+    parser.add_argument("--compare", "-c", help = "compare with a previous JSON result file")
+    parser.add_argument("--filter", "-k", help = "only run benchmarks whose name contains this text")
+    parser.add_argument("--repeat", type = int, default = 5)
+    parser.add_argument("--min-time", type = float, default = 0.05, help = "seconds per timing run")
+    parser.add_argument("--years", type = int, nargs = "+", default = list(BOUNDARY_YEARS), help = "Myanmar years to run each benchmark at")
+    args = parser.parse_args(argv)
+
+    current = run(args.filter, args.repeat, args.min_time, args.years)
+
+    if args.output:
+        with open(args.output, "w", encoding = "utf-8") as file:
+            json.dump(current, file, indent = 2, sort_keys = True)
+
+    if args.compare:
+        with open(args.compare, encoding = "utf-8") as file:
+            baseline = json.load(file)
+
+        print(f"{'benchmark':<32} {'baseline':>12} {'current':>12} {'ratio':>8}")
+        for key, base_us, current_us, ratio in compare(current, baseline):
+            print(f"{key:<32} {base_us:>12.3f} {current_us:>12.3f} {ratio:>8.2f}")
+    elif not args.output:
+        json.dump(current, sys.stdout, indent = 2, sort_keys = True)
+        print()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
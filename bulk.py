@@ -0,0 +1,101 @@
+try:
+    import numpy as np
+except ImportError as error: # pragma: no cover - numpy is optional
+    raise ImportError("mm_calendar.bulk requires NumPy, install it with `pip install numpy`") from error
+
+from .constants import SOLAR_YEAR, START_OF_GREGORIAN_JDN, ZERO_YEAR_JDN
+from .enums.year_type import YearType
+from .year_info import YearInfoCache
+
+UNIX_EPOCH_JDN = 2440588 # 1970/Jan/01 in JDN
+
+
+# C/Java ရဲ့ (int) (a / b) လိုပဲ သုည ဘက်ကို ဖြတ်ပါတယ်။ MMDate ရဲ့ ပုံသေနည်းတွေနဲ့ bit တိုင်း တူအောင် float စားခြင်းကိုပဲ သုံးပါတယ်။
+def _trunc_div(a, b):
+    return np.trunc(a / b).astype(np.int64)
+
+
+# datetime64[D] ရဲ့ နှစ်၊ လ၊ ရက် ကို MMDate._get_julian_day (British) နည်းအတိုင်း JDN ပြောင်းပါတယ်။
+# 1752/Sep/14 မတိုင်ခင် ရက်တွေကို ဂျူလီယန် ပြက္ခဒိန်ရက်အဖြစ် ယူပါတယ်။
+def datetime64_to_jdn(dates) -> np.ndarray:
+    dates = np.asarray(dates, dtype = "datetime64[D]")
+    years = dates.astype("datetime64[Y]").astype(np.int64) + 1970
+    months = dates.astype("datetime64[M]").astype(np.int64) % 12 + 1
+    days = (dates - dates.astype("datetime64[M]")).astype(np.int64) + 1
+
+    a = _trunc_div(14 - months, 12)
+    years = years + 4800 - a
+    months = months + 12 * a - 3
+    julian_day = days + _trunc_div(153 * months + 2, 5) + 365 * years + _trunc_div(years, 4)
+
+    gregorian_jdn = julian_day - _trunc_div(years, 100) + _trunc_div(years, 400) - 32045
+    julian_jdn = np.minimum(julian_day - 32083, START_OF_GREGORIAN_JDN)
+
+    return np.where(gregorian_jdn < START_OF_GREGORIAN_JDN, julian_jdn, gregorian_jdn)
+
+
+def _to_jdn_array(values) -> np.ndarray:
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.datetime64):
+        return datetime64_to_jdn(values)
+
+    if not np.issubdtype(values.dtype, np.integer):
+        raise TypeError(f"expected integer JDNs or datetime64[D] values, got {values.dtype}")
+
+    return values.astype(np.int64)
+
+
+# ဂျူလီယန်ရက် (ဒါမှမဟုတ် datetime64[D]) array တစ်ခုလုံးကို မြန်မာ ရက်စွဲ column တွေအဖြစ် တစ်ခါတည်း ပြောင်းပါတယ်။
+# MMDate ရဲ့ _get_year၊ _get_month၊ _get_actual_month၊ _get_day နဲ့ _get_moon_phase ပုံသေနည်းတွေကို array နဲ့ တွက်ထားတာ ဖြစ်ပြီး
+# နှစ်အလိုက် တန်ဖိုးတွေကိုတော့ ထူးခြားတဲ့ နှစ်တစ်နှစ်ကို တစ်ကြိမ်ပဲ YearInfoCache ကနေ ယူပါတယ်။
+# ပြန်ပေးတဲ့ dict ရဲ့ key တွေက jdn, year, month (MyanmarMonth value), day, fornight_day, moon_phase (MoonPhase value),
+# week_day (MMWeekDay value), year_type (YearType value), month_length ဖြစ်ပြီး အားလုံး int64 array တွေ ဖြစ်ပါတယ်။
+def convert_jdns(values) -> dict:
+    jdn = _to_jdn_array(values)
+
+    year = _trunc_div(jdn - ZERO_YEAR_JDN - 0.5, SOLAR_YEAR)
+
+    unique_years, year_index = np.unique(year, return_inverse = True)
+    year_infos = [YearInfoCache.get(int(unique_year)) for unique_year in unique_years]
+    year_type = np.array([info.year_type.value for info in year_infos], dtype = np.int64)[year_index]
+    year_length = np.array([info.year_length for info in year_infos], dtype = np.int64)[year_index]
+    first_day_of_tagu = np.array([info.first_day_of_tagu for info in year_infos], dtype = np.int64)[year_index]
+
+    is_common = year_type == YearType.Common.value
+    is_big_watat = year_type == YearType.BigWatat.value
+
+    total_days = jdn - first_day_of_tagu + 1
+    is_late_tagu = total_days > year_length
+    days_from_new_year = total_days - year_length * is_late_tagu
+
+    day_threshold = _trunc_div(days_from_new_year + 423, 512)
+    adjusted_days = days_from_new_year - day_threshold * is_big_watat + day_threshold * 30 * is_common
+    month = _trunc_div(adjusted_days + 29.26, 29.544)
+
+    e = _trunc_div(month + 12, 16)
+    f = _trunc_div(month + 11, 16)
+
+    day = days_from_new_year - np.trunc(29.544 * month - 29.26).astype(np.int64)
+    day -= e * is_big_watat
+    day += f * 30 * is_common
+
+    actual_month = month + f * 3 - e * 4 + 12 * is_late_tagu
+
+    month_length = 30 - actual_month % 2
+    month_length += (actual_month == 3) & is_big_watat
+
+    moon_phase = _trunc_div(day + 1, 16) + _trunc_div(day, 16) + _trunc_div(day, month_length)
+    fornight_day = day - 15 * _trunc_div(day, 16)
+    week_day = (jdn + 2) % 7
+
+    return {
+        "jdn": jdn,
+        "year": year,
+        "month": actual_month,
+        "day": day,
+        "fornight_day": fornight_day,
+        "moon_phase": moon_phase,
+        "week_day": week_day,
+        "year_type": year_type,
+        "month_length": month_length,
+    }
@@ -0,0 +1,60 @@
+from collections import OrderedDict
+from threading import Lock
+from collections.abc import Callable, Hashable
+
+
+# process တစ်ခုလုံးမှာ မျှသုံးဖို့ အရွယ်အစား ကန့်သတ်ထားတဲ့ LRU cache ဖြစ်ပါတယ်။
+# hit/miss အရေအတွက်ကို cache_info နဲ့ ကြည့်နိုင်ပါတယ်။
+class LRUCache:
+    def __init__(self, max_size: int) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be a positive integer")
+
+        self.max_size = max_size
+        self._items: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable, builder: "Callable[[Hashable], object]") -> object:
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._hits += 1
+                self._items.move_to_end(key)
+                return value
+
+            self._misses += 1
+
+        # builder ကို lock အပြင်မှာ ခေါ်တာမို့ builder ထဲကနေ တခြား cache တွေကို ခေါ်လို့ရပါတယ်။
+        value = builder(key)
+        self.put(key, value)
+
+        return value
+
+    def put(self, key: Hashable, value: object) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+
+            while len(self._items) > self.max_size:
+                self._items.popitem(last = False)
+
+    def set_max_size(self, max_size: int) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be a positive integer")
+
+        with self._lock:
+            self.max_size = max_size
+            while len(self._items) > max_size:
+                self._items.popitem(last = False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def cache_info(self) -> dict:
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses, "size": len(self._items), "max_size": self.max_size}
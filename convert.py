@@ -0,0 +1,232 @@
+import csv
+import json
+import os
+import time
+from collections import deque
+from datetime import date
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from .date_format import compile_format
+from .mm_date import MMDate
+
+# python -m mm_calendar convert နဲ့ ခရစ်နှစ် ရက်စွဲ (YYYY-MM-DD) တွေကို chunk လိုက် ဖတ်ပြီး မြန်မာ ရက်စွဲ column တွေ ထည့်ပေးပါတယ်။
+# chunk တွေကို process pool ထဲ ပို့ပြီး ပို့ထားတဲ့ chunk အရေအတွက်ကို ကန့်သတ်ထားတာမို့ input ဘယ်လောက်ကြီးကြီး memory မတက်ပါဘူး။
+# ရလဒ်တွေကို ပို့ခဲ့တဲ့ အစဉ်အတိုင်း ပြန်ရေးပါတယ်။
+
+DEFAULT_COLUMNS = ("year", "month", "day", "moon_phase", "fornight_day", "holidays")
+
+COLUMNS = {
+    "jdn": lambda mm_date: mm_date.jdn,
+    "year": lambda mm_date: mm_date.year,
+    "sasana_year": lambda mm_date: mm_date.sasana_year,
+    "year_type": lambda mm_date: mm_date.year_type.name,
+    "month": lambda mm_date: mm_date.month.name,
+    "day": lambda mm_date: mm_date.day,
+    "month_length": lambda mm_date: mm_date.month_length,
+    "moon_phase": lambda mm_date: mm_date.moon_phase.name,
+    "fornight_day": lambda mm_date: mm_date.fornight_day,
+    "week_day": lambda mm_date: mm_date.week_day.name,
+    "holidays": lambda mm_date: [holiday.name for holiday in mm_date.get_holidays()],
+    "astro": lambda mm_date: [flag.name for flag in type(mm_date.astro_flags) if flag and flag in mm_date.astro_flags],
+    "date_str": lambda mm_date: mm_date.get_date_str(),
+}
+
+
+# column နာမည် ဒါမှမဟုတ် get_date_str format (& ပါတာ) ကို တန်ဖိုးထုတ်တဲ့ function အဖြစ် ပြောင်းပါတယ်။
+def _column_getter(column: str) -> Callable[[MMDate], object]:
+    if column in COLUMNS:
+        return COLUMNS[column]
+
+    if "&" in column:
+        return compile_format(column).render
+
+    raise ValueError(f"unknown column: {column!r} (use one of {', '.join(COLUMNS)} or a get_date_str format)")
+
+
+@lru_cache(maxsize = 16)
+def _column_getters(columns: Tuple[str, ...]) -> Tuple[Callable[[MMDate], object], ...]:
+    return tuple(_column_getter(column) for column in columns)
+
+
+# worker process ထဲမှာ run မယ့် function ဖြစ်ပါတယ်။ ရက်စွဲ မမှန်ရင် None ပြန်ပေးပါတယ်။
+# export တွေမှာ ရက်စွဲ ထပ်နေတာ များလို့ chunk တစ်ခုအတွင်း တွက်ပြီးသား ရက်စွဲကို ပြန်သုံးပါတယ်။
+def convert_chunk(values: Sequence[str], columns: Tuple[str, ...]) -> List[Optional[tuple]]:
+    getters = _column_getters(columns)
+    converted = {}
+    result = []
+    for value in values:
+        row = converted.get(value, False)
+        if row is False:
+            try:
+                mm_date = MMDate(date.fromisoformat(value.strip()))
+                row = tuple(getter(mm_date) for getter in getters)
+            except (ValueError, TypeError, AttributeError, OverflowError):
+                row = None
+
+            converted[value] = row
+
+        result.append(row)
+
+    return result
+
+
+class _CsvFormat:
+    def __init__(self, date_column: str, columns: Tuple[str, ...]) -> None:
+        self.date_column = date_column
+        self.columns = columns
+        self.header = None
+        self.date_index = None
+
+    def read(self, file: TextIO) -> Iterator[list]:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            return
+
+        if self.date_column in header:
+            self.date_index = header.index(self.date_column)
+        elif self.date_column.isdigit() and int(self.date_column) < len(header):
+            self.date_index = int(self.date_column)
+        else:
+            raise ValueError(f"date column {self.date_column!r} not found in CSV header")
+
+        self.header = header + list(self.columns)
+        yield from reader
+
+    def get_date(self, record: list) -> str:
+        return record[self.date_index] if self.date_index < len(record) else ""
+
+    def start(self, output: TextIO, header: bool = True):
+        writer = csv.writer(output, lineterminator = "\n")
+        if header and self.header is not None:
+            writer.writerow(self.header)
+
+        return writer
+
+    def write(self, writer, record: list, row: Optional[tuple]) -> None:
+        if row is None:
+            writer.writerow(record + [""] * len(self.columns))
+        else:
+            writer.writerow(record + [";".join(value) if isinstance(value, list) else value for value in row])
+
+
+class _JsonLinesFormat:
+    def __init__(self, date_column: str, columns: Tuple[str, ...]) -> None:
+        self.date_column = date_column
+        self.columns = columns
+
+    # JSON မမှန်တဲ့ စာကြောင်းကို စာသားအတိုင်း record အဖြစ် ပေးပြီး မမှန်တဲ့ row အဖြစ် ရေတွက်ပါတယ်။
+    def read(self, file: TextIO) -> Iterator[object]:
+        for line in file:
+            if line.strip():
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    yield line.rstrip("\r\n")
+
+    def get_date(self, record: object) -> str:
+        value = record.get(self.date_column) if isinstance(record, dict) else None
+        return value if isinstance(value, str) else ""
+
+    def start(self, output: TextIO, header: bool = True):
+        return output
+
+    # object မဟုတ်တဲ့ record (list၊ string၊ JSON မမှန်တဲ့ စာကြောင်း) ကို {"record": ...} ထဲ ထည့်ပြီး column တွေကို null နဲ့ ရေးပါတယ်။
+    def write(self, output: TextIO, record: object, row: Optional[tuple]) -> None:
+        if not isinstance(record, dict):
+            record = {"record": record}
+
+        record.update(zip(self.columns, row if row is not None else [None] * len(self.columns)))
+        output.write(json.dumps(record, ensure_ascii = False))
+        output.write("\n")
+
+
+FORMATS = {"csv": _CsvFormat, "jsonl": _JsonLinesFormat}
+
+
+def _chunks(records: Iterable, chunk_size: int) -> Iterator[list]:
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+
+        yield chunk
+
+
+class ConvertStats:
+    __slots__ = ('rows', 'errors', 'seconds')
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.errors = 0
+        self.seconds = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def __repr__(self) -> str:
+        return f"ConvertStats(rows={self.rows}, errors={self.errors}, seconds={self.seconds:.3f})"
+
+
+# workers က 1 ဆိုရင် process pool မသုံးဘဲ လက်ရှိ process ထဲမှာပဲ တွက်ပါတယ်။
+# header က CSV header ရေးမရေး (ဖိုင်အများကြီးကို တစ်ဖိုင်တည်းထဲ ရေးရင် ပထမဖိုင်မှာပဲ ရေးပါတယ်)
+# max_pending က တစ်ပြိုင်နက် ပို့ထားနိုင်တဲ့ chunk အရေအတွက် ဖြစ်ပြီး (မပေးရင် workers x 2) memory ကို ကန့်သတ်ပါတယ်။
+def convert_stream(input: TextIO, output: TextIO, file_format: str = "csv", date_column: str = "date",
+                   columns: Sequence[str] = DEFAULT_COLUMNS, chunk_size: int = 10000, workers: Optional[int] = None,
+                   max_pending: Optional[int] = None, stats: Optional[ConvertStats] = None, header: bool = True) -> ConvertStats:
+    columns = tuple(columns)
+    _column_getters(columns) # column နာမည် မှားရင် ဖတ်မစခင် error ပြပါတယ်။
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+
+    stats = ConvertStats() if stats is None else stats
+    handler = FORMATS[file_format](date_column, columns)
+    started = time.perf_counter()
+
+    # CSV header ကို ပထမ chunk ဖတ်ပြီးမှ သိရတာမို့ ပထမ chunk ကို အရင်ဖတ်ပါတယ်။
+    chunks = _chunks(handler.read(input), chunk_size)
+    first_chunk = next(chunks, None)
+    writer = handler.start(output, header)
+
+    def write_chunk(chunk: list, rows: List[Optional[tuple]]) -> None:
+        for record, row in zip(chunk, rows):
+            handler.write(writer, record, row)
+
+        stats.rows += len(rows)
+        stats.errors += rows.count(None)
+
+    if first_chunk is not None:
+        chunks = chain([first_chunk], chunks)
+
+        if workers == 1:
+            for chunk in chunks:
+                write_chunk(chunk, convert_chunk([handler.get_date(record) for record in chunk], columns))
+        else:
+            # process pool (multiprocessing) ကို import လုပ်တာ ကြာလို့ လိုမှပဲ import လုပ်ပါတယ်။
+            from concurrent.futures import ProcessPoolExecutor
+
+            workers = workers or os.cpu_count() or 1
+            max_pending = max_pending or workers * 2
+            pending = deque()
+
+            with ProcessPoolExecutor(max_workers = workers) as executor:
+                for chunk in chunks:
+                    if len(pending) >= max_pending:
+                        done_chunk, future = pending.popleft()
+                        write_chunk(done_chunk, future.result())
+
+                    dates = [handler.get_date(record) for record in chunk]
+                    pending.append((chunk, executor.submit(convert_chunk, dates, columns)))
+
+                while pending:
+                    done_chunk, future = pending.popleft()
+                    write_chunk(done_chunk, future.result())
+
+    stats.seconds += time.perf_counter() - started
+
+    return stats
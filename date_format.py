@@ -0,0 +1,94 @@
+import re
+from functools import lru_cache
+from typing import Iterable, List
+
+from .enums.myanmar_month import MyanmarMonth
+from .enums.year_type import YearType
+from .translations import DIGITS_MAPPING, DIRECTION_MAPPING, MONTH_MAPPING, MOON_PHASE_MAPPING, WEEK_DAY_MAPPING
+
+_DIGITS_TABLE = str.maketrans(dict(DIGITS_MAPPING))
+
+
+def num_to_mm_digits(number: int) -> str:
+    return str(number).translate(_DIGITS_TABLE)
+
+
+def pad_number(number: int, padding: int = 2) -> str:
+    output_str = ("၀" * padding) + num_to_mm_digits(number)
+    start_index = len(output_str) - padding
+
+    return output_str[start_index:]
+
+
+def _month_name(mm_date) -> str:
+    month_str = MONTH_MAPPING[mm_date.month.value]
+    if mm_date.month == MyanmarMonth.Waso and (not mm_date.year_type == YearType.Common):
+        # ဝါထပ်
+        month_str = "ဒု-" + month_str
+
+    return month_str
+
+
+# format token တစ်ခုချင်းစီအတွက် တန်ဖိုး ထုတ်ပေးမယ့် function တွေ ဖြစ်ပါတယ်။
+# get_date_str က re.sub တွေကို အစဉ်လိုက် ခေါ်ခဲ့တဲ့ အစီအစဉ်အတိုင်း (ရှည်တဲ့ token ကို အရင်) စီထားပါတယ်။
+TOKENS = (
+    ("&yyyy", lambda mm_date: pad_number(mm_date.year, 4)),
+    ("&YYYY", lambda mm_date: pad_number(mm_date.sasana_year, 4)),
+    ("&y", lambda mm_date: num_to_mm_digits(mm_date.year)),
+    ("&mm", lambda mm_date: pad_number(mm_date.month.value, 2)),
+    ("&M", _month_name),
+    ("&m", lambda mm_date: num_to_mm_digits(mm_date.month.value)),
+    ("&P", lambda mm_date: MOON_PHASE_MAPPING[mm_date.moon_phase.value]),
+    ("&dd", lambda mm_date: pad_number(mm_date.day, 2)),
+    ("&d", lambda mm_date: num_to_mm_digits(mm_date.day)),
+    ("&ff", lambda mm_date: pad_number(mm_date.fornight_day, 2)),
+    ("&f", lambda mm_date: num_to_mm_digits(mm_date.fornight_day)),
+    ("&W", lambda mm_date: WEEK_DAY_MAPPING[mm_date.week_day.value]),
+    ("&w", lambda mm_date: num_to_mm_digits(mm_date.week_day.value)),
+    ("&A", lambda mm_date: mm_date._get_astro_days()),
+    ("&D", lambda mm_date: DIRECTION_MAPPING[mm_date.get_dragon_head_direction().value]),
+)
+
+_TOKEN_PATTERN = re.compile("|".join(re.escape(token) for token, _ in TOKENS))
+_TOKEN_FUNCTIONS = dict(TOKENS)
+
+
+# format string ကို (စာသား ဒါမှမဟုတ် token function) အပိုင်းတွေအဖြစ် တစ်ကြိမ်ပဲ ခွဲပြီး cache လုပ်ထားပါတယ်။
+# ဒါကြောင့် format ထဲမှာ ပါတဲ့ token တွေကိုပဲ တွက်ပါတယ်။
+class CompiledFormat:
+    __slots__ = ('format', 'parts', 'tokens')
+
+    def __init__(self, format: str) -> None:
+        self.format = format
+
+        parts = []
+        tokens = []
+        position = 0
+        for match in _TOKEN_PATTERN.finditer(format):
+            if match.start() > position:
+                parts.append(format[position:match.start()])
+
+            parts.append(_TOKEN_FUNCTIONS[match.group()])
+            tokens.append(match.group())
+            position = match.end()
+
+        if position < len(format):
+            parts.append(format[position:])
+
+        self.parts = tuple(parts)
+        self.tokens = tuple(tokens)
+
+    def render(self, mm_date) -> str:
+        return "".join([part if part.__class__ is str else part(mm_date) for part in self.parts])
+
+
+@lru_cache(maxsize = 256)
+def compile_format(format: str) -> CompiledFormat:
+    return CompiledFormat(format)
+
+
+# ရက်စွဲ အများကြီးကို format တစ်ခုတည်းနဲ့ ပြောင်းတဲ့အခါ compile လုပ်ထားတဲ့ format ကို ပြန်သုံးပါတယ်။
+def format_many(dates: Iterable, format: str = "&y &M &P &f") -> List[str]:
+    render = compile_format(format).render
+
+    return [render(mm_date) for mm_date in dates]
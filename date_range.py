@@ -0,0 +1,82 @@
+from datetime import date
+
+from .enums.moon_phase import MoonPhase
+from .julian_day import jdn_to_date
+from .enums.mm_week_day import MMWeekDay
+from .enums.myanmar_month import MyanmarMonth
+from .year_info import YearInfoCache, get_month_and_day, get_year_from_jdn
+
+_MONTHS = tuple(MyanmarMonth)
+_MOON_PHASES = tuple(MoonPhase)
+_WEEK_DAYS = tuple(MMWeekDay)
+
+
+# MMDate.range က ထုတ်ပေးတဲ့ ရက်တစ်ရက်စာ ပေါ့ပါးတဲ့ မှတ်တမ်း ဖြစ်ပါတယ်။
+class DayRecord:
+    __slots__ = ('jdn', 'year', 'year_type', 'month', 'month_length', 'day', 'fornight_day', 'moon_phase', 'week_day')
+
+    def __init__(self, jdn, year, year_type, month, month_length, day, fornight_day, moon_phase, week_day) -> None:
+        self.jdn: int = jdn
+        self.year: int = year
+        self.year_type = year_type
+        self.month: MyanmarMonth = month
+        self.month_length: int = month_length
+        self.day: int = day
+        self.fornight_day: int = fornight_day
+        self.moon_phase: MoonPhase = moon_phase
+        self.week_day: MMWeekDay = week_day
+
+    @property
+    def en_date(self) -> date:
+        return jdn_to_date(self.jdn)
+
+    def __repr__(self) -> str:
+        return f"DayRecord(jdn={self.jdn}, year={self.year}, month={self.month.name}, day={self.day})"
+
+
+# start_jdn မှ end_jdn (မပါ) အထိ step ရက်ခြား တစ်ရက်ချင်းစီကို ထုတ်ပေးပါတယ်။
+# လတစ်လအတွင်းမှာ ရက်ကိုပဲ တိုးသွားပြီး လကူးတဲ့အခါမှ လ နဲ့ ရက်ကို ပြန်တွက်ပါတယ်။
+# နှစ်အလိုက် တန်ဖိုးတွေကိုတော့ မြန်မာနှစ်သစ် ကူးမှပဲ YearInfoCache ကနေ ပြန်ယူပါတယ်။
+# range() လိုပဲ step မှားရင် iterate မလုပ်ခင် ချက်ချင်း ValueError ဖြစ်အောင် generator ကို သီးသန့် ခွဲထားပါတယ်။
+def iter_days(start_jdn: int, end_jdn: int, step: int = 1):
+    if step <= 0:
+        raise ValueError("step must be a positive integer")
+
+    return _iter_days(int(start_jdn), int(end_jdn), step)
+
+
+def _iter_days(start_jdn: int, end_jdn: int, step: int):
+    year = None
+    next_new_year_day = None
+    month = None
+    month_end_jdn = None
+    week_day = (start_jdn + 2) % 7
+    week_day_step = step % 7
+
+    jdn = start_jdn
+    while jdn < end_jdn:
+        if year is None or jdn >= next_new_year_day:
+            year = get_year_from_jdn(jdn)
+            year_info = YearInfoCache.get(year)
+            year_type = year_info.year_type
+            next_new_year_day = YearInfoCache.get(year + 1).new_year_day
+            month = None
+
+        if month is None or jdn > month_end_jdn:
+            month, day, month_length = get_month_and_day(year_info, jdn)
+            month_enum = _MONTHS[month]
+            month_end_jdn = jdn + month_length - day
+
+            # နှစ်ဆန်းတစ်ရက်က တန်ခူးလဆန်း ၁ ရက် မတိုင်ခင် ကျတဲ့နှစ်မှာ တန်ခူးလဆန်း ၁ ရက်ကနေ လ ပြန်စပါတယ်။
+            if jdn < year_info.first_day_of_tagu:
+                month_end_jdn = min(month_end_jdn, year_info.first_day_of_tagu - 1)
+        else:
+            day = month_length - (month_end_jdn - jdn)
+
+        moon_phase = (int) ((day + 1) / 16) + (int) (day / 16) + (int) (day / month_length)
+        fornight_day = day - 15 * ((int) (day / 16))
+
+        yield DayRecord(jdn, year, year_type, month_enum, month_length, day, fornight_day, _MOON_PHASES[moon_phase], _WEEK_DAYS[week_day])
+
+        jdn += step
+        week_day = (week_day + week_day_step) % 7
@@ -0,0 +1,274 @@
+import hashlib
+import json
+import mmap
+import struct
+from datetime import date
+from types import MappingProxyType
+from typing import List, Tuple
+
+from . import constants
+from .astro import get_astro_flags
+from .date_range import iter_days
+from .enums.astro_flags import AstroFlags
+from .enums.holiday import Holiday
+from .enums.mm_week_day import MMWeekDay
+from .enums.moon_phase import MoonPhase
+from .enums.myanmar_month import MyanmarMonth
+from .enums.year_type import YearType
+from .holidays import SUBSTITUTE_HOLIDAYS, WESTERN_CALENDAR_HOLIDAYS, get_mm_calendar_holiday, get_substitute_holiday, get_thingyan_holiday, get_western_calendar_holiday
+from .julian_day import date_to_jdn, jdn_to_date, jdn_to_ymd
+from .mm_date import MMDate
+from .watat_strategy.watat_strategy_factory import WatatStrategyFactory
+from .year_info import iter_year_info
+
+# ဂျူလီယန်ရက် တစ်ရက်ကို record တစ်ခုနှုန်း ပုံသေအရွယ် binary ဇယားအဖြစ် ကြိုတွက်ပြီး ဖိုင်ထဲ သိမ်းပါတယ်။
+# ဖတ်တဲ့အခါ mmap နဲ့ ဖွင့်ပြီး (ဂျူလီယန်ရက် - start_jdn) x record အရွယ် offset ကနေ struct တစ်ခါတည်း ဖြည်ပါတယ်။
+#
+# ဖိုင်ပုံစံ
+#   header  : magic, format version, record အရွယ်, start_jdn, record အရေအတွက်, holiday ဇယား အရွယ်, parameter hash (sha256)
+#   holiday ဇယား : ရုံးပိတ်ရက် tuple တွေရဲ့ JSON list (record ထဲမှာ ဒီ list ရဲ့ index ကို holiday code အဖြစ် သိမ်းပါတယ်)
+#   record  : year(H) month(B) day(B) month_length(B) moon_phase|year_type<<2 (B) astro_flags(H) holiday code(H)
+
+MAGIC = b"MMDT"
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct("<4sHHqII32s")
+RECORD = struct.Struct("<HBBBBHH")
+
+_MONTHS = tuple(MyanmarMonth)
+_MOON_PHASES = tuple(MoonPhase)
+_YEAR_TYPES = tuple(YearType)
+_WEEK_DAYS = tuple(MMWeekDay)
+
+
+def _parameter_value(value):
+    if isinstance(value, (dict, MappingProxyType)):
+        return sorted(value.items())
+
+    if isinstance(value, (frozenset, set)):
+        return sorted(value)
+
+    if isinstance(value, (tuple, list)):
+        return [_parameter_value(item) for item in value]
+
+    return value
+
+
+def _strategy_parameters(strategy_type) -> list:
+    parameters = {}
+    for owner in reversed(strategy_type.__mro__):
+        for name, value in vars(owner).items():
+            if name.startswith("_") or callable(value) or isinstance(value, (property, classmethod, staticmethod)):
+                continue
+
+            parameters[name] = _parameter_value(value)
+
+    return [strategy_type.__name__, sorted(parameters.items())]
+
+
+# ဝါထပ် strategy တွေရဲ့ ကိန်းသေနဲ့ ခြွင်းချက်တွေ၊ ခေတ်နယ်နိမိတ်တွေ၊ ပြက္ခဒိန် ကိန်းသေတွေ၊ ရုံးပိတ်ရက် ဇယားတွေကို hash လုပ်ပါတယ်။
+# တစ်ခုခု ပြောင်းရင် hash ပြောင်းသွားတာမို့ ဟောင်းနေတဲ့ ဇယားကို ဖွင့်ခွင့်မပြုပါဘူး။
+def parameters_digest(max_year: int = 2000) -> bytes:
+    eras = []
+    strategy_types = []
+    for year in range(0, max_year + 1):
+        strategy_type = type(WatatStrategyFactory._create_strategy(year))
+        if not strategy_types or strategy_types[-1] is not strategy_type:
+            strategy_types.append(strategy_type)
+            eras.append((year, strategy_type.__name__))
+
+    parameters = {
+        "format_version": FORMAT_VERSION,
+        "constants": sorted((name, value) for name, value in vars(constants).items() if name.isupper()),
+        "eras": eras,
+        "strategies": [_strategy_parameters(strategy_type) for strategy_type in strategy_types],
+        "western_calendar_holidays": [(start, end, month, day, holiday.name) for start, end, month, day, holiday in WESTERN_CALENDAR_HOLIDAYS],
+        "substitute_holidays": sorted(SUBSTITUTE_HOLIDAYS),
+    }
+
+    return hashlib.sha256(json.dumps(parameters, sort_keys = True, default = repr).encode("utf-8")).digest()
+
+
+# start_year မှ end_year (အပါ) အထိ မြန်မာနှစ်တွေရဲ့ ရက်တိုင်းကို ဇယားအဖြစ် ရေးပါတယ်။
+def write_day_table(path: str, start_year: int = 1, end_year: int = 1500) -> int:
+    if end_year < start_year:
+        raise ValueError("end_year must not be less than start_year")
+
+    # နှစ်အလိုက် တန်ဖိုးတွေကို တစ်ကြိမ်တည်း ဖြတ်တွက်ပြီး YearInfoCache ထဲ ကြိုထည့်ထားပါတယ်။
+    year_infos = list(iter_year_info(start_year, end_year + 1))
+    start_jdn = year_infos[0].new_year_day
+    end_jdn = year_infos[-1].new_year_day
+
+    holiday_codes = {(): 0}
+    records = bytearray()
+    for record in iter_days(start_jdn, end_jdn):
+        jdn = record.jdn
+        month = record.month
+        en_year, en_month, en_day = jdn_to_ymd(jdn)
+
+        # MMDate.get_holidays နဲ့ အစီအစဉ် တူအောင် သင်္ကြန်၊ ခရစ်နှစ်၊ မြန်မာ ပြက္ခဒိန်၊ အစားထိုး ရုံးပိတ်ရက် အစဉ်အတိုင်း စုပါတယ်။
+        day_holidays = (
+            get_thingyan_holiday(jdn, record.year, month),
+            get_western_calendar_holiday(en_year, en_month, en_day),
+            get_mm_calendar_holiday(record.year, month, record.day, record.moon_phase),
+            get_substitute_holiday(jdn, en_year),
+        )
+        day_holidays = tuple(holiday.name for holiday in day_holidays if not holiday == Holiday.NoHoliday)
+        holiday_code = holiday_codes.setdefault(day_holidays, len(holiday_codes))
+
+        # မြန်မာနှစ် ၀ ခုနှစ်လို ပြက္ခဒိန် ပုံသေနည်းနဲ့ မတွက်နိုင်တဲ့ နှစ်တွေကို ဇယားထဲ မထည့်ပါဘူး။
+        if not 1 <= record.day <= record.month_length:
+            raise ValueError(f"Myanmar year {record.year} cannot be stored in a day table")
+
+        records += RECORD.pack(
+            record.year,
+            month.value,
+            record.day,
+            record.month_length,
+            record.moon_phase.value | record.year_type.value << 2,
+            get_astro_flags(month.value, record.week_day.value, record.day, record.month_length),
+            holiday_code,
+        )
+
+    holiday_table = json.dumps([list(holidays) for holidays in holiday_codes]).encode("utf-8")
+    count = end_jdn - start_jdn
+
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, FORMAT_VERSION, RECORD.size, start_jdn, count, len(holiday_table), parameters_digest()))
+        file.write(holiday_table)
+        file.write(records)
+
+    return count
+
+
+# ဇယားထဲက ရက်တစ်ရက်ဖြစ်ပြီး MMDate နဲ့ အတူတူ property နဲ့ method တွေကို သုံးလို့ရပါတယ်။
+class DayTableDate:
+    __slots__ = ('jdn', 'year', 'month', 'day', 'month_length', 'moon_phase', 'year_type', 'astro_flags', '_holidays')
+
+    def __init__(self, jdn: int, record: tuple, holidays: Tuple[Holiday, ...]) -> None:
+        year, month, day, month_length, packed, astro_flags, _ = record
+        self.jdn = jdn
+        self.year: int = year
+        self.month: MyanmarMonth = _MONTHS[month]
+        self.day: int = day
+        self.month_length: int = month_length
+        self.moon_phase: MoonPhase = _MOON_PHASES[packed & 3]
+        self.year_type: YearType = _YEAR_TYPES[packed >> 2]
+        self.astro_flags = AstroFlags(astro_flags)
+        self._holidays = holidays
+
+    @property
+    def en_date(self) -> date:
+        return jdn_to_date(self.jdn)
+
+    @property
+    def fornight_day(self) -> int:
+        return self.day - 15 * ((int) (self.day / 16))
+
+    @property
+    def week_day(self) -> MMWeekDay:
+        return _WEEK_DAYS[(self.jdn + 2) % 7]
+
+    def get_holidays(self) -> List[Holiday]:
+        return list(self._holidays)
+
+    # မြန်မာ field တွေပေါ်မှာပဲ မူတည်တဲ့ MMDate method တွေကို ပြန်သုံးပါတယ်။
+    sasana_year = MMDate.sasana_year
+    get_dragon_head_direction = MMDate.get_dragon_head_direction
+    get_mahabote = MMDate.get_mahabote
+    get_nakhat = MMDate.get_nakhat
+    get_date_str = MMDate.get_date_str
+    get_short_date_str = MMDate.get_short_date_str
+    digits_mapping = MMDate.digits_mapping
+    month_mapping = MMDate.month_mapping
+    moon_phase_mapping = MMDate.moon_phase_mapping
+    _get_astro_days = MMDate._get_astro_days
+    is_sabbath_eve = MMDate.is_sabbath_eve
+    is_sabbath = MMDate.is_sabbath
+    is_yatyaza = MMDate.is_yatyaza
+    is_pyathada = MMDate.is_pyathada
+    is_thama_nyo = MMDate.is_thama_nyo
+    is_thama_phyu = MMDate.is_thama_phyu
+    is_amyeittasote = MMDate.is_amyeittasote
+    is_warameittu_gyi = MMDate.is_warameittu_gyi
+    is_warameittu_nge = MMDate.is_warameittu_nge
+    is_yat_pote = MMDate.is_yat_pote
+    is_naga_por = MMDate.is_naga_por
+    is_yat_yotema = MMDate.is_yat_yotema
+    is_maha_yat_kyan = MMDate.is_maha_yat_kyan
+    is_shan_yat = MMDate.is_shan_yat
+
+    def __repr__(self) -> str:
+        return f"DayTableDate(jdn={self.jdn}, year={self.year}, month={self.month.name}, day={self.day})"
+
+
+class StaleDayTableError(ValueError):
+    pass
+
+
+class DayTable:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ)
+
+        try:
+            self._read_header()
+        except Exception:
+            self._mmap.close()
+            raise
+
+    def _read_header(self) -> None:
+        if len(self._mmap) < HEADER.size:
+            raise ValueError(f"{self.path} is not a day table")
+
+        magic, version, record_size, start_jdn, count, holiday_table_size, digest = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or record_size != RECORD.size:
+            raise ValueError(f"{self.path} is not a day table")
+
+        if version != FORMAT_VERSION or digest != parameters_digest():
+            raise StaleDayTableError(f"{self.path} was built with different calendar parameters; rebuild it with write_day_table")
+
+        holiday_table = json.loads(bytes(self._mmap[HEADER.size:HEADER.size + holiday_table_size]).decode("utf-8"))
+
+        self.start_jdn: int = start_jdn
+        self.end_jdn: int = start_jdn + count
+        self.holidays: Tuple[Tuple[Holiday, ...], ...] = tuple(tuple(Holiday[name] for name in names) for names in holiday_table)
+        self._records_offset = HEADER.size + holiday_table_size - start_jdn * RECORD.size
+
+        if len(self._mmap) < HEADER.size + holiday_table_size + count * RECORD.size:
+            raise ValueError(f"{self.path} is truncated")
+
+    def __len__(self) -> int:
+        return self.end_jdn - self.start_jdn
+
+    def __contains__(self, jdn: int) -> bool:
+        return self.start_jdn <= jdn < self.end_jdn
+
+    def get_record(self, jdn: int) -> tuple:
+        if not self.start_jdn <= jdn < self.end_jdn:
+            raise KeyError(jdn)
+
+        return RECORD.unpack_from(self._mmap, self._records_offset + jdn * RECORD.size)
+
+    def get(self, jdn: int) -> DayTableDate:
+        jdn = int(jdn)
+        record = self.get_record(jdn)
+
+        return DayTableDate(jdn, record, self.holidays[record[6]])
+
+    def get_date(self, en_date: date) -> DayTableDate:
+        return self.get(date_to_jdn(en_date.year, en_date.month, en_date.day))
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def __enter__(self) -> "DayTable":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def open_day_table(path: str) -> DayTable:
+    return DayTable(path)
@@ -0,0 +1,19 @@
+from enum import IntFlag
+
+
+class AstroFlags(IntFlag):
+    NoAstroDay = 0
+    SabbathEve = 1
+    Sabbath = 2
+    Yatyaza = 4
+    Pyathada = 8
+    ThamaNyo = 16
+    ThamaPhyu = 32
+    Amyeittasote = 64
+    WarameittuGyi = 128
+    WarameittuNge = 256
+    YatPote = 512
+    NagaPor = 1024
+    YatYotema = 2048
+    MahaYatKyan = 4096
+    ShanYat = 8192
\ No newline at end of file
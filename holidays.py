@@ -0,0 +1,216 @@
+from array import array
+from bisect import bisect_left
+from datetime import date
+from typing import List, Tuple
+
+from .cache import LRUCache
+from .constants import BEGINNING_OF_THINGYAN
+from .date_range import iter_days
+from .enums.holiday import Holiday
+from .enums.moon_phase import MoonPhase
+from .enums.myanmar_month import MyanmarMonth
+from .julian_day import date_to_jdn
+from .thingyan import ThingyanCache
+
+# (စနှစ်, ဆုံးနှစ်, လ, ရက်, ရုံးပိတ်ရက်) ခရစ်နှစ် ပြက္ခဒိန်အရ ရုံးပိတ်ရက်များ
+WESTERN_CALENDAR_HOLIDAYS = (
+    (2018, 2021, 1, 1, Holiday.NewYearDay),
+    (1948, None, 1, 4, Holiday.IndependenceDay),
+    (1947, None, 2, 12, Holiday.UnionDay),
+    (1958, None, 3, 2, Holiday.PeasantsDay),
+    (1945, None, 3, 27, Holiday.ResistanceDay),
+    (1923, None, 5, 1, Holiday.LabourDay),
+    (1947, None, 7, 19, Holiday.MartyrsDay),
+    (1752, None, 12, 25, Holiday.ChristmasDay),
+    (2017, 2017, 12, 30, Holiday.Normal),
+    (2017, 2021, 12, 31, Holiday.Normal),
+)
+
+SUBSTITUTE_HOLIDAYS = frozenset([
+    # 2019
+    2458768, 2458772, 2458785, 2458800,
+    # 2020
+    2458855, 2458918, 2458950, 2459051, 2459062,
+    2459152, 2459156, 2459167, 2459181, 2459184,
+    # 2021
+    2459300, 2459303, 2459323, 2459324,
+    2459335, 2459548, 2459573,
+])
+
+
+def get_thingyan_holiday(jdn: int, mm_year: int, month: MyanmarMonth) -> Holiday:
+    # နှောင်းတန်ခူး၊ နှောင်းကဆုန် ဆိုရင် နောက်နှစ်ရဲ့ သင်္ကြန်ဖြစ်ပါတယ်။
+    month_type = (int) (month.value / 13)
+    thingyan_year = mm_year + month_type
+
+    # သင်္ကြန် ရက်တွေကို နှစ်အလိုက် တစ်ကြိမ်ပဲ တွက်ပြီး ThingyanCache ထဲမှာ သိမ်းထားပါတယ်။
+    thingyan = ThingyanCache.get(thingyan_year)
+    thingyan_atat_day = thingyan.atat_day
+    thingyan_akya_day = thingyan.akya_day
+
+    if jdn == thingyan.new_year_day:
+        return Holiday.MyanmarNewYearDay
+
+    if thingyan_year < BEGINNING_OF_THINGYAN:
+        return Holiday.NoHoliday
+
+    if jdn == thingyan_atat_day:
+        return Holiday.ThingyanAtatDay
+
+    # အကျနေ့နဲ့ အတက်နေ့ကြားက နေ့တွေဟာ အကြတ်နေ့။
+    if jdn > thingyan_akya_day and jdn < thingyan_atat_day:
+        return Holiday.ThingyanAkyatDay
+
+    if jdn == thingyan_akya_day:
+        return Holiday.ThingyanAkyaDay
+
+    if jdn == thingyan.akyo_day:
+        return Holiday.ThingyanAkyoDay
+
+    if thingyan_year >= 1369 and thingyan_year < 1379 and (jdn == thingyan_akya_day - 2 or
+            (jdn >= thingyan_atat_day + 2 and jdn <= thingyan_akya_day + 7)):
+        return Holiday.ThingyanHoliday
+
+    if thingyan_year >= 1384 and thingyan_year <= 1385 and thingyan_akya_day - 5 <= jdn <= thingyan_akya_day - 2:
+        return Holiday.ThingyanHoliday
+
+    if thingyan_year >= 1386 and jdn >= thingyan_atat_day + 2 and jdn <= thingyan_akya_day + 7:
+        return Holiday.ThingyanHoliday
+
+    return Holiday.NoHoliday
+
+
+def get_western_calendar_holiday(en_year: int, en_month: int, en_day: int) -> Holiday:
+    for start_year, end_year, month, day, holiday in WESTERN_CALENDAR_HOLIDAYS:
+        if en_month == month and en_day == day and en_year >= start_year and (end_year is None or en_year <= end_year):
+            return holiday
+
+    return Holiday.NoHoliday
+
+
+def get_mm_calendar_holiday(mm_year: int, month: MyanmarMonth, day: int, moon_phase: MoonPhase) -> Holiday:
+    if month == MyanmarMonth.Kason and moon_phase == MoonPhase.FullMoon:
+        return Holiday.BuddhaDay
+
+    if month == MyanmarMonth.Waso and moon_phase == MoonPhase.FullMoon:
+        return Holiday.StartOfBuddhistLent
+
+    if month == MyanmarMonth.Thadingyut and moon_phase == MoonPhase.FullMoon:
+        return Holiday.EndOfBuddhistLent
+
+    if mm_year >= 1379 and month == MyanmarMonth.Thadingyut and day in (14, 16):
+        return Holiday.Normal
+
+    if month == MyanmarMonth.Tazaungmon and moon_phase == MoonPhase.FullMoon:
+        return Holiday.Tazaungdaing
+
+    if mm_year >= 1379 and month == MyanmarMonth.Tazaungmon and day == 14:
+        return Holiday.Normal
+
+    if mm_year >= 1282 and month == MyanmarMonth.Tazaungmon and day == 25:
+        return Holiday.NationalDay
+
+    if month == MyanmarMonth.Pyatho and day == 1:
+        return Holiday.KarenNewYearDay
+
+    if month == MyanmarMonth.Tabaung and moon_phase == MoonPhase.FullMoon:
+        return Holiday.TabaungPwe
+
+    return Holiday.NoHoliday
+
+
+def get_substitute_holiday(jdn: int, en_year: int) -> Holiday:
+    if en_year >= 2019 and en_year <= 2021 and jdn in SUBSTITUTE_HOLIDAYS:
+        return Holiday.Normal
+
+    return Holiday.NoHoliday
+
+
+def _get_jdn(en_date: date) -> int:
+    return date_to_jdn(en_date.year, en_date.month, en_date.day)
+
+
+# ခရစ်နှစ် တစ်နှစ်စာ ရုံးပိတ်ရက်တွေကို (ဂျူလီယန်ရက် -> ရုံးပိတ်ရက် tuple) အဖြစ် တစ်ကြိမ်ပဲ တွက်ထားတဲ့ ဇယားဖြစ်ပါတယ်။
+# jdns က bisect နဲ့ ရှာလို့ရအောင် စီထားတဲ့ array ဖြစ်ပါတယ်။
+class YearHolidays:
+    __slots__ = ('en_year', 'holidays', 'jdns')
+
+    def __init__(self, en_year: int, holidays: dict) -> None:
+        self.en_year = en_year
+        self.holidays = holidays
+        self.jdns = array('q', sorted(holidays))
+
+
+# MMDate.get_holidays နဲ့ အစီအစဉ် တူအောင် သင်္ကြန်၊ ခရစ်နှစ်၊ မြန်မာ ပြက္ခဒိန်၊ အစားထိုး ရုံးပိတ်ရက် အစဉ်အတိုင်း စုပါတယ်။
+def build_year_holidays(en_year: int) -> YearHolidays:
+    start_jdn = _get_jdn(date(en_year, 1, 1))
+    end_jdn = _get_jdn(date(en_year + 1, 1, 1)) if en_year < 9999 else start_jdn + 365
+
+    western_holidays = {}
+    for start_year, end_year, month, day, holiday in WESTERN_CALENDAR_HOLIDAYS:
+        if en_year >= start_year and (end_year is None or en_year <= end_year):
+            western_holidays[_get_jdn(date(en_year, month, day))] = holiday
+
+    holidays = {}
+    for record in iter_days(start_jdn, end_jdn):
+        jdn = record.jdn
+        day_holidays = (
+            get_thingyan_holiday(jdn, record.year, record.month),
+            western_holidays.get(jdn, Holiday.NoHoliday),
+            get_mm_calendar_holiday(record.year, record.month, record.day, record.moon_phase),
+            get_substitute_holiday(jdn, en_year),
+        )
+        day_holidays = tuple(holiday for holiday in day_holidays if not holiday == Holiday.NoHoliday)
+
+        if day_holidays:
+            holidays[jdn] = day_holidays
+
+    return YearHolidays(en_year, holidays)
+
+
+class HolidayCalendar:
+    _cache = LRUCache(256)
+
+    @classmethod
+    def get_year_holidays(cls, en_year: int) -> YearHolidays:
+        return cls._cache.get(en_year, build_year_holidays)
+
+    @classmethod
+    def get_holidays(cls, jdn: int, en_year: int) -> Tuple[Holiday, ...]:
+        return cls.get_year_holidays(en_year).holidays.get(jdn, ())
+
+    # start မှ end (မပါ) အထိ ရုံးပိတ်ရက်တွေကို (ဂျူလီယန်ရက်, ရုံးပိတ်ရက် tuple) list အဖြစ် ပြန်ပေးပါတယ်။
+    # start နဲ့ end က date ဒါမှမဟုတ် MMDate ဖြစ်နိုင်ပါတယ်။
+    @classmethod
+    def holidays_between(cls, start, end) -> List[Tuple[int, Tuple[Holiday, ...]]]:
+        start_jdn, start_year = cls._jdn_and_year(start)
+        end_jdn, end_year = cls._jdn_and_year(end)
+
+        result = []
+        for en_year in range(start_year, end_year + 1):
+            year_holidays = cls.get_year_holidays(en_year)
+            jdns = year_holidays.jdns
+            index = bisect_left(jdns, start_jdn)
+            end_index = bisect_left(jdns, end_jdn)
+            result.extend((jdn, year_holidays.holidays[jdn]) for jdn in jdns[index:end_index])
+
+        return result
+
+    @staticmethod
+    def _jdn_and_year(value) -> Tuple[int, int]:
+        from .mm_date import MMDate
+
+        mm_date = value if isinstance(value, MMDate) else MMDate(value)
+        return mm_date.jdn, mm_date.en_date.year
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._cache.clear()
+
+    @classmethod
+    def cache_info(cls) -> dict:
+        return cls._cache.cache_info()
+
+
+def holidays_between(start, end) -> List[Tuple[int, Tuple[Holiday, ...]]]:
+    return HolidayCalendar.holidays_between(start, end)
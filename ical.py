@@ -0,0 +1,138 @@
+from datetime import datetime, timezone
+from typing import Iterable, Optional, TextIO
+
+from .astro import get_astro_day_names, get_astro_flags
+from .date_format import compile_format
+from .date_range import iter_days
+from .enums.astro_flags import AstroFlags
+from .enums.calendar_type import CalendarType
+from .enums.holiday import Holiday
+from .holidays import HolidayCalendar
+from .julian_day import date_to_jdn, jdn_to_ymd
+from .mm_date import MMDate
+from .translations import HOLIDAY_MAPPING
+
+# ရုံးပိတ်ရက်၊ ဥပုသ်/အဖိတ် နဲ့ ရွေးထားတဲ့ ရက်ရာဇာ စတဲ့ ရက်တွေကို RFC 5545 iCalendar (.ics) VEVENT တွေအဖြစ် ရေးပါတယ်။
+# ခရစ်နှစ် တစ်နှစ်ချင်း ရုံးပိတ်ရက် ဇယား (HolidayCalendar) နဲ့ iter_days ကို သုံးပြီး event တစ်ခုချင်းကို ချက်ချင်း ရေးတာမို့
+# ရက်အပိုင်းအခြား ဘယ်လောက်ရှည်ရှည် memory မတက်ပါဘူး။
+#
+# event တွေက တစ်ရက်စာ (DTSTART;VALUE=DATE) event တွေ ဖြစ်ပြီး ရုံးပိတ်ရက်တစ်ခုကို event တစ်ခု၊
+# ရက်တစ်ရက်မှာ ကျတဲ့ ရွေးထားတဲ့ astro ရက်တွေကို event တစ်ခုတည်း (ဥပမာ "ဥပုသ်နေ့၊ ရက်ရာဇာ") အဖြစ် ရေးပါတယ်။
+# SUMMARY က translations ဇယားတွေထဲက မြန်မာ အမည် ဖြစ်ပြီး DESCRIPTION က get_date_str format နဲ့ မြန်မာ ရက်စွဲ ဖြစ်ပါတယ်။
+# iCalendar က ဂရီဂိုရီယန် ပြက္ခဒိန်ကိုပဲ သုံးတာမို့ 1752/Sep/14 မတိုင်ခင် ရက်တွေကိုလည်း ဂရီဂိုရီယန် ရက်စွဲနဲ့ ရေးပါတယ်။
+
+PRODID = "-//mm_calendar//Myanmar Calendar//MY"
+DEFAULT_ASTRO_FLAGS = AstroFlags.Sabbath | AstroFlags.SabbathEve
+DEFAULT_DESCRIPTION_FORMAT = "&y &M &P &f"
+
+_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n"})
+
+
+def _escape(text: str) -> str:
+    return text.translate(_TEXT_ESCAPES)
+
+
+# line တစ်ကြောင်းကို UTF-8 octet ၇၅ ခုထက် မပိုအောင် ခွဲပြီး နောက်ကြောင်းတွေကို space နဲ့ စပါတယ်။ (RFC 5545 3.1)
+# မြန်မာစာလုံးတွေက ၃ octet စီ ရှိတာမို့ စာလုံးတစ်လုံးရဲ့ အလယ်မှာ မဖြတ်မိအောင် continuation byte တွေကို ကျော်ပါတယ်။
+def _fold(line: str) -> str:
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line + "\r\n"
+
+    parts = []
+    start = 0
+    limit = 75
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        while end < len(encoded) and encoded[end] & 0xC0 == 0x80:
+            end -= 1
+
+        parts.append(encoded[start:end].decode("utf-8"))
+        start = end
+        limit = 74
+
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _ical_date(jdn: int) -> str:
+    year, month, day = jdn_to_ymd(jdn, CalendarType.Gregorian)
+
+    return f"{year:04d}{month:02d}{day:02d}"
+
+
+class IcsWriter:
+    def __init__(self, output: TextIO, calendar_name: Optional[str] = None, dtstamp: Optional[datetime] = None,
+                 description_format: str = DEFAULT_DESCRIPTION_FORMAT) -> None:
+        self.output = output
+        self.calendar_name = calendar_name
+        self.dtstamp = (dtstamp or datetime.now(timezone.utc)).astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        self.description = compile_format(description_format).render
+        self.events = 0
+
+    def start(self) -> None:
+        lines = ["BEGIN:VCALENDAR", "VERSION:2.0", f"PRODID:{PRODID}", "CALSCALE:GREGORIAN", "METHOD:PUBLISH"]
+        if self.calendar_name:
+            lines.append(f"X-WR-CALNAME:{_escape(self.calendar_name)}")
+
+        self.output.write("".join(_fold(line) for line in lines))
+
+    def write_event(self, jdn: int, uid: str, summary: str, categories: str) -> None:
+        lines = (
+            "BEGIN:VEVENT",
+            f"UID:{_ical_date(jdn)}-{uid}@mm_calendar",
+            f"DTSTAMP:{self.dtstamp}",
+            f"DTSTART;VALUE=DATE:{_ical_date(jdn)}",
+            f"DTEND;VALUE=DATE:{_ical_date(jdn + 1)}",
+            f"SUMMARY:{_escape(summary)}",
+            f"DESCRIPTION:{_escape(self.description(MMDate.from_jdn(jdn)))}",
+            f"CATEGORIES:{categories}",
+            "TRANSP:TRANSPARENT",
+            "END:VEVENT",
+        )
+        self.output.write("".join(_fold(line) for line in lines))
+        self.events += 1
+
+    def end(self) -> None:
+        self.output.write("END:VCALENDAR\r\n")
+
+
+# start မှ end (မပါ) အထိ ရက်တွေရဲ့ event တွေကို output (newline = "" နဲ့ ဖွင့်ထားတဲ့ text file) ထဲ ရေးပြီး event အရေအတွက်ကို ပြန်ပေးပါတယ်။
+# start နဲ့ end က date ဒါမှမဟုတ် MMDate ဖြစ်နိုင်ပါတယ်။
+# holidays က ထည့်မယ့် Holiday တွေ (None ဆိုရင် အားလုံး၊ () ဆိုရင် မထည့်ပါ) ဖြစ်ပြီး
+# astro_flags က ထည့်မယ့် astro ရက်တွေ (မူလက ဥပုသ်နေ့ နဲ့ အဖိတ်နေ့) ဖြစ်ပါတယ်။
+def write_ics(output: TextIO, start, end, holidays: Optional[Iterable[Holiday]] = None,
+              astro_flags: AstroFlags = DEFAULT_ASTRO_FLAGS, calendar_name: Optional[str] = None,
+              dtstamp: Optional[datetime] = None, description_format: str = DEFAULT_DESCRIPTION_FORMAT) -> int:
+    start_jdn, start_year = HolidayCalendar._jdn_and_year(start)
+    end_jdn, end_year = HolidayCalendar._jdn_and_year(end)
+    selected_holidays = None if holidays is None else frozenset(holidays)
+    astro_flags = AstroFlags(astro_flags)
+
+    writer = IcsWriter(output, calendar_name, dtstamp, description_format)
+    writer.start()
+
+    # ခရစ်နှစ် တစ်နှစ်ချင်း ရုံးပိတ်ရက် ဇယားကို ယူပြီး အဲဒီနှစ်ထဲက ရက်တွေကို တစ်ရက်ချင်း ကြည့်ပါတယ်။
+    for en_year in range(start_year, end_year + 1):
+        year_start_jdn = max(start_jdn, date_to_jdn(en_year, 1, 1))
+        year_end_jdn = min(end_jdn, date_to_jdn(en_year + 1, 1, 1))
+        if year_start_jdn >= year_end_jdn:
+            continue
+
+        year_holidays = HolidayCalendar.get_year_holidays(en_year).holidays if selected_holidays != frozenset() else {}
+
+        for record in iter_days(year_start_jdn, year_end_jdn):
+            jdn = record.jdn
+
+            # တစ်ရက်ထဲမှာ တူတဲ့ ရုံးပိတ်ရက် နှစ်ခါ ပါနိုင်တာမို့ (ဥပမာ Normal) တစ်ခါပဲ ရေးပါတယ်။
+            for holiday in dict.fromkeys(year_holidays.get(jdn, ())):
+                if selected_holidays is None or holiday in selected_holidays:
+                    writer.write_event(jdn, holiday.name.lower(), HOLIDAY_MAPPING[holiday.name], "HOLIDAY")
+
+            if astro_flags:
+                flags = get_astro_flags(record.month.value, record.week_day.value, record.day, record.month_length) & astro_flags
+                if flags:
+                    writer.write_event(jdn, f"astro-{int(flags)}", "၊ ".join(get_astro_day_names(flags)), "ASTRO")
+
+    writer.end()
+
+    return writer.events
@@ -0,0 +1,161 @@
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+from typing import Callable, Dict, List, Optional
+
+from . import date_format, year_info
+from .holidays import HolidayCalendar
+from .mm_date import MMDate, MMDateCache
+from .query import YearColumnsCache
+from .thingyan import ThingyanCache
+from .watat_strategy.watat_strategy_factory import WatatStrategyFactory
+from .year_info import YearInfoCache
+
+# enable() ခေါ်မှပဲ အောက်က function တွေကို ခေါ်မှု အရေအတွက်နဲ့ ကြာချိန် မှတ်တဲ့ function တွေနဲ့ အစားထိုးပါတယ်။
+# disable() ခေါ်ရင် မူလ function တွေကို ပြန်ထားတာမို့ ပိတ်ထားချိန်မှာ ဘာမှ ပိုမကုန်ပါဘူး။
+# ကြာချိန်က အတွင်းက ခေါ်မှုတွေပါ ပေါင်းထားတဲ့ ကြာချိန် ဖြစ်ပါတယ်။
+# module function (format_many၊ build_year_info) ကို module attribute ကနေ ခေါ်မှပဲ မှတ်ပါတယ်။ (from ... import နဲ့ ယူထားတာကို မမှတ်ပါ)
+# YearInfo သုံးပြီးကတည်းက ရက်စွဲ ပြောင်းတဲ့အခါ အနီးဆုံး ဝါထပ်နှစ်ကို YearInfoCache က build_year_info ထဲကပဲ ရှာတာမို့
+# MMDate._get_nearest_watat_strategy (nearest_watat_strategy property ကပဲ ခေါ်တဲ့ alias) အစား
+# WatatStrategyFactory.get_nearest_watat_strategy နဲ့ build_year_info ကို မှတ်ပါတယ်။
+TARGETS = (
+    (WatatStrategyFactory, "get_strategy"),
+    (WatatStrategyFactory, "get_nearest_watat_strategy"),
+    (year_info, "build_year_info"),
+    (MMDate, "_get_month"),
+    (MMDate, "_get_total_days"),
+    (MMDate, "_get_jdn_from_mm_date"),
+    (MMDate, "get_holidays"),
+    (MMDate, "get_date_str"),
+    (date_format, "format_many"),
+)
+
+_lock = Lock()
+_stats: Dict[str, List[float]] = {}
+_originals: List[tuple] = []
+
+
+def _target_name(owner, name: str) -> str:
+    return f"{owner.__name__.rsplit('.', 1)[-1]}.{name}"
+
+
+def _wrap(function: Callable, key: str) -> Callable:
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            with _lock:
+                stats = _stats[key]
+                stats[0] += 1
+                stats[1] += elapsed
+
+    return wrapper
+
+
+def is_enabled() -> bool:
+    return bool(_originals)
+
+
+def enable() -> None:
+    if _originals:
+        return
+
+    for owner, name in TARGETS:
+        key = _target_name(owner, name)
+        original = owner.__dict__[name]
+        _stats.setdefault(key, [0, 0.0])
+
+        # classmethod၊ staticmethod တွေကို အတွင်းက function ကို wrap လုပ်ပြီး ပြန်ထုပ်ပါတယ်။
+        if isinstance(original, (classmethod, staticmethod)):
+            wrapped = type(original)(_wrap(original.__func__, key))
+        else:
+            wrapped = _wrap(original, key)
+
+        setattr(owner, name, wrapped)
+        _originals.append((owner, name, original))
+
+
+def disable() -> None:
+    while _originals:
+        owner, name, original = _originals.pop()
+        setattr(owner, name, original)
+
+
+def reset() -> None:
+    with _lock:
+        for stats in _stats.values():
+            stats[0] = 0
+            stats[1] = 0.0
+
+
+def _lru_cache_info(function) -> dict:
+    info = function.cache_info()
+
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "max_size": info.maxsize}
+
+
+_CACHES = {
+    "year_info": YearInfoCache.cache_info,
+    "holidays": HolidayCalendar.cache_info,
+    "thingyan": ThingyanCache.cache_info,
+    "year_columns": YearColumnsCache.cache_info,
+    "mm_date": MMDateCache.cache_info,
+    "date_format": lambda: _lru_cache_info(date_format.compile_format),
+}
+
+
+def snapshot() -> dict:
+    with _lock:
+        functions = {
+            key: {"calls": calls, "total_seconds": total, "mean_seconds": total / calls if calls else 0.0}
+            for key, (calls, total) in _stats.items()
+        }
+
+    caches = {}
+    for name, cache_info in _CACHES.items():
+        info = cache_info()
+        lookups = info["hits"] + info["misses"]
+        info["hit_ratio"] = info["hits"] / lookups if lookups else 0.0
+        caches[name] = info
+
+    return {
+        "enabled": is_enabled(),
+        "functions": functions,
+        "caches": caches,
+        "watat_strategies": len(WatatStrategyFactory._strategies),
+    }
+
+
+def _metric(lines: List[str], name: str, metric_type: str, help: str, samples) -> None:
+    lines.append(f"# HELP {name} {help}")
+    lines.append(f"# TYPE {name} {metric_type}")
+    for labels, value in samples:
+        lines.append(f"{name}{{{labels}}} {value}" if labels else f"{name} {value}")
+
+
+# Prometheus text exposition format (version 0.0.4) နဲ့ ထုတ်ပေးပါတယ်။
+def to_prometheus(data: Optional[dict] = None, prefix: str = "mm_calendar") -> str:
+    data = snapshot() if data is None else data
+    functions = data["functions"]
+    caches = data["caches"]
+
+    lines: List[str] = []
+    _metric(lines, f"{prefix}_calls_total", "counter", "Number of calls to an instrumented function.",
+            ((f'function="{key}"', stats["calls"]) for key, stats in sorted(functions.items())))
+    _metric(lines, f"{prefix}_call_seconds_total", "counter", "Total time spent in an instrumented function.",
+            ((f'function="{key}"', repr(stats["total_seconds"])) for key, stats in sorted(functions.items())))
+    _metric(lines, f"{prefix}_cache_hits_total", "counter", "Cache hits.",
+            ((f'cache="{name}"', info["hits"]) for name, info in sorted(caches.items())))
+    _metric(lines, f"{prefix}_cache_misses_total", "counter", "Cache misses.",
+            ((f'cache="{name}"', info["misses"]) for name, info in sorted(caches.items())))
+    _metric(lines, f"{prefix}_cache_size", "gauge", "Number of entries in a cache.",
+            ((f'cache="{name}"', info["size"]) for name, info in sorted(caches.items())))
+    _metric(lines, f"{prefix}_cache_hit_ratio", "gauge", "Cache hits divided by lookups.",
+            ((f'cache="{name}"', repr(info["hit_ratio"])) for name, info in sorted(caches.items())))
+    _metric(lines, f"{prefix}_watat_strategies", "gauge", "Number of memoized watat strategy objects.",
+            (("", data["watat_strategies"]),))
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,84 @@
+from datetime import date
+
+from .constants import START_OF_GREGORIAN_JDN
+from .enums.calendar_type import CalendarType
+
+# ခရစ်နှစ် ရက်စွဲ နဲ့ ဂျူလီယန်ရက် (JDN) ကို integer သက်သက်နဲ့ အပြန်အလှန် ပြောင်းပါတယ်။
+# float နဲ့ datetime မသုံးတာမို့ MMDate ရဲ့ မူလ ပုံသေနည်းတွေထက် မြန်ပြီး ရလဒ်က ထပ်တူ ဖြစ်ပါတယ်။
+# ပြောင်းလို့ရတဲ့ အပိုင်းအခြားက ခရစ်နှစ် ၁ မှ ၉၉၉၉ အထိ ဖြစ်ပါတယ်။
+# British က ၁၇၅၂ စက်တင်ဘာ ၁၄ (START_OF_GREGORIAN_JDN) မတိုင်ခင် ဂျူလီယန် ပြက္ခဒိန်၊ အဲဒီနေ့ကစပြီး ဂရီဂိုရီယန် ပြက္ခဒိန် ဖြစ်ပါတယ်။
+
+
+# Python ရဲ့ date က proleptic ဂရီဂိုရီယန် ပြက္ခဒိန်ကိုပဲ သုံးတာမို့ ဂျူလီယန် ပြက္ခဒိန်မှာပဲ ရှိတဲ့ ဖေဖော်ဝါရီ ၂၉ ရက်
+# (ဥပမာ British 1700/Feb/29) ကို date နဲ့ မဖော်ပြနိုင်ပါ။ jdn_to_date က အဲဒီရက်တွေမှာ ဒီ error ကို ပစ်ပါတယ်။
+class JulianOnlyDateError(ValueError):
+    pass
+
+
+def date_to_jdn(year: int, month: int, day: int, calendar_type: CalendarType = CalendarType.British) -> int:
+    a = (14 - month) // 12
+    year = year + 4800 - a
+    month = month + (12 * a) - 3
+    julian_day = day + (153 * month + 2) // 5 + (365 * year) + year // 4
+
+    if calendar_type == CalendarType.Julian:
+        return julian_day - 32083
+
+    gregorian_jdn = julian_day - year // 100 + year // 400 - 32045
+    if calendar_type == CalendarType.Gregorian or gregorian_jdn >= START_OF_GREGORIAN_JDN:
+        return gregorian_jdn
+
+    # ၁၇၅၂ စက်တင်ဘာ ၃ ရက်မှ ၁၃ ရက်အထိ ရက်တွေ မရှိခဲ့တာမို့ START_OF_GREGORIAN_JDN အဖြစ် ယူပါတယ်။
+    return min(julian_day - 32083, START_OF_GREGORIAN_JDN)
+
+
+def _julian_calendar_ymd(jdn: int) -> "tuple[int, int, int]":
+    c = jdn + 32082
+    d = (4 * c + 3) // 1461
+    e = c - (1461 * d) // 4
+    m = (5 * e + 2) // 153
+
+    return d - 4800 + m // 10, m + 3 - 12 * (m // 10), e - (153 * m + 2) // 5 + 1
+
+
+def _gregorian_calendar_ymd(jdn: int) -> "tuple[int, int, int]":
+    jdn -= 1721119
+    century = (4 * jdn - 1) // 146097
+    jdn = 4 * jdn - 1 - 146097 * century
+    day = jdn // 4
+    year = (4 * day + 3) // 1461
+    day = 4 * day + 3 - 1461 * year
+    day = (day + 4) // 4
+    month = (5 * day - 3) // 153
+    day = 5 * day - 3 - 153 * month
+    day = (day + 5) // 5
+    year = 100 * century + year
+
+    if month < 10:
+        return year, month + 3, day
+
+    return year + 1, month - 9, day
+
+
+def jdn_to_ymd(jdn: int, calendar_type: CalendarType = CalendarType.British) -> "tuple[int, int, int]":
+    if calendar_type == CalendarType.Julian or (calendar_type == CalendarType.British and jdn < START_OF_GREGORIAN_JDN):
+        return _julian_calendar_ymd(jdn)
+
+    return _gregorian_calendar_ymd(jdn)
+
+
+# ဂျူလီယန် ပြက္ခဒိန်မှာပဲ ရှိတဲ့ ဖေဖော်ဝါရီ ၂၉ ရက် ဆိုရင် JulianOnlyDateError ဖြစ်ပါတယ်။
+# (ရက်စွဲ စာသားပဲ လိုရင် jdn_to_iso_date ကို သုံးပါ)
+def jdn_to_date(jdn: int, calendar_type: CalendarType = CalendarType.British) -> date:
+    year, month, day = jdn_to_ymd(jdn, calendar_type)
+    if month == 2 and day == 29 and year % 100 == 0 and year % 400 != 0:
+        raise JulianOnlyDateError(f"{year:04d}-02-29 exists only in the Julian calendar and cannot be represented as a date")
+
+    return date(year, month, day)
+
+
+# date မဆောက်ဘဲ YYYY-MM-DD စာသား ပြန်ပေးတာမို့ ဂျူလီယန် ပြက္ခဒိန်မှာပဲ ရှိတဲ့ ရက်တွေကိုလည်း ရပါတယ်။
+def jdn_to_iso_date(jdn: int, calendar_type: CalendarType = CalendarType.British) -> str:
+    year, month, day = jdn_to_ymd(jdn, calendar_type)
+
+    return f"{year:04d}-{month:02d}-{day:02d}"
@@ -1,31 +1,94 @@
-from datetime import date, datetime, timedelta
-import re
-from typing import List
-
-from .enums.direction import Direction
-from .enums.holiday import Holiday
-from .enums.mahabote import MahaBote
-from .enums.nakhat import Nakhat
+from datetime import date, datetime
+from collections.abc import Callable, Hashable
+
 from .time_obj import TimeObj
 
 from .enums.mm_week_day import MMWeekDay
-from .constants import BEGINNING_OF_THINGYAN, SOLAR_YEAR, START_OF_GREGORIAN_JDN, START_OF_THIRD_ERA, ZERO_YEAR_JDN
+from .constants import SOLAR_YEAR, START_OF_GREGORIAN_JDN, ZERO_YEAR_JDN
 from .enums.calendar_type import CalendarType
 from .enums.moon_phase import MoonPhase
 from .enums.myanmar_month import MyanmarMonth
 from .watat_strategy.watat_strategy_base import WatatStrategyBase
 from .watat_strategy.watat_strategy_factory import WatatStrategyFactory
 from .enums.year_type import YearType
+from .year_info import YearInfo, YearInfoCache, check_jdn, check_year, get_year_from_jdn
+from .cache import LRUCache
+from .enums.astro_flags import AstroFlags
+from .julian_day import JulianOnlyDateError, date_to_jdn, jdn_to_date, jdn_to_ymd
+from .translations import DIGITS_MAPPING, MONTH_MAPPING, MOON_PHASE_MAPPING, WEEK_DAY_MAPPING
+
+# typing.TYPE_CHECKING အစား ကိုယ်တိုင် False ထားတာမို့ runtime မှာ typing ကို import မလုပ်ဘဲ type checker တွေကပဲ ဖတ်ပါတယ်။
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .enums.direction import Direction
+    from .enums.holiday import Holiday
+    from .enums.mahabote import MahaBote
+    from .enums.nakhat import Nakhat
+
+# ရက်စွဲ ပြောင်းတာ တစ်ခုတည်းပဲ လိုတဲ့ process တွေ မြန်မြန် import လုပ်နိုင်အောင် ရုံးပိတ်ရက်၊ ဗေဒင်၊ format နဲ့ date_range module တွေကို
+# ပထမဆုံး သုံးတော့မှ method ထဲမှာ import လုပ်ပါတယ်။ typing ကိုလည်း (re ပါ ပါလာလို့) core module တွေမှာ မသုံးပါဘူး။ (benchmarks/import_time.py)
+
+# ရက်စွဲ တူရင် (class နဲ့ ဂျူလီယန်ရက် တူရင်) MMDate instance တစ်ခုတည်းကို မျှသုံးဖို့ cache ဖြစ်ပါတယ်။
+# instance တွေက မပြောင်းလဲနိုင်တာမို့ တွက်ပြီးသား property တွေကိုပါ ပြန်သုံးရပါတယ်။
+class MMDateCache:
+    _cache = LRUCache(4096)
+
+    @classmethod
+    def get(cls, key: "tuple[type, int]", builder: "Callable[[Hashable], MMDate]" = None) -> "MMDate":
+        return cls._cache.get(key, builder or _build_mm_date)
+
+    @classmethod
+    def set_max_size(cls, max_size: int) -> None:
+        cls._cache.set_max_size(max_size)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._cache.clear()
 
+    @classmethod
+    def cache_info(cls) -> dict:
+        return cls._cache.cache_info()
+
+
+def _build_mm_date(key: Hashable) -> "MMDate":
+    mm_date_class, jdn = key
+    mm_date = object.__new__(mm_date_class)
+    try:
+        en_date = jdn_to_date(jdn)
+    except JulianOnlyDateError:
+        # date နဲ့ မဖော်ပြနိုင်တဲ့ ဂျူလီယန် ဖေဖော်ဝါရီ ၂၉ ရက်ကို ဂျူလီယန်ရက် တူတဲ့ proleptic ဂရီဂိုရီယန် ရက်စွဲ အဖြစ် ထားပါတယ်။
+        en_date = date(*jdn_to_ymd(jdn, CalendarType.Gregorian))
+
+    mm_date._set_date(en_date, jdn)
 
+    return mm_date
+
+
+# MMDate က မပြောင်းလဲနိုင်တဲ့ တန်ဖိုး (value) ဖြစ်ပြီး ဂျူလီယန်ရက်နဲ့ နှိုင်းယှဉ်တာ၊ hash လုပ်တာမို့ set၊ dict key၊ bisect တွေမှာ သုံးလို့ရပါတယ်။
+# ရက်စွဲ တူရင် MMDateCache ထဲက instance တစ်ခုတည်းကိုပဲ ပြန်ပေးပါတယ်။ (MMDate() ဆိုရင် ဒီနေ့ ရက်စွဲ)
+# ၁၇၅၂ စက်တင်ဘာ ၃ ရက်မှ ၁၃ ရက်အထိ မရှိခဲ့တဲ့ ရက်တွေကို ၁၄ ရက်နေ့ အဖြစ် ယူပါတယ်။
+# ဂျူလီယန် ပြက္ခဒိန်မှာပဲ ရှိတဲ့ ဖေဖော်ဝါရီ ၂၉ ရက် (ဥပမာ 1700/Feb/29) ရဲ့ en_date က ဂျူလီယန်ရက် တူတဲ့ proleptic ဂရီဂိုရီယန်
+# ရက်စွဲ (1700/Mar/11) ဖြစ်ပါတယ်။ from_jdn၊ add_days နဲ့ပဲ ရနိုင်ပြီး MMDate(en_date) က British 1700/Mar/11 ဖြစ်ပါတယ်။
 class MMDate:
-    def __init__(self, en_date: date = None):
-        self.en_date = en_date
-        
+    __slots__ = ('_en_date', '_jdn', '_year', '_year_type', '_year_length', '_month', '_day',
+                 '_month_length', '_moon_phase', '_fornight_day', '_week_day', '_year_info', '_astro_flags')
+
+    # mapping to Myanmar Language (shared by all instances)
+    digits_mapping = DIGITS_MAPPING
+    month_mapping = MONTH_MAPPING
+    moon_phase_mapping = MOON_PHASE_MAPPING
+    week_day_mapping = WEEK_DAY_MAPPING
+
+    def __new__(cls, en_date: date = None):
         if en_date is None:
-            self.en_date = date.today()
+            en_date = date.today()
 
-        self.jdn = self._get_jdn(en_date)
+        return MMDateCache.get((cls, date_to_jdn(en_date.year, en_date.month, en_date.day)))
+
+    # ခရစ်နှစ် ရက်စွဲ နဲ့ ဂျူလီယန်ရက်ကို ထားပြီး cache လုပ်ထားတဲ့ တန်ဖိုးတွေကို ရှင်းပါတယ်။ instance ဆောက်တုန်းမှာပဲ ခေါ်ပါတယ်။
+    def _set_date(self, en_date: date, jdn: int) -> None:
+        self._en_date = en_date
+        self._jdn: int = jdn
 
         # cache properties to avoid recalculation every time a property is called
         self._year: int = None
@@ -37,87 +100,137 @@ class MMDate:
         self._moon_phase: int = None
         self._fornight_day: int = None
         self._week_day: int = None
-
-        self.watat_strategy = WatatStrategyFactory.get_strategy(self.year)
-        self.nearest_watat_strategy = self._get_nearest_watat_strategy(self.year)
-
-        # mapping to Myanmar Language
-        self.digits_mapping = {'0': '၀', '1': '၁', '2': '၂', '3': '၃', '4': '၄', '5': '၅', '6': '၆', '7': '၇', '8': '၈', '9': '၉'}
-        self.month_mapping = ['ပ-ဝါဆို', 'တန်ခူး', 'ကဆုန်', 'နယုန်', 'ဝါဆို', 'ဝါခေါင်', 'တော်သလင်း', 'သီတင်းကျွတ်', 'တန်ဆောင်မုန်း', 'နတ်တော်', 'ပြာသို', 'တပိုတွဲ', 'တပေါင်း', 'နှောင်းတန်ခူး', 'နှောင်းကဆုန်']
-        self.moon_phase_mapping = ['လဆန်း', 'လပြည့်', 'လဆုတ်', 'လကွယ်']
-        self.week_day_mapping = ["စနေ", "တနင်္ဂနွေ", "တနင်္လာ", "အင်္ဂါ", "ဗုဒ္ဓဟူး", "ကြာသပတေး", "သောကြာ"]
+        self._year_info: YearInfo = None
+        self._astro_flags: AstroFlags = None
 
     @classmethod
     def from_mm_date(cls, mm_year: int, mm_month: MyanmarMonth, mm_day: int):
         jdn = cls._get_jdn_from_mm_date(mm_year, mm_month.value, mm_day)
-        datetime = cls._julian_date_to_western(jdn)
         
-        return cls(datetime.date())
+        return cls._from_mm_fields(jdn, mm_year, mm_month.value, mm_day)
     
     @classmethod
     def from_mm_date_fd(cls, mm_year: int, mm_month: int, moon_phase: MoonPhase, mm_fd: int):
         day = cls._get_month_day_from_fornight_day(mm_year, mm_month, moon_phase, mm_fd)
         jdn = cls._get_jdn_from_mm_date(mm_year, mm_month.value, day)
-        datetime = cls._julian_date_to_western(jdn)
         
-        return cls(datetime.date())
+        return cls._from_mm_fields(jdn, mm_year, mm_month.value, day)
 
-    def _time_to_day_fraction(self, hour: int = 12, minute: int = 0, second: int = 0) -> float:
-        return (hour - 12) / 24 + minute / 1440 + second / 86400
+    # ပေးထားတဲ့ မြန်မာ နှစ်၊ လ၊ ရက်က အဲဒီ ဂျူလီယန်ရက်ရဲ့ ပုံမှန်ပုံစံ ဖြစ်ရင် (ဥပမာ နှစ်ဆန်း မတိုင်ခင်က တန်ခူး မဟုတ်ရင်၊ ရက်က လရဲ့ ရက်အရေအတွက်ထက် မကျော်ရင်)
+    # ပြန်မတွက်ဘဲ cache field တွေထဲ တိုက်ရိုက် ထည့်ပါတယ်။ မဟုတ်ရင်တော့ ပုံမှန်အတိုင်း လိုတော့မှ ဂျူလီယန်ရက်ကနေ တွက်ပါတယ်။
+    @classmethod
+    def _from_mm_fields(cls, jdn: int, year: int, month: int, day: int):
+        def build(key: Hashable) -> MMDate:
+            mm_date = _build_mm_date(key)
+            year_info = YearInfoCache.get(year)
+            year_type = year_info.year_type
+
+            month_length = 30 - month % 2
+            if month == MyanmarMonth.Nayon.value and year_type == YearType.BigWatat:
+                month_length += 1
+
+            if (0 < day <= month_length and 0 <= month <= 14 and (month != MyanmarMonth.FirstWaso.value or year_info.is_watat)
+                    and get_year_from_jdn(jdn) == year):
+                mm_date._year = year
+                mm_date._year_info = year_info
+                mm_date._year_type = year_type.value
+                mm_date._year_length = year_info.year_length
+                mm_date._month = month
+                mm_date._day = day
+                mm_date._month_length = month_length
+
+            return mm_date
+
+        return MMDateCache.get((cls, jdn), build)
+
+    # ဂျူလီယန်ရက်ကနေ datetime မဆောက်ဘဲ တိုက်ရိုက် ဆောက်ပါတယ်။ (British ပြက္ခဒိန်)
+    @classmethod
+    def from_jdn(cls, jdn: int):
+        return MMDateCache.get((cls, jdn))
 
-    def _get_jdn(self, en_date: date, calendarType: CalendarType = CalendarType.British) -> float:
-        julianDay = self._get_julian_day(en_date, calendarType = calendarType)
-        dayFraction = self._time_to_day_fraction()
-        
-        return julianDay + dayFraction
-    
-    def _get_julian_day(self, date: date, calendarType: CalendarType) -> float:
-        year = date.year
-        month = date.month
-        day = date.day
-
-        a = (int)((14 - month) / 12) # can also use floor function but python's floor function goes toward negative infinity not zero
-        year = year + 4800 - a
-        month = month + (12 * a) - 3
-        julianDay = day + (int)((153 * month + 2) / 5) + (365 * year) + (int)(year / 4)
-		
-        if calendarType == CalendarType.Gregorian:
-            return julianDay - (int)(year / 100) + (int)(year / 400) - 32045
-        
-        if calendarType == CalendarType.Julian:
-            return julianDay - 32080
-        
-        julianDay = julianDay - ((int) (year / 100)) + ((int) (year / 400)) - 32045
-        if julianDay < START_OF_GREGORIAN_JDN:
-            julianDay = day + (int)((153 * month + 2) / 5) + (365 * year) + (int)(year / 4) - 32083
-            julianDay = START_OF_GREGORIAN_JDN if julianDay > START_OF_GREGORIAN_JDN else julianDay
+    @property
+    def en_date(self) -> date:
+        return self._en_date
 
-        return julianDay
-    
-    @classmethod
-    def _julian_date_to_western(cls, jd: float, calendar_type: CalendarType = CalendarType.British):
-        if calendar_type == CalendarType.Julian or (calendar_type == CalendarType.British and jd < START_OF_GREGORIAN_JDN):
-            return cls._get_western_date_for_julian_calendar(jd)
-        
-        return cls._get_western_date(jd)
+    @property
+    def jdn(self) -> int:
+        return self._jdn
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, MMDate):
+            return self._jdn == other._jdn
+
+        return NotImplemented
+
+    def __lt__(self, other) -> bool:
+        if isinstance(other, MMDate):
+            return self._jdn < other._jdn
+
+        return NotImplemented
+
+    def __le__(self, other) -> bool:
+        if isinstance(other, MMDate):
+            return self._jdn <= other._jdn
+
+        return NotImplemented
+
+    def __gt__(self, other) -> bool:
+        if isinstance(other, MMDate):
+            return self._jdn > other._jdn
+
+        return NotImplemented
+
+    def __ge__(self, other) -> bool:
+        if isinstance(other, MMDate):
+            return self._jdn >= other._jdn
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._jdn)
 
+    # pickle/copy လုပ်ရင်လည်း cache ထဲက instance ကို ပြန်ယူပါတယ်။
+    def __reduce__(self):
+        return type(self).from_jdn, (self._jdn,)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._en_date!r})"
+
+    # start မှ end (မပါ) အထိ step ရက်ခြား ရက်တွေကို DayRecord အဖြစ် ထုတ်ပေးပါတယ်။
+    # start နဲ့ end က date ဒါမှမဟုတ် MMDate ဖြစ်နိုင်ပါတယ်။
+    # add_days(1) နဲ့ တစ်ရက်ချင်း ရွှေ့တာနဲ့ မတူဘဲ လကူး၊ နှစ်ကူးမှပဲ ပြန်တွက်တာမို့ အများကြီး မြန်ပါတယ်။
     @classmethod
-    def _get_western_date_for_julian_calendar(cls, jd: float) -> datetime:
-        j = (int) (jd + 0.5)
-        jf = jd + 0.5 - j
-        b = j + 1524
-        c = (int) ((b - 122.1) / 365.25)
-        f = (int) (365.25 * c)
-        e = (int) ((b - f) / 30.6001)
+    def range(cls, start, end, step: int = 1):
+        start_jdn = start.jdn if isinstance(start, MMDate) else cls(start).jdn
+        end_jdn = end.jdn if isinstance(end, MMDate) else cls(end).jdn
 
-        month = e - 13 if e > 13 else e - 1
-        day = b - f - ((int) (30.6001 * e))
-        year = c - 4715 if month < 3 else c - 4716
+        from .date_range import iter_days
 
-        time_obj = cls._calculate_time(jf)
+        return iter_days(start_jdn, end_jdn, step)
+
+    # ခရစ်နှစ် ရက်စွဲ <-> ဂျူလီယန်ရက် ပြောင်းတာကို julian_day module က integer ပုံသေနည်းတွေနဲ့ တွက်ပါတယ်။
+    def _get_jdn(self, en_date: date, calendarType: CalendarType = CalendarType.British) -> int:
+        return date_to_jdn(en_date.year, en_date.month, en_date.day, calendarType)
+    
+    def _get_julian_day(self, date: date, calendarType: CalendarType) -> int:
+        return date_to_jdn(date.year, date.month, date.day, calendarType)
+    
+    # အချိန်ပါတဲ့ ဂျူလီယန်ရက်စွဲ (ဥပမာ အတက်ချိန်) ကို datetime အဖြစ် ပြောင်းပါတယ်။ ရက်စွဲပဲ လိုရင် julian_day.jdn_to_date ကို သုံးပါ။
+    @classmethod
+    def _julian_date_to_western(cls, jd: float, calendar_type: CalendarType = CalendarType.British):
+        if calendar_type == CalendarType.British:
+            calendar_type = CalendarType.Julian if jd < START_OF_GREGORIAN_JDN else CalendarType.Gregorian
+
+        jdn = (int) (jd + 0.5)
+        year, month, day = jdn_to_ymd(jdn, calendar_type)
+        time_obj = cls._calculate_time(jd + 0.5 - jdn)
 
         return datetime(year, month, day, time_obj.hour, time_obj.minute, time_obj.second)
 
+    @classmethod
+    def _get_western_date_for_julian_calendar(cls, jd: float) -> datetime:
+        return cls._julian_date_to_western(jd, CalendarType.Julian)
+
     @classmethod
     def _calculate_time(cls, jf: float) -> TimeObj:
         jf *= 24
@@ -133,58 +246,77 @@ class MMDate:
     
     @classmethod
     def _get_western_date(cls, jd: float) -> datetime:
-        jdn = (int)(jd + 0.5)
-        jf = jd + 0.5 - jdn
-        jdn -= 1721119
-        year = (int) ((4 * jdn - 1) / 146097)
-        jdn = 4 * jdn - 1 - 146097 * year
-        day = (int) (jdn / 4)
-        jdn = (int) ((4 * day + 3) / 1461)
-        day = 4 * day + 3 - 1461 * jdn
-        day = (int) ((day + 4) / 4)
-        month = (int) ((5 * day - 3) / 153)
-        day = 5 * day - 3 - 153 * month
-        day = (int) ((day + 5) / 5)
-        year = 100 * year + jdn
-		
-        if month < 10:
-            month += 3
-        else:
-            month -= 9
-            year = year + 1
-
-        time_obj = cls._calculate_time(jf)
-
-        return datetime(year, month, day, time_obj.hour, time_obj.minute, time_obj.second)
+        return cls._julian_date_to_western(jd, CalendarType.Gregorian)
     
     @staticmethod
     def _get_nearest_watat_strategy(year: int) -> WatatStrategyBase:
-        year_count = 1
-        nearest_watat_strategy = WatatStrategyFactory.get_strategy(year - year_count)
-        while not nearest_watat_strategy.is_watat() and year_count < 3:
-            year_count += 1
-            nearest_watat_strategy = WatatStrategyFactory.get_strategy(year - year_count)
+        return WatatStrategyFactory.get_nearest_watat_strategy(year)
+    
+    @property
+    def watat_strategy(self) -> WatatStrategyBase:
+        return WatatStrategyFactory.get_strategy(self.year)
+    
+    @property
+    def nearest_watat_strategy(self) -> WatatStrategyBase:
+        return self._get_nearest_watat_strategy(self.year)
+    
+    # နှစ်အလိုက် တွက်ထားတဲ့ တန်ဖိုးတွေကို MMDate အားလုံး မျှသုံးတဲ့ cache ကနေ ယူပါတယ်။
+    @property
+    def year_info(self) -> YearInfo:
+        if self._year_info is None:
+            self._year_info = YearInfoCache.get(self.year)
 
-        return nearest_watat_strategy
+        return self._year_info
     
+    # MMDate က မပြောင်းလဲနိုင်တာမို့ ရက်ရွှေ့ထားတဲ့ MMDate အသစ်ကို ပြန်ပေးပါတယ်။
     def add_days(self, days: int = 1):
-        updated_date = self.en_date + timedelta(days = days)
-        self.en_date = updated_date
-        self.jdn = self._get_jdn(self.en_date)
+        return self.from_jdn(self._jdn + days)
 
-        # cache properties to avoid recalculation every time a property is called
-        self._year: int = None
-        self._year_type: int = None
-        self._year_length: int = None
-        self._month: int = None
-        self._day: int = None
-        self._month_length: int = None
-        self._moon_phase: int = None
-        self._fornight_day: int = None
-        self._week_day: int = None
+    # မြန်မာလ အလိုက် ရွှေ့ပါတယ်။ (ဝါထပ်နှစ်မှာ နယုန်ပြီးရင် ပထမဝါဆို)
+    # ပထမဝါဆို၊ နှောင်းတန်ခူး/ကဆုန် နဲ့ ရက် ကန့်သတ်ပုံ စည်းမျဉ်းတွေကို month_arithmetic module မှာ ကြည့်ပါ။
+    def add_months(self, months: int = 1):
+        from .month_arithmetic import add_months, cycle_to_jdn
+
+        cycle, month, day = add_months(self.year, self._get_month_value(), self.day, months)
+        return self._from_mm_fields(cycle_to_jdn(cycle, month, day), cycle, month, day)
+
+    # နောက်နှစ် (ဒါမှမဟုတ် years နှစ်အကြာ) ရဲ့ လ နဲ့ ရက် တူတဲ့ ရက်ကို ပြန်ပေးပါတယ်။
+    def add_years(self, years: int = 1):
+        from .month_arithmetic import add_years, cycle_to_jdn
+
+        cycle, month, day = add_years(self.year, self._get_month_value(), self.day, years)
+        return self._from_mm_fields(cycle_to_jdn(cycle, month, day), cycle, month, day)
+
+    # self - other ကို unit (days, months, years) နဲ့ ပြန်ပေးပါတယ်။
+    # months/years က ပြည့်တဲ့ လ/နှစ် အရေအတွက် ဖြစ်ပြီး other.add_months(ရလဒ်) က self ကို မကျော်ပါဘူး။
+    def diff(self, other, unit: str = "days") -> int:
+        other = other if isinstance(other, MMDate) else type(self)(other)
+
+        if unit == "days":
+            return self._jdn - other._jdn
+
+        from .month_arithmetic import month_difference, year_difference
+
+        if unit == "months":
+            difference, add = month_difference, other.add_months
+        elif unit == "years":
+            difference, add = year_difference, other.add_years
+        else:
+            raise ValueError(f"unit must be 'days', 'months' or 'years', got {unit!r}")
 
-        self.watat_strategy = WatatStrategyFactory.get_strategy(self.year)
-        self.nearest_watat_strategy = self._get_nearest_watat_strategy(self.year)
+        count = difference(self.year, self._get_month_value(), other.year, other._get_month_value())
+        if count > 0 and add(count) > self:
+            count -= 1
+        elif count < 0 and add(count) < self:
+            count += 1
+
+        return count
+
+    def _get_month_value(self) -> int:
+        if self._month is None:
+            self._month = self._get_actual_month()
+
+        return self._month
 
     # မြန်မာပြက္ခဒိန်မှာ နှစ်တစ်နှစ်ရဲ့ကြာချိန် ကို ၁၅၇၇၉၁၇၈၂၈/၄၃၂၀၀၀၀ (၃၆၅.၂၅၈၇၅၆၅) ရက် လို့သတ်မှတ်ထားပါတယ်။
     # နှစ်တစ်နှစ်ရဲ့အစချိန် (အတာတက်ချိန်)ကို နှစ်တစ်နှစ်ရဲ့ကြာချိန် ထည့်ပေါင်းလိုက်ရင် နောက်တစ်နှစ်ရဲ့ နှစ်အစချိန်ကို ရနိုင်တယ်။
@@ -201,7 +333,7 @@ class MMDate:
         """
         Calculate Myanmar Year from Julian Day Number
         """
-        return (int) ((round(self.jdn) - ZERO_YEAR_JDN - 0.5) / SOLAR_YEAR)
+        return (int) ((self.jdn - ZERO_YEAR_JDN - 0.5) / SOLAR_YEAR)
     
     @property
     def year(self) -> int:
@@ -222,12 +354,7 @@ class MMDate:
     # အကြွင်းက ၃၁ ဆိုရင်တော့ ပထမဝါဆိုအပြင်၊ နယုန်လကိုပါ တစ်ရက်ထပ်ပေါင်းဖို့ လိုတာကြောင့် အဲဒီနှစ်က ဝါကြီးထပ်နှစ်ဖြစ်ပါတယ်။
     # 0 = Common, 1 = Little Watat, 2 = Big Watat
     def _get_year_type(self) -> int:
-        if not self.watat_strategy.is_watat():
-            return YearType.Common.value # common year
-        
-        total_days = self.watat_strategy.get_second_waso_full_moon_day() - self.nearest_watat_strategy.get_second_waso_full_moon_day()
-        year_type = ((int)((total_days % 354) / 31)) + 1
-        return year_type
+        return self.year_info.year_type.value
     
     @property
     def year_type(self) -> YearType:
@@ -238,11 +365,7 @@ class MMDate:
     
     # ရိုးရိုးနှစ်၊ ဝါငယ်ထပ်နှစ် နဲ့ ဝါကြီးထပ်နှစ်တွေအတွက် စုစုပေါင်း ရက်အရေအတွက် က ၃၅၄၊ ၃၈၄ နှင့် ၃၈၅ အသီးသီးဖြစ်ပါတယ်။
     def _get_year_length(self) -> int:
-        year_type = self.year_type 
-        watat = 1 if not (year_type == YearType.Common) else 0
-        yatNgin = 1 if year_type == YearType.BigWatat else 0 # ရက်ငင်
-        
-        return 354 + 30 * watat + yatNgin
+        return self.year_info.year_length
     
     @property
     def year_length(self) -> int:
@@ -349,17 +472,23 @@ class MMDate:
 
         return MMWeekDay(self._week_day)
     
+    # ရက်ရာဇာ၊ ပြဿဒါး စတဲ့ ရက်တွေ အားလုံးကို ကြိုတွက်ထားတဲ့ ဇယားကနေ bitmask တစ်ခုတည်းအဖြစ် ယူပါတယ်။
+    @property
+    def astro_flags(self) -> AstroFlags:
+        if self._astro_flags is None:
+            from .astro import get_astro_flags
+
+            self._astro_flags = get_astro_flags(self.month.value, self.week_day.value, self.day, self.month_length)
+
+        return self._astro_flags
+    
     #မြန်မာ ပြက္ခဒိန်မှာ လပြည့်၊ လကွယ် နဲ့ လဆန်း၊ လဆုတ် ၈ ရက်နေ့တွေက ဥပုသ် နေ့ဖြစ်ပြီး၊ အဲဒီမတိုင်ခင်ရက်က အဖိတ်နေ့ ဖြစ်ပါတယ်။ 
     def is_sabbath_eve(self) -> bool:
-        day = self.day
-
-        return (day in [7, 14, 22]) or day == self.month_length - 1
+        return bool(self.astro_flags & AstroFlags.SabbathEve)
     
     #မြန်မာ ပြက္ခဒိန်မှာ လပြည့်၊ လကွယ် နဲ့ လဆန်း၊ လဆုတ် ၈ ရက်နေ့တွေက ဥပုသ် နေ့ဖြစ်ပြီး၊ အဲဒီမတိုင်ခင်ရက်က အဖိတ်နေ့ ဖြစ်ပါတယ်။ 
     def is_sabbath(self) -> bool:
-        day = self.day
-
-        return (day in [8, 15, 23]) or day == self.month_length
+        return bool(self.astro_flags & AstroFlags.Sabbath)
     
     # လနဲ့ နေ့ အပေါ်မှာ မူတည်တဲ့ ရက်ရာဇာ နေ့တွေကို အောက်က ဇယားမှာ ပြထားပါတယ်။
     # ===========================================
@@ -371,11 +500,7 @@ class MMDate:
     # ဝါဆို၊ တန်ဆောင်မုန်း၊ တပေါင်း   |	တနင်္ဂနွေ၊ ဗုဒ္ဓဟူး
     # ============================================
     def is_yatyaza(self) -> bool:
-        m1 = self.month.value % 4
-        wd1 = ((int) (m1 / 2)) + 4
-        wd2 = ((1 - ((int)(m1 / 2))) + m1 % 2) * (1 + 2 * (m1 % 2))
-
-        return self.week_day.value in [wd1, wd2]
+        return bool(self.astro_flags & AstroFlags.Yatyaza)
     
     # ===============================================
     # လ                        |နေ့
@@ -386,15 +511,11 @@ class MMDate:
     # ဝါဆို၊ တန်ဆောင်မုန်း၊ တပေါင်း   |အင်္ဂါ၊ ဗုဒ္ဓဟူး မွန်းလွဲ
     # ===============================================
     def is_pyathada(self) -> bool:
-        m1 = self.month.value % 4
-        # if m1 == 0 and self.week_day == 4:
-        #     return True # afternoon pyathada
-        
-        wda = [1, 3, 3, 0, 2, 1, 2]
-        
-        return m1 == wda[self.week_day.value]
+        return bool(self.astro_flags & AstroFlags.Pyathada)
     
-    def get_dragon_head_direction(self) -> Direction:
+    def get_dragon_head_direction(self) -> "Direction":
+        from .enums.direction import Direction
+
         month = self.month
 
         # first waso is considered as waso
@@ -405,243 +526,75 @@ class MMDate:
 
         return Direction(direction_index)
     
-    def get_mahabote(self) -> MahaBote:
+    def get_mahabote(self) -> "MahaBote":
+        from .enums.mahabote import MahaBote
+
         index = (self.year - self.week_day.value) % 7
 
         return MahaBote(index)
     
-    def get_nakhat(self) -> Nakhat:
+    def get_nakhat(self) -> "Nakhat":
+        from .enums.nakhat import Nakhat
+
         index = self.year % 3
 
         return Nakhat(index)
     
     def is_thama_nyo(self) -> bool:
-        month_type = (int) (self.month.value / 13)
-        month = (self.month.value % 13) + month_type # to 1-12 with month type
-
-        if month <= 0:
-            month = 4 # first waso is considered waso
-
-        m1 = month - 1 - ((int) (month / 9))
-        wd1 = ((m1 * 2) - ((int) (m1 / 8))) % 7
-        wd2 = (self.week_day.value + 7 - wd1) % 7
-
-        return wd2 <= 1
+        return bool(self.astro_flags & AstroFlags.ThamaNyo)
     
     def is_thama_phyu(self) -> bool:
-        wda = [[1, 0], [2, 1], [6, 0], [6, 0], [5, 0], [6, 3], [7, 3]]
-
-        if self.fornight_day in wda[self.week_day.value]:
-            return True
-        
-        return self.fornight_day == 4 and self.week_day == MMWeekDay.THURSDAY
+        return bool(self.astro_flags & AstroFlags.ThamaPhyu)
     
     def is_amyeittasote(self) -> bool:
-        wda = [5, 8, 3, 7, 2, 4, 1]
-
-        return self.fornight_day == wda[self.week_day.value]
+        return bool(self.astro_flags & AstroFlags.Amyeittasote)
     
     def is_warameittu_gyi(self) -> bool:
-        wda = [7, 1, 4, 8, 9, 6, 3]
-
-        return self.fornight_day == wda[self.week_day.value]
+        return bool(self.astro_flags & AstroFlags.WarameittuGyi)
     
     def is_warameittu_nge(self) -> bool:
-        index = (self.week_day.value + 6) % 7
-
-        return 12 - self.fornight_day == index
+        return bool(self.astro_flags & AstroFlags.WarameittuNge)
     
     def is_yat_pote(self) -> bool:
-        wda = [8, 1, 4, 6, 9, 8, 7]
-
-        return self.fornight_day == wda[self.week_day.value]
+        return bool(self.astro_flags & AstroFlags.YatPote)
     
     def is_naga_por(self) -> bool:
-        wda = [[26, 17], [21, 19], [2, 1], [10, 0], [18, 9], [2, 0], [21, 0]]
-        week_day = self.week_day.value
-
-        if self.day in wda[week_day]:
-            return True
-        
-        return (self.day == 2 and week_day == 1) or (self.day in [12, 4, 18] and week_day == 2)
+        return bool(self.astro_flags & AstroFlags.NagaPor)
     
     def is_yat_yotema(self) -> bool:
-        month_type = (int) (self.month.value / 13)
-        month = self.month.value % 13 + month_type #to 1-12 with month type
-
-        if month <= 0:
-            month = 4 # first waso is considered waso
-
-        m1 = month if month % 2 else (month + 9) % 12
-        m1 = (m1 + 4) % 12 + 1
-
-        return self.fornight_day == m1
+        return bool(self.astro_flags & AstroFlags.YatYotema)
     
     def is_maha_yat_kyan(self) -> bool:
-        month = self.month
-        
-        if month == MyanmarMonth.FirstWaso:
-            month = MyanmarMonth.Waso
-
-        m1 = ((int) ((month.value % 12) / 2)) + 4
-        m1 = (m1 % 6) + 1
-
-        return self.fornight_day == m1
+        return bool(self.astro_flags & AstroFlags.MahaYatKyan)
     
     def is_shan_yat(self) -> bool:
-        month_type = (int) (self.month.value / 13)
-        month = self.month.value % 13 + month_type #to 1-12 with month type
-
-        if month <= 0:
-            month = 4 # first waso is considered waso
-
-        sya = [8, 8, 2, 2, 9, 3, 3, 5, 1, 4, 7, 4]
-
-        return self.fornight_day == sya[month - 1]
+        return bool(self.astro_flags & AstroFlags.ShanYat)
     
-    def get_holidays(self) -> List[Holiday]:
-        holidays = [
-                        self._get_thingyan_holiday(), 
-                        self._get_western_calendar_holiday(), 
-                        self._get_mm_calendar_holiday(), 
-                        self._get_substitute_holiday()
-                    ]
-        
-        # filter not holidays
-        holidays = [holiday for holiday in holidays if not holiday == Holiday.NoHoliday]
-        
-        return holidays
-
-    def _get_thingyan_holiday(self) -> Holiday:
-        julian_day_number = self.jdn
-        mm_year = self.year
-        month_type = (int) (self.month.value / 13)
+    def get_holidays(self) -> "list[Holiday]":
+        from .holidays import HolidayCalendar
 
-        # နှစ်တစ်နှစ်ရဲ့ နှစ်ကူးချိန် (အတက်ချိန်) ကိုလိုချင်ရင် နှစ်တစ်နှစ်မှာရှိတဲ့ ဂျူလီယန်ရက်အရေအတွက်နဲ့
-        # ရှာလိုတဲ့နှစ်နဲ့မြှောက်ပြီး မြန်မာနှစ် ၀ နှစ်မှာရှိတဲ့ ဂျူလီယန်ရက်နဲ့ပေါင်းလိုက်ရင် ရပါပြီ။
-        thingyan_atat_day = SOLAR_YEAR * (mm_year * month_type) + ZERO_YEAR_JDN
+        # ခရစ်နှစ် တစ်နှစ်စာ ရုံးပိတ်ရက်တွေကို တစ်ကြိမ်ပဲ တွက်ပြီး cache လုပ်ထားတဲ့ ဇယားကနေ ယူပါတယ်။
+        return list(HolidayCalendar.get_holidays(self.jdn, self.en_date.year))
 
-        # အကြမ်းအားဖြင့် အကြနေ့ဟာ (အကြ - အကြတ် - အတက်) ဖြစ်လို့ အတက်နေ့ထဲက ၂ ရက်နှုတ်ပေးရင် အကြနေ့ကို ရပါတယ်။
-        akya_day_offset = 2.169918982 if mm_year >= START_OF_THIRD_ERA else 2.1675
-        thingyan_akya_day = round(thingyan_atat_day - akya_day_offset)
-        # day လို့ရေးထားပေမယ့် တကယ်တော့ ဂျူလီယန်ရက်စွဲ (အချိန်ပါ) ဖြစ်နေလို့ ဂျူလီယန်ရက် ရအောင် round ယူပါတယ်။
-        thingyan_atat_day = round(thingyan_atat_day)
+    def _get_thingyan_holiday(self) -> "Holiday":
+        from .holidays import get_thingyan_holiday
 
-        # အတက်နေ့ရဲ့ နောက်တစ်နေ့ (နှစ်ဆန်းတစ်ရက်နေ့)မှ မြန်မာနှစ်သစ် စပါတယ်။
-        if julian_day_number == thingyan_atat_day:
-            return Holiday.MyanmarNewYearDay
-
-        if mm_year + month_type < BEGINNING_OF_THINGYAN:
-            return Holiday.NoHoliday
-        
-        if julian_day_number == thingyan_atat_day:
-            return Holiday.ThingyanAtatDay
-        
-        # အကျနေ့နဲ့ အတက်နေ့ကြားက နေ့တွေဟာ အကြတ်နေ့။
-        if julian_day_number > thingyan_akya_day and julian_day_number < thingyan_atat_day:
-            return Holiday.ThingyanAkyatDay
-        
-        if julian_day_number == thingyan_akya_day:
-            return Holiday.ThingyanAkyaDay
-        
-        if julian_day_number == thingyan_akya_day - 1:
-            return Holiday.ThingyanAkyoDay
-        
-        if ((mm_year + month_type) >= 1369) and ((mm_year + month_type) < 1379) and ((julian_day_number == (thingyan_akya_day - 2)) or
-				((julian_day_number >= (thingyan_atat_day + 2)) and (julian_day_number <= (thingyan_akya_day + 7)))):
-            return Holiday.ThingyanHoliday
+        return get_thingyan_holiday(self.jdn, self.year, self.month)
         
-        if (((mm_year + month_type) >= 1384) and (mm_year + month_type) <= 1385) and ((julian_day_number == (thingyan_akya_day - 5)) or (julian_day_number == (thingyan_akya_day - 4)) or (julian_day_number == (thingyan_akya_day - 3)) or (julian_day_number == (thingyan_akya_day - 2))):
-            return Holiday.ThingyanHoliday
-        
-        if (mm_year + month_type) >= 1386 and (((julian_day_number >= (thingyan_atat_day + 2)) and (julian_day_number <= (thingyan_akya_day + 7)))):
-            return Holiday.ThingyanHoliday
-        
-        return Holiday.NoHoliday
-        
-    def _get_western_calendar_holiday(self) -> Holiday:
-        en_year = self.en_date.year
-        en_month = self.en_date.month
-        en_day = self.en_date.day
+    def _get_western_calendar_holiday(self) -> "Holiday":
+        from .holidays import get_western_calendar_holiday
 
-        if (en_year >= 2018 and en_year <= 2021) and en_month == 1 and en_day == 1:
-            return Holiday.NewYearDay
-        
-        if (en_year >= 1948) and (en_month == 1) and (en_day == 4):
-            return Holiday.IndependenceDay
-        
-        if (en_year >= 1947) and (en_month == 2) and (en_day == 12):
-            return Holiday.UnionDay
-        
-        if (en_year >= 1958) and (en_month == 3) and (en_day == 2):
-            return Holiday.PeasantsDay
-        
-        if (en_year >= 1945) and (en_month == 3) and (en_day == 27):
-            return Holiday.ResistanceDay
-        
-        if (en_year >= 1923) and (en_month == 5) and (en_day == 1):
-            return Holiday.LabourDay
-        
-        if (en_year >= 1947) and (en_month == 7) and (en_day == 19):
-            return Holiday.MartyrsDay
-        
-        if (en_year >= 1752) and (en_month == 12) and (en_day == 25):
-            return Holiday.ChristmasDay
-        
-        if (en_year == 2017) and (en_month == 12) and (en_day == 30):
-            return Holiday.Normal
-        
-        if (en_year >= 2017 and en_year <= 2021) and (en_month == 12) and (en_day == 31):
-            return Holiday.Normal
+        return get_western_calendar_holiday(self.en_date.year, self.en_date.month, self.en_date.day)
+    
+    def _get_mm_calendar_holiday(self) -> "Holiday":
+        from .holidays import get_mm_calendar_holiday
 
-        return Holiday.NoHoliday
+        return get_mm_calendar_holiday(self.year, self.month, self.day, self.moon_phase)
     
-    def _get_mm_calendar_holiday(self) -> Holiday:
-        if self.month == MyanmarMonth.Kason and self.moon_phase == MoonPhase.FullMoon:
-            return Holiday.BuddhaDay
-        
-        if self.month == MyanmarMonth.Waso and self.moon_phase == MoonPhase.FullMoon:
-            return Holiday.StartOfBuddhistLent
-        
-        if self.month == MyanmarMonth.Thadingyut and self.moon_phase == MoonPhase.FullMoon:
-            return Holiday.EndOfBuddhistLent
-        
-        if self.year >= 1379 and self.month == MyanmarMonth.Thadingyut and self.day in [14, 16]:
-            return Holiday.Normal
-        
-        if self.month == MyanmarMonth.Tazaungmon and self.moon_phase == MoonPhase.FullMoon:
-            return Holiday.Tazaungdaing
-        
-        if self.year >= 1379 and self.month == MyanmarMonth.Tazaungmon and self.day == 14:
-            return Holiday.Normal
-        
-        if self.year >= 1282 and self.month == MyanmarMonth.Tazaungmon and self.day == 25:
-            return Holiday.NationalDay
-        
-        if self.month == MyanmarMonth.Pyatho and self.day == 1:
-            return Holiday.KarenNewYearDay
-        
-        if self.month == MyanmarMonth.Tabaung and self.moon_phase == MoonPhase.FullMoon:
-            return Holiday.TabaungPwe
-        
-        return Holiday.NoHoliday
-    
-    def _get_substitute_holiday(self) -> Holiday:
-        substitute_holiday = [
-            # 2019
-            2458768, 2458772, 2458785, 2458800,
-            # 2020
-            2458855, 2458918, 2458950, 2459051, 2459062,
-            2459152, 2459156, 2459167, 2459181, 2459184,
-            # 2021
-            2459300, 2459303, 2459323, 2459324,
-            2459335, 2459548, 2459573,
-		]
-        
-        if self.en_date.year >= 2019 and self.en_date.year <= 2021 and self.jdn in substitute_holiday:
-            return Holiday.Normal
+    def _get_substitute_holiday(self) -> "Holiday":
+        from .holidays import get_substitute_holiday
 
-        return Holiday.NoHoliday
+        return get_substitute_holiday(self.jdn, self.en_date.year)
     
     @property
     def sasana_year(self) -> int:
@@ -686,60 +639,11 @@ class MMDate:
     # &w : week day [0-6]
     # &A : astro days [e.g Yatyarzar]
     # &D : direction of dragon head [e.g North]
+    # format string ကို တစ်ကြိမ်ပဲ ခွဲပြီး (date_format.compile_format) ပါတဲ့ token တွေကိုပဲ တွက်ပါတယ်။
     def get_date_str(self, format = "&y &M &P &f") -> str:
-        output_str = format
-        
-        mm_year_str = self._pad_number(self.year, 4)
-        output_str = re.sub("&yyyy", mm_year_str, output_str)
-
-        sasana_year_str = self._pad_number(self.sasana_year, 4)
-        output_str = re.sub("&YYYY", sasana_year_str, output_str)
-
-        mm_short_year = self._num_to_mm_digits(self.year)
-        output_str = re.sub("&y", mm_short_year, output_str)
+        from .date_format import compile_format
 
-        month_num_str = self._pad_number(self.month.value, 2)
-        output_str = re.sub("&mm", month_num_str, output_str)
-
-        month_str = self.month_mapping[self.month.value]
-        if self.month == MyanmarMonth.Waso and (not self.year_type == YearType.Common):
-            # ဝါထပ်
-            month_str = "ဒု-" + month_str
-        
-        output_str = re.sub("&M", month_str, output_str)
-
-        month_short_str = self._num_to_mm_digits(self.month.value)
-        output_str = re.sub("&m", month_short_str, output_str)
-
-        moon_phase = self.moon_phase_mapping[self.moon_phase.value]
-        output_str = re.sub("&P", moon_phase, output_str)
-
-        day_str = self._pad_number(self.day, padding = 2)
-        output_str = re.sub("&dd", day_str, output_str)
-
-        short_day_str = self._num_to_mm_digits(self.day)
-        output_str = re.sub("&d", short_day_str, output_str)
-
-        fornight_day_str = self._pad_number(self.fornight_day, padding = 2)
-        output_str = re.sub("&ff", fornight_day_str, output_str)
-
-        short_fornight_day_str = self._num_to_mm_digits(self.fornight_day)
-        output_str = re.sub("&f", short_fornight_day_str, output_str)
-
-        week_day_str = self.week_day_mapping[self.week_day.value]
-        output_str = re.sub("&W", week_day_str, output_str)
-
-        week_day_no = self._num_to_mm_digits(self.week_day.value)
-        output_str = re.sub("&w", week_day_no, output_str)
-
-        astro_days = self._get_astro_days()
-        output_str = re.sub("&A", astro_days, output_str)
-
-        direction_mapping = ['အနောက်', 'မြောက်', 'အရှေ့', 'တောင်']
-        direction = self.get_dragon_head_direction()
-        output_str = re.sub("&D", direction_mapping[direction.value], output_str)
-
-        return output_str
+        return compile_format(format).render(self)
 
     def _pad_number(self, number: int, padding: int = 2) -> str:
         output_str = ("၀" * padding) + self._num_to_mm_digits(number)
@@ -749,80 +653,9 @@ class MMDate:
         return output_str
     
     def _get_astro_days(self) -> str:
-        astro_days = []
-        
-        if self.is_sabbath_eve():
-            astro_days.append('အဖိတ်နေ့')
-
-        if self.is_sabbath():
-            astro_days.append('ဥပုသ်နေ့')
-
-        if self.is_yatyaza():
-            astro_days.append('ရက်ရာဇာ')
+        from .astro import get_astro_day_names
 
-        if self.is_pyathada():
-            astro_days.append('ပြဿဒါး')
-    
-        if self.is_thama_nyo():
-            astro_days.append('သမားညို')
-    
-        if self.is_thama_phyu():
-            astro_days.append('သမားဖြူ')
-    
-        if self.is_amyeittasote():
-            astro_days.append('အမြိတ္တစုတ်')
-    
-        if self.is_warameittu_gyi():
-            astro_days.append('ဝါရမိတ္တုကြီး')
-    
-        if self.is_warameittu_nge():
-            astro_days.append('ဝါရမိတ္တုငယ်')
-    
-        if self.is_yat_pote():
-            astro_days.append('ရက်ပုပ်')
-    
-        if self.is_naga_por():
-            astro_days.append('နဂါးပေါ်')
-    
-        if self.is_yat_yotema():
-            astro_days.append('ရက်ယုတ်မာ')
-    
-        if self.is_maha_yat_kyan():
-            astro_days.append('မဟာရက်ကြမ်း')
-    
-        if self.is_shan_yat():
-            astro_days.append('ရှမ်းရက်')
-
-        return '၊ '.join(astro_days)
-    
-    def get_holidays(self) -> List[Holiday]:
-        holidays = [
-                        self._get_thingyan_holiday(), 
-                        self._get_western_calendar_holiday(), 
-                        self._get_mm_calendar_holiday(), 
-                        self._get_substitute_holiday()
-                    ]
-        
-        # filter not holidays
-        holidays = [holiday for holiday in holidays if not holiday == Holiday.NoHoliday]
-        
-        return holidays
-
-    def _get_thingyan_holiday(self) -> Holiday:
-        julian_day_number = self.jdn
-        mm_year = self.year
-        month_type = (int) (self.month.value / 13)
-
-        # နှစ်တစ်နှစ်ရဲ့ နှစ်ကူးချိန် (အတက်ချိန်) ကိုလိုချင်ရင် နှစ်တစ်နှစ်မှာရှိတဲ့ ဂျူလီယန်ရက်အရေအတွက်နဲ့
-        # ရှာလိုတဲ့နှစ်နဲ့မြှောက်ပြီး မြန်မာနှစ် ၀ နှစ်မှာရှိတဲ့ ဂျူလီယန်ရက်နဲ့ပေါင်းလိုက်ရင် ရပါပြီ။
-        thingyan_atat_day = SOLAR_YEAR * (mm_year * month_type) + ZERO_YEAR_JDN
-
-        # အကြမ်းအားဖြင့် အကြနေ့ဟာ (အကြ - အကြတ် - အတက်) ဖြစ်လို့ အတက်နေ့ထဲက ၂ ရက်နှုတ်ပေးရင် အကြနေ့ကို ရပါတယ်။
-        akya_day_offset = 2.169918982 if mm_year >= START_OF_THIRD_ERA else 2.1675
-        thingyan_akya_day = round(thingyan_atat_day - akya_day_offset)
-        # day လို့ရေးထားပေမယ့် တကယ်တော့ ဂျူလီယန်ရက်စွဲ (အချိန်ပါ) ဖြစ်နေလို့ ဂျူလီယန်ရက် ရအောင် round ယူပါတယ်။
-        thingyan_atat_day = round(thingyan_atat_day)
-        pass
+        return '၊ '.join(get_astro_day_names(self.astro_flags))
     
     # ကမ္ဘာသုံး ဂရီဂိုရီရမ် ပြက္ခဒိန်မှာ ဇန်နဝါရီလ တစ်ရက်နေ့ ရောက်ရင် နှစ်ဆန်း တစ်ရက်နေ့ ဖြစ်ပေမယ့် 
     # မြန်မာ ပြက္ခဒိန်ကတော့ တန်ခူးလဆန်း တစ်ရက် ရောက်လည်း နောက်နှစ်မရောက်ပါဘူး။ 
@@ -853,8 +686,7 @@ class MMDate:
     # အဲဒီနှစ်နဲ့ အနီးဆုံးဝါထပ်နှစ်အကြားမှာ ရှိတဲ့ သာမန်နှစ်အရေအတွက်ကို ၃၅၄ နဲ့ မြှောက်ထားတဲ့ မြှောက်လဒ် ရယ်ပေါင်းပြီး
     # အဲဒီရလဒ်ထဲက ၁၀၂ ရက်ကိုပြန်နုတ် ပေးပြီးရှာနိုင်ပါတယ်။
     def _get_first_day_of_tagu(self) -> int:
-        year_count = self.year - self.nearest_watat_strategy.year
-        return self.nearest_watat_strategy.get_second_waso_full_moon_day() + 354 * year_count - 102
+        return self.year_info.first_day_of_tagu
     
     # နှစ်စကနေ လက်ရှိရက်ထိ စုစုပေါင်း ရက်အရေအတွက်ကိုလိုချင်ရင် 
     # ရှာလိုတဲ့ရက်ရဲ့ ဂျူလီယန်ရက်နံပါတ်ကနေ နှစ်ဦးမှာ ရှိတဲ့ တန်ခူးလဆန်း ၁ ရက်ကို နုတ်၊ တစ်ပေါင်းပေးပြီး ရှာနိုင်ပါတယ်။
@@ -888,8 +720,7 @@ class MMDate:
     
     @classmethod
     def _get_jdn_from_mm_date(cls, year: int, month: int, day: int):
-        watat_strategy = WatatStrategyFactory.get_strategy(year)
-        nearest_watat_strategy = cls._get_nearest_watat_strategy(year)
+        year_info = YearInfoCache.get(year)
         month_type = (int) (month / 13)
         month = month % 13 + month_type
         month += 4 - ((int) ((month + 15) / 16)) * 4 + ((int) ((month + 12) / 16))
@@ -897,33 +728,67 @@ class MMDate:
         common_day_offset = ((int) ((month + 11) / 16)) * 30
         big_watat_offset = ((int) ((month + 12) / 16))
 
-        dd -= common_day_offset if not watat_strategy.is_watat() else 0
-
-        total_days = watat_strategy.get_second_waso_full_moon_day() - nearest_watat_strategy.get_second_waso_full_moon_day()
-        year_type = ((int)((total_days % 354) / 31)) + 1
-
-        dd += big_watat_offset if year_type == 2 else 0
-        year_length = 354 + (30 if watat_strategy.is_watat() else 0) + (1 if year_type == 2 else 0)
-        dd += year_length * month_type
-
-        year_count = year - nearest_watat_strategy.year
-        first_day_of_tagu = nearest_watat_strategy.get_second_waso_full_moon_day() + 354 * year_count - 102
+        dd -= common_day_offset if not year_info.is_watat else 0
+        dd += big_watat_offset if year_info.year_type == YearType.BigWatat else 0
+        dd += year_info.year_length * month_type
         
-        return dd + first_day_of_tagu - 1
+        return dd + year_info.first_day_of_tagu - 1
     
     @classmethod
     def _get_month_day_from_fornight_day(cls, year: int, month: MyanmarMonth, moon_phase: MoonPhase, day: int) -> int:
-        watat_strategy = WatatStrategyFactory.get_strategy(year)
-        nearest_watat_strategy = cls._get_nearest_watat_strategy(year)
-
-        total_days = watat_strategy.get_second_waso_full_moon_day() - nearest_watat_strategy.get_second_waso_full_moon_day()
-        year_type = ((int)((total_days % 354) / 31)) + 1
+        year_info = YearInfoCache.get(year)
+        month_length = 30 - month.value % 2 # month length
         
         if month == MyanmarMonth.Nayon:
-            mml += (int) (year_type / 2) # adjust if Nayon in big watat
+            month_length += (int) (year_info.year_type.value / 2) # adjust if Nayon in big watat
 
         m1 = moon_phase.value % 2
         m2 = (int) (moon_phase.value / 2)
-        month_length = 30 - month.value % 2 # month length
 
-        return (m1 * (15 + m2 * (month_length - 15)) + (1 - m1) * (day + 15 * m2))
\ No newline at end of file
+        return (m1 * (15 + m2 * (month_length - 15)) + (1 - m1) * (day + 15 * m2))
+
+    # from_mm_date နဲ့ from_mm_date_fd က ပေးတဲ့ ရက်စွဲကို မစစ်ဘဲ တွက်ပါတယ်။ (ဥပမာ တန်ခူး ၄၀ ရက် က ကဆုန် ၁၁ ရက် ဖြစ်သွားပါတယ်)
+    # အပြင်က ရလာတဲ့ ရက်စွဲ (server၊ parser) တွေအတွက် အောက်က function တွေနဲ့ အရင်စစ်ပြီး မရှိတဲ့ ရက်စွဲ ဆိုရင် ValueError ပစ်ပါတယ်။
+    # ဝါမထပ်နှစ်ရဲ့ ပထမဝါဆို၊ လရဲ့ ရက်အရေအတွက်ထက် ကျော်တဲ့ ရက်၊ နှစ်ဆန်းတစ်ရက် မတိုင်ခင် တန်ခူး/ကဆုန် နဲ့
+    # နောက်နှစ်ထဲ ရောက်သွားတဲ့ နှောင်းတန်ခူး/ကဆုန် တွေကို လက်မခံပါ။
+    @classmethod
+    def _get_checked_month_length(cls, year: int, month: MyanmarMonth) -> int:
+        check_year(year)
+        year_info = YearInfoCache.get(year)
+        if month == MyanmarMonth.FirstWaso and not year_info.is_watat:
+            raise ValueError(f"{month.name} does not exist in Myanmar year {year} (not a watat year)")
+
+        month_length = 30 - month.value % 2
+        if month == MyanmarMonth.Nayon and year_info.year_type == YearType.BigWatat:
+            month_length += 1
+
+        return month_length
+
+    @classmethod
+    def _get_checked_jdn(cls, year: int, month: MyanmarMonth, day: int) -> int:
+        month_length = cls._get_checked_month_length(year, month)
+        if not 1 <= day <= month_length:
+            raise ValueError(f"day {day} is out of range for {month.name} {year} (1-{month_length})")
+
+        jdn = cls._get_jdn_from_mm_date(year, month.value, day)
+        if get_year_from_jdn(jdn) != year:
+            raise ValueError(f"{month.name} {day} is not in Myanmar year {year}")
+
+        check_jdn(jdn)
+
+        return jdn
+
+    # လပြည့်နဲ့ လကွယ် မှာ fornight_day က None ဖြစ်နိုင်ပြီး ပါရင် ၁၅ နဲ့ လရဲ့ နောက်ဆုံး လဆုတ်ရက် ဖြစ်ရပါမယ်။
+    @classmethod
+    def _get_checked_day_from_fornight_day(cls, year: int, month: MyanmarMonth, moon_phase: MoonPhase, fornight_day: int = None) -> int:
+        month_length = cls._get_checked_month_length(year, month)
+        if moon_phase in (MoonPhase.Waxing, MoonPhase.Waning) and fornight_day is None:
+            raise ValueError(f"{moon_phase.name} needs a fortnight day")
+
+        last_fornight_day = (14, 15, month_length - 16, month_length - 15)[moon_phase.value]
+        first_fornight_day = 15 if moon_phase == MoonPhase.FullMoon else last_fornight_day if moon_phase == MoonPhase.NewMoon else 1
+        if fornight_day is not None and not first_fornight_day <= fornight_day <= last_fornight_day:
+            raise ValueError(f"fortnight day {fornight_day} is out of range for {moon_phase.name} of {month.name} {year} "
+                             f"({first_fornight_day}-{last_fornight_day})")
+
+        return cls._get_month_day_from_fornight_day(year, month, moon_phase, fornight_day or 0)
@@ -0,0 +1,151 @@
+from .enums.myanmar_month import MyanmarMonth
+from .enums.year_type import YearType
+from .watat_strategy.watat_strategy_factory import WatatStrategyFactory
+from .year_info import YearInfoCache
+
+# မြန်မာ လ/နှစ် အလိုက် ရက်စွဲ တွက်ချက်မှုတွေ ဖြစ်ပါတယ်။ ရက်တစ်ရက်ချင်း မရွှေ့ဘဲ YearInfo ပေါ်ကနေ တွက်ပါတယ်။
+# add_years က နှစ်တစ်နှစ်စာ YearInfo ပဲ ကြည့်ပါတယ်။ add_months နဲ့ လ ခြားနားချက်က ဖြတ်သွားတဲ့ နှစ်တွေကို တစ်နှစ်ချင်း
+# မကြည့်ဘဲ ဝါထပ်နှစ် အရေအတွက် ဇယား (WatatStrategyFactory.get_watat_counts) ကနေ ၀ ခုနှစ် တန်ခူးကနေ ရေတွက်ထားတဲ့
+# လ အမှတ်ကို တွက်ပြီး ရောက်တဲ့နှစ်ကို ခန့်မှန်းနှစ်ကနေ တစ်နှစ်နှစ်နှစ်ပဲ ရွှေ့ရှာပါတယ်။
+# ဇယား အပြင်ဘက်က (အနုတ်) နှစ်တွေမှာတော့ YearInfo တစ်နှစ်ချင်း ကြည့်ပါတယ်။
+#
+# တွက်ပုံ စည်းမျဉ်းများ
+# - လတွေကို တန်ခူးလဆန်း ၁ ရက် (first_day_of_tagu) က စတဲ့ လစဉ် (cycle) အလိုက် ရေတွက်ပါတယ်။
+#   တန်ခူး၊ ကဆုန်၊ နယုန်၊ (ဝါထပ်နှစ်မှာ ပထမဝါဆို)၊ ဝါဆို၊ ... တပေါင်း ဖြစ်ပါတယ်။
+# - နှောင်းတန်ခူး/နှောင်းကဆုန် ကို နောက်နှစ် လစဉ်ရဲ့ တန်ခူး/ကဆုန် အဖြစ် တွက်ပါတယ်။ ဒါကြောင့် ရလဒ်က နှစ်ဆန်းတစ်ရက်
+#   ဘယ်နေ့ကျလဲ ပေါ်မူတည်ပြီး နှောင်းတန်ခူး (ယခင်နှစ်) ဒါမှမဟုတ် တန်ခူး (နောက်နှစ်) အဖြစ် ပေါ်နိုင်ပါတယ်။
+# - ရက်က ရောက်တဲ့လရဲ့ ရက်အရေအတွက်ထက် များနေရင် လရဲ့ နောက်ဆုံးရက် (လကွယ်) အဖြစ် ယူပါတယ်။
+#   ဥပမာ ကဆုန် ၃၀ + ၁ လ = နယုန် ၂၉၊ ဝါကြီးထပ်နှစ် နယုန် ၃၀ + ၁ နှစ် (ဝါမထပ်နှစ်) = နယုန် ၂၉
+# - add_years မှာ ပထမဝါဆို ကနေ ဝါမထပ်တဲ့ နှစ်ကို ရောက်ရင် ဝါဆို အဖြစ် ယူပါတယ်။ (ဝါထပ်နှစ်ရဲ့ ဝါဆို က ဒုတိယ ဝါဆို ဖြစ်ပါတယ်)
+
+_COMMON_MONTHS = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12)
+_WATAT_MONTHS = (1, 2, 3, 0, 4, 5, 6, 7, 8, 9, 10, 11, 12)
+
+
+def get_months(is_watat: bool) -> tuple:
+    return _WATAT_MONTHS if is_watat else _COMMON_MONTHS
+
+
+def get_month_length(month: int, year_type: YearType) -> int:
+    month_length = 30 - month % 2
+    if month == MyanmarMonth.Nayon.value and year_type == YearType.BigWatat:
+        month_length += 1
+
+    return month_length
+
+
+# (မြန်မာနှစ်၊ လ) ကို (လစဉ်နှစ်၊ ၀-၁၂ လ) ပြောင်းပါတယ်။
+def to_cycle(year: int, month: int) -> tuple:
+    if month >= MyanmarMonth.LateTagu.value:
+        return year + 1, month - 12
+
+    return year, month
+
+
+# လစဉ် cycle ရဲ့ month လ day ရက်ကို ဂျူလီယန်ရက် ပြောင်းပါတယ်။ (MMDate._get_jdn_from_mm_date နဲ့ အတူတူ)
+def cycle_to_jdn(cycle: int, month: int, day: int) -> int:
+    from .mm_date import MMDate
+
+    return MMDate._get_jdn_from_mm_date(cycle, month, day)
+
+
+def _clamp(cycle: int, month: int, day: int) -> tuple:
+    year_info = YearInfoCache.get(cycle)
+
+    return cycle, month, min(day, get_month_length(month, year_info.year_type))
+
+
+# ၁၉ နှစ်မှာ ဝါထပ်နှစ် ၇ နှစ် (လ ၂၃၅ လ) ရှိတာကို သုံးပြီး ခန့်မှန်းပါတယ်။
+_YEARS_PER_MONTH = 19 / 235
+
+
+# ၀ ခုနှစ် တန်ခူးကနေ cycle ရဲ့ month လ အထိ လ အရေအတွက်
+def _absolute_month_number(watat_counts, cycle: int, month: int) -> int:
+    is_watat = watat_counts[cycle + 1] - watat_counts[cycle]
+
+    return 12 * cycle + watat_counts[cycle] + get_months(is_watat).index(month)
+
+
+# _absolute_month_number ကို ပြန်ပြောင်းပါတယ်။ ဇယား အပြင်ဘက် ရောက်ရင် None ဖြစ်ပါတယ်။
+def _from_absolute_month_number(month_number: int):
+    if month_number < 0:
+        return None
+
+    cycle = (int) (month_number * _YEARS_PER_MONTH)
+    watat_counts = WatatStrategyFactory.get_watat_counts(cycle + 2)
+    if watat_counts is None:
+        return None
+
+    while 12 * cycle + watat_counts[cycle] > month_number:
+        cycle -= 1
+
+    while 12 * (cycle + 1) + watat_counts[cycle + 1] <= month_number:
+        cycle += 1
+        if cycle + 1 >= len(watat_counts):
+            return None
+
+    is_watat = watat_counts[cycle + 1] - watat_counts[cycle]
+
+    return cycle, get_months(is_watat)[month_number - 12 * cycle - watat_counts[cycle]]
+
+
+def add_months(year: int, month: int, day: int, months: int) -> tuple:
+    cycle, month = to_cycle(year, month)
+
+    watat_counts = WatatStrategyFactory.get_watat_counts(cycle)
+    if watat_counts is not None:
+        found = _from_absolute_month_number(_absolute_month_number(watat_counts, cycle, month) + months)
+        if found is not None:
+            return _clamp(found[0], found[1], day)
+
+    year_months = get_months(YearInfoCache.get(cycle).is_watat)
+    position = year_months.index(month) + months
+
+    while position < 0:
+        cycle -= 1
+        year_months = get_months(YearInfoCache.get(cycle).is_watat)
+        position += len(year_months)
+
+    while position >= len(year_months):
+        position -= len(year_months)
+        cycle += 1
+        year_months = get_months(YearInfoCache.get(cycle).is_watat)
+
+    return _clamp(cycle, year_months[position], day)
+
+
+def add_years(year: int, month: int, day: int, years: int) -> tuple:
+    cycle, month = to_cycle(year, month)
+    cycle += years
+
+    if month == MyanmarMonth.FirstWaso.value and not YearInfoCache.get(cycle).is_watat:
+        month = MyanmarMonth.Waso.value
+
+    return _clamp(cycle, month, day)
+
+
+# cycle တစ်ခုရဲ့ တန်ခူးကနေ ရေတွက်ထားတဲ့ လ (start_cycle ရဲ့ တန်ခူးကို ၀ လို့ ယူပါတယ်)
+def _month_number(start_cycle: int, cycle: int, month: int) -> int:
+    watat_counts = WatatStrategyFactory.get_watat_counts(max(start_cycle, cycle))
+    if watat_counts is not None and min(start_cycle, cycle) >= 0:
+        return _absolute_month_number(watat_counts, cycle, month) - 12 * start_cycle - watat_counts[start_cycle]
+
+    months = 0
+    for year in range(min(start_cycle, cycle), max(start_cycle, cycle)):
+        months += 12 + YearInfoCache.get(year).is_watat
+
+    months = months if cycle >= start_cycle else -months
+
+    return months + get_months(YearInfoCache.get(cycle).is_watat).index(month)
+
+
+# (year, month) ကနေ (other_year, other_month) အထိ လ အရေအတွက် (ရက်ကို မကြည့်ပါ)
+def month_difference(year: int, month: int, other_year: int, other_month: int) -> int:
+    cycle, month = to_cycle(year, month)
+    other_cycle, other_month = to_cycle(other_year, other_month)
+
+    return _month_number(other_cycle, cycle, month) - _month_number(other_cycle, other_cycle, other_month)
+
+
+def year_difference(year: int, month: int, other_year: int, other_month: int) -> int:
+    return to_cycle(year, month)[0] - to_cycle(other_year, other_month)[0]
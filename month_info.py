@@ -0,0 +1,100 @@
+from datetime import date
+from typing import List, Optional
+
+from .date_range import DayRecord, iter_days
+from .enums.mm_week_day import MMWeekDay
+from .enums.myanmar_month import MyanmarMonth
+from .enums.year_type import YearType
+from .julian_day import jdn_to_date
+from .year_info import YearInfoCache, get_month_and_day
+
+_MONTHS = tuple(MyanmarMonth)
+
+
+# မြန်မာလ တစ်လစာ အချက်အလက် ဖြစ်ပါတယ်။
+# start_jdn နဲ့ length က လဆန်း ၁ ရက်ကနေ လကွယ်နေ့အထိ လတစ်လလုံးကို ဖော်ပြပြီး
+# first_jdn နဲ့ last_jdn ကတော့ ဒီနှစ်၊ ဒီလ နာမည်နဲ့ ခေါ်တဲ့ ရက်တွေ (နှစ်ဆန်းတစ်ရက်နေ့ နဲ့ ဖြတ်ထားတဲ့ အပိုင်း) ကို ဖော်ပြပါတယ်။
+# ဥပမာ နှစ်ဆန်းတစ်ရက် မတိုင်ခင် တန်ခူးလရဲ့ ရက်တွေက အရင်နှစ်ရဲ့ နှောင်းတန်ခူး ဖြစ်ပါတယ်။
+class MonthInfo:
+    __slots__ = ('year', 'year_type', 'month', 'start_jdn', 'length', 'first_jdn', 'last_jdn')
+
+    def __init__(self, year: int, year_type: YearType, month: MyanmarMonth, start_jdn: int, length: int, first_jdn: int, last_jdn: int) -> None:
+        self.year = year
+        self.year_type = year_type
+        self.month = month
+        self.start_jdn = start_jdn
+        self.length = length
+        self.first_jdn = first_jdn
+        self.last_jdn = last_jdn
+
+    @property
+    def end_jdn(self) -> int:
+        return self.start_jdn + self.length - 1
+
+    # လဆန်း ၁ ရက်မှ ၁၄ ရက်ထိ လဆန်း၊ ၁၅ ရက်က လပြည့်၊ ၁၆ ရက်ကနေ လဆုတ်ပြီး နောက်ဆုံးရက်က လကွယ် ဖြစ်ပါတယ်။
+    @property
+    def full_moon_jdn(self) -> int:
+        return self.start_jdn + 14
+
+    @property
+    def waning_start_jdn(self) -> int:
+        return self.start_jdn + 15
+
+    @property
+    def new_moon_jdn(self) -> int:
+        return self.end_jdn
+
+    @property
+    def first_en_date(self) -> date:
+        return jdn_to_date(self.first_jdn)
+
+    @property
+    def last_en_date(self) -> date:
+        return jdn_to_date(self.last_jdn)
+
+    def __repr__(self) -> str:
+        return f"MonthInfo(year={self.year}, month={self.month.name}, start_jdn={self.start_jdn}, length={self.length})"
+
+
+# start_year မှ end_year (အပါ) အထိ မြန်မာနှစ်တွေရဲ့ လတွေကို အစဉ်လိုက် ထုတ်ပေးပါတယ်။
+# ဝါထပ်နှစ်ရဲ့ ပထမဝါဆို နဲ့ နှစ်ကုန်ပိုင်းက နှောင်းတန်ခူး၊ နှောင်းကဆုန် လတွေလည်း ပါပါတယ်။
+# လတစ်လကို လ ပုံသေနည်း တစ်ကြိမ်ပဲ တွက်ပါတယ်။
+def iter_months(start_year: int, end_year: int):
+    for year in range(start_year, end_year + 1):
+        year_info = YearInfoCache.get(year)
+        year_end_jdn = YearInfoCache.get(year + 1).new_year_day - 1
+
+        jdn = year_info.new_year_day
+        while jdn <= year_end_jdn:
+            month, day, month_length = get_month_and_day(year_info, jdn)
+            start_jdn = jdn - day + 1
+            last_jdn = min(start_jdn + month_length - 1, year_end_jdn)
+
+            # နှစ်ဆန်းတစ်ရက်က တန်ခူးလဆန်း ၁ ရက် မတိုင်ခင် ကျတဲ့နှစ်မှာ တန်ခူးလဆန်း ၁ ရက်ကနေ လ ပြန်စပါတယ်။
+            if jdn < year_info.first_day_of_tagu:
+                last_jdn = min(last_jdn, year_info.first_day_of_tagu - 1)
+
+            yield MonthInfo(year, year_info.year_type, _MONTHS[month], start_jdn, month_length, jdn, last_jdn)
+
+            jdn = last_jdn + 1
+
+
+def get_month_info(year: int, month: MyanmarMonth) -> MonthInfo:
+    for month_info in iter_months(year, year):
+        if month_info.month == month:
+            return month_info
+
+    raise ValueError(f"{month.name} does not exist in Myanmar year {year}")
+
+
+# လတစ်လလုံး (လဆန်း ၁ ရက်မှ လကွယ်နေ့ထိ) ကို ပြက္ခဒိန်ပုံစံ အပတ်လိုက် ဇယားအဖြစ် ပြန်ပေးပါတယ်။
+# အပတ်တစ်ပတ်ကို first_week_day နဲ့ စပြီး လထဲမှာ မပါတဲ့ အကွက်တွေကို None နဲ့ ဖြည့်ပါတယ်။
+def build_month_grid(month_info: MonthInfo, first_week_day: MMWeekDay = MMWeekDay.SUNDAY) -> List[List[Optional[DayRecord]]]:
+    start_week_day = (month_info.start_jdn + 2) % 7
+    leading_cells = (start_week_day - first_week_day.value) % 7
+
+    cells: List[Optional[DayRecord]] = [None] * leading_cells
+    cells.extend(iter_days(month_info.start_jdn, month_info.end_jdn + 1))
+    cells.extend([None] * (-len(cells) % 7))
+
+    return [cells[index:index + 7] for index in range(0, len(cells), 7)]
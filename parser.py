@@ -0,0 +1,150 @@
+import re
+import unicodedata
+from array import array
+from typing import Iterable, List, Optional, Tuple
+
+from .enums.moon_phase import MoonPhase
+from .enums.myanmar_month import MyanmarMonth
+from .mm_date import MMDate
+from .translations import DIGITS_MAPPING, MONTH_MAPPING, MOON_PHASE_MAPPING
+from .year_info import YearInfoCache
+
+# get_short_date_str (၁၃၈၅ ခု၊ ဝါဆို လဆန်း ၅ ရက်) နဲ့ get_date_str (၁၃၈၅ ဒု-ဝါဆို လဆန်း ၅) ရဲ့ ရလဒ်လို မြန်မာ ရက်စွဲ စာသားတွေကို
+# ဂျူလီယန်ရက် ပြန်ပြောင်းပါတယ်။ regex တစ်ခုတည်းကို module load တုန်းက တစ်ကြိမ်ပဲ compile လုပ်ထားပါတယ်။
+#
+#   နှစ်    : မြန်မာ ဒါမှမဟုတ် အင်္ဂလိပ် ဂဏန်း၊ နောက်က "ခု"/"ခုနှစ်" နဲ့ "၊" ပါလည်းရ မပါလည်းရ
+#   လ      : MONTH_MAPPING ထဲက လ (ပ-ဝါဆို ပါ) နဲ့ ဝါထပ်နှစ်ရဲ့ ဒု-ဝါဆို၊ ပထမဝါဆို၊ ဒုတိယဝါဆို
+#   လအခြေအနေ: MOON_PHASE_MAPPING (လဆန်း၊ လပြည့်၊ လဆုတ်၊ လကွယ်)
+#   ရက်    : လဆန်း/လဆုတ် ရက် (လပြည့်၊ လကွယ် မှာ မပါလည်းရ)၊ နောက်က "ရက်" ပါလည်းရ မပါလည်းရ
+#
+# စာရိုက်ထားတဲ့ စာရွက်တွေမှာ သုည (၀) အစား ဝ (ဝလုံး) ကို မကြာခဏ တွေ့ရတာမို့ ဂဏန်းထဲက ဝ ကို သုည အဖြစ် ယူပါတယ်။
+# ရလဒ်ကို MMDate ရဲ့ မြန်မာ ရက်စွဲကနေ ပြောင်းတဲ့ နည်း (from_mm_date_fd) နဲ့ တွက်ပြီး မရှိတဲ့ ရက်စွဲ
+# (ဥပမာ ဝါမထပ်နှစ်ရဲ့ ပ-ဝါဆို၊ နှစ်ဆန်းတစ်ရက် မတိုင်ခင် တန်ခူး၊ လဆန်း ၁၅ ရက်) နဲ့ ခရစ်နှစ် 1-9999 ထဲ မကျတဲ့
+# ရက်စွဲ (မြန်မာနှစ် ၀ ခုနှစ် အပါအဝင်) ဆိုရင် ParseError ဖြစ်ပါတယ်။
+
+_DIGITS_TABLE = str.maketrans({**{mm_digit: digit for digit, mm_digit in DIGITS_MAPPING.items()}, "ဝ": "0"})
+
+_MONTHS = {name: month for month, name in enumerate(MONTH_MAPPING)}
+# ဝါထပ်နှစ်ရဲ့ ဒုတိယ ဝါဆိုကို get_date_str က ဒု-ဝါဆို လို့ ရေးပါတယ်။
+_MONTHS.update({"ဒု-ဝါဆို": MyanmarMonth.Waso.value, "ဒုတိယဝါဆို": MyanmarMonth.Waso.value, "ပထမဝါဆို": MyanmarMonth.FirstWaso.value})
+_MOON_PHASES = {name: moon_phase for moon_phase, name in enumerate(MOON_PHASE_MAPPING)}
+
+# ဇယားထဲမှာ ် (asat) ကို ့ (dot below) ရှေ့မှာ ရေးထားပေမယ့် NFC normalize လုပ်ထားတဲ့ စာတွေမှာ ့် အစဉ် ဖြစ်နေတာမို့ နှစ်မျိုးလုံး လက်ခံပါတယ်။
+for _names in (_MONTHS, _MOON_PHASES):
+    _names.update({unicodedata.normalize("NFC", name): value for name, value in list(_names.items())})
+
+_DIGITS = "[0-9၀-၉ဝ]"
+
+
+def _alternatives(names) -> str:
+    # နှောင်းတန်ခူး ကို တန်ခူး ထက် အရင် စမ်းရအောင် ရှည်တာကို အရင် ထားပါတယ်။
+    return "|".join(re.escape(name) for name in sorted(names, key = len, reverse = True))
+
+
+_PATTERN = re.compile(
+    rf"\s*(?P<year>{_DIGITS}+)\s*(?:ခု(?:နှစ်)?)?\s*[၊,]?\s*"
+    rf"(?P<month>{_alternatives(_MONTHS)})\s*"
+    rf"(?P<moon_phase>{_alternatives(_MOON_PHASES)})\s*"
+    rf"(?:(?P<day>{_DIGITS}+)\s*(?:ရက်(?:နေ့)?)?)?\s*[။.]?\s*"
+)
+
+FAILED = 0
+
+
+class ParseError(ValueError):
+    pass
+
+
+# regex ရဲ့ အုပ်စု (စာသား) တွေကို ဂျူလီယန်ရက် ပြောင်းပါတယ်။
+def _resolve(year_text: str, month_text: str, moon_phase_text: str, day_text: Optional[str]) -> int:
+    year = int(year_text.translate(_DIGITS_TABLE))
+    month = MyanmarMonth(_MONTHS[month_text])
+    moon_phase = MoonPhase(_MOON_PHASES[moon_phase_text])
+    fornight_day = None if day_text is None else int(day_text.translate(_DIGITS_TABLE))
+
+    try:
+        # နှစ်အပိုင်းအခြား (check_year)၊ လ နဲ့ ရက် စစ်တာကို server နဲ့ မျှသုံးပါတယ်။
+        day = MMDate._get_checked_day_from_fornight_day(year, month, moon_phase, fornight_day)
+        if month_text.startswith("ဒု") and not YearInfoCache.get(year).is_watat:
+            raise ParseError(f"{month_text} does not exist in Myanmar year {year} (not a watat year)")
+
+        # နှစ်ဆန်းတစ်ရက် မတိုင်ခင် တန်ခူး/ကဆုန် (အရင်နှစ်ရဲ့ နှောင်းတန်ခူး/ကဆုန်) နဲ့ နောက်နှစ်ထဲ ရောက်သွားတဲ့ နှောင်းတန်ခူး/ကဆုန် ကို လက်မခံပါ။
+        jdn = MMDate._get_checked_jdn(year, month, day)
+    except ParseError:
+        raise
+    except ValueError as error:
+        raise ParseError(str(error)) from None
+
+    return jdn
+
+
+def _match(text: str):
+    match = _PATTERN.fullmatch(text) if isinstance(text, str) else None
+    if match is None:
+        raise ParseError(f"not a Myanmar date: {text!r}")
+
+    return match
+
+
+# မြန်မာ ရက်စွဲ စာသား တစ်ခုကို ဂျူလီယန်ရက် ပြောင်းပါတယ်။ မမှန်ရင် ParseError (ValueError) ဖြစ်ပါတယ်။
+def parse_jdn(text: str) -> int:
+    return _resolve(*_match(text).group("year", "month", "moon_phase", "day"))
+
+
+def parse(text: str) -> MMDate:
+    return MMDate.from_jdn(parse_jdn(text))
+
+
+# parse_many ရဲ့ ရလဒ် ဖြစ်ပါတယ်။ jdns က စာကြောင်း တစ်ကြောင်းကို တစ်ခုနှုန်း ဂျူလီယန်ရက် (မအောင်မြင်ရင် FAILED) ဖြစ်ပြီး
+# errors က မအောင်မြင်တဲ့ စာကြောင်းတွေရဲ့ (index, စာသား, အကြောင်းရင်း) ဖြစ်ပါတယ်။
+class ParseResult:
+    __slots__ = ('jdns', 'errors')
+
+    def __init__(self) -> None:
+        self.jdns = array('q')
+        self.errors: List[Tuple[int, str, str]] = []
+
+    def __len__(self) -> int:
+        return len(self.jdns)
+
+    @property
+    def parsed(self) -> int:
+        return len(self.jdns) - len(self.errors)
+
+    def __repr__(self) -> str:
+        return f"ParseResult(lines={len(self.jdns)}, errors={len(self.errors)})"
+
+
+# စာကြောင်း အများကြီးကို ParseError မပစ်ဘဲ တစ်ခါတည်း ပြောင်းပါတယ်။ (ဥပမာ parse_many(open(path, encoding = "utf-8")))
+# ရက်စွဲ တူတာ များလို့ regex အုပ်စု တူတဲ့ စာကြောင်းအတွက် တွက်ပြီးသား ရလဒ်ကို ပြန်သုံးပါတယ်။
+def parse_many(lines: Iterable[str], result: Optional[ParseResult] = None) -> ParseResult:
+    result = ParseResult() if result is None else result
+    jdns = result.jdns
+    errors = result.errors
+    fullmatch = _PATTERN.fullmatch
+    resolved = {}
+
+    for index, line in enumerate(lines, len(jdns)):
+        match = fullmatch(line) if isinstance(line, str) else None
+        if match is None:
+            jdns.append(FAILED)
+            errors.append((index, line, f"not a Myanmar date: {line!r}"))
+            continue
+
+        key = match.group("year", "month", "moon_phase", "day")
+        jdn = resolved.get(key)
+        if jdn is None:
+            try:
+                jdn = _resolve(*key)
+            except (ValueError, OverflowError) as error:
+                jdn = error
+
+            resolved[key] = jdn
+
+        if jdn.__class__ is int:
+            jdns.append(jdn)
+        else:
+            jdns.append(FAILED)
+            errors.append((index, line, str(jdn)))
+
+    return result
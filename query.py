@@ -0,0 +1,407 @@
+from abc import ABC, abstractmethod
+from array import array
+from typing import Iterable, List, Optional
+
+from .astro import get_astro_flags
+from .cache import LRUCache
+from .date_range import iter_days
+from .enums.astro_flags import AstroFlags
+from .enums.holiday import Holiday
+from .enums.mm_week_day import MMWeekDay
+from .enums.moon_phase import MoonPhase
+from .enums.myanmar_month import MyanmarMonth
+from .enums.year_type import YearType
+from .holidays import HolidayCalendar
+from .julian_day import jdn_to_ymd
+from .month_info import MonthInfo, iter_months
+from .year_info import YearInfo, YearInfoCache, get_year_from_jdn
+
+
+# မြန်မာနှစ် တစ်နှစ်စာ ရက်တွေကို (နှစ်ဆန်းတစ်ရက်နေ့ကနေ စပြီး) column အလိုက် array တွေမှာ ကြိုတွက်ထားတာ ဖြစ်ပါတယ်။
+# index က ဂျူလီယန်ရက် - start_jdn ဖြစ်ပြီး months က လတစ်လချင်းစီရဲ့ (MonthInfo, စ index, ဆုံး index (မပါ)) ဖြစ်ပါတယ်။
+class YearColumns:
+    __slots__ = ('year_info', 'start_jdn', 'months', 'month', 'day', 'month_length', 'fornight_day', 'moon_phase',
+                 'week_day', 'astro_flags', '_holidays')
+
+    def __init__(self, year_info: YearInfo, start_jdn: int) -> None:
+        self.year_info = year_info
+        self.start_jdn = start_jdn
+        self.months: List[tuple] = []
+        self.month = array('b')
+        self.day = array('b')
+        self.month_length = array('b')
+        self.fornight_day = array('b')
+        self.moon_phase = array('b')
+        self.week_day = array('b')
+        self.astro_flags = array('l')
+        self._holidays = None
+
+    @property
+    def year(self) -> int:
+        return self.year_info.year
+
+    @property
+    def end_jdn(self) -> int:
+        return self.start_jdn + len(self.day)
+
+    # ရုံးပိတ်ရက်တွေကို လိုမှပဲ ခရစ်နှစ်အလိုက် HolidayCalendar ကနေ ယူပြီး {ဂျူလီယန်ရက်: ရုံးပိတ်ရက် tuple} အဖြစ် သိမ်းပါတယ်။
+    @property
+    def holidays(self) -> dict:
+        if self._holidays is None:
+            first_year = jdn_to_ymd(self.start_jdn)[0]
+            last_year = jdn_to_ymd(self.end_jdn - 1)[0]
+
+            holidays = {}
+            for en_year in range(first_year, last_year + 1):
+                year_holidays = HolidayCalendar.get_year_holidays(en_year).holidays
+                holidays.update((jdn, value) for jdn, value in year_holidays.items() if self.start_jdn <= jdn < self.end_jdn)
+
+            self._holidays = holidays
+
+        return self._holidays
+
+
+def build_year_columns(year: int) -> YearColumns:
+    year_info = YearInfoCache.get(year)
+    columns = YearColumns(year_info, year_info.new_year_day)
+
+    for month_info in iter_months(year, year):
+        start_index = month_info.first_jdn - columns.start_jdn
+        columns.months.append((month_info, start_index, month_info.last_jdn - columns.start_jdn + 1))
+
+    for record in iter_days(columns.start_jdn, YearInfoCache.get(year + 1).new_year_day):
+        month = record.month.value
+        week_day = record.week_day.value
+        columns.month.append(month)
+        columns.day.append(record.day)
+        columns.month_length.append(record.month_length)
+        columns.fornight_day.append(record.fornight_day)
+        columns.moon_phase.append(record.moon_phase.value)
+        columns.week_day.append(week_day)
+        columns.astro_flags.append(get_astro_flags(month, week_day, record.day, record.month_length))
+
+    return columns
+
+
+class YearColumnsCache:
+    _cache = LRUCache(256)
+
+    @classmethod
+    def get(cls, year: int) -> YearColumns:
+        return cls._cache.get(year, build_year_columns)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._cache.clear()
+
+    @classmethod
+    def cache_info(cls) -> dict:
+        return cls._cache.cache_info()
+
+
+# predicate တွေကို &, |, ~ နဲ့ ပေါင်းစပ်လို့ရပါတယ်။
+# year_state နဲ့ month_state က နှစ်တစ်နှစ် (လတစ်လ) လုံး ကိုက်ရင် True၊ တစ်ရက်မှ မကိုက်ရင် False၊ မသေချာရင် None ပြန်ပေးပြီး
+# False ဖြစ်တဲ့ နှစ်တွေ၊ လတွေကို ရက်အလိုက် မစစ်ဘဲ ကျော်သွားပါတယ်။
+# select က ပေးထားတဲ့ index တွေထဲက ကိုက်တဲ့ index တွေကို အစဉ်အတိုင်း ပြန်ပေးပါတယ်။ (subclass တိုင်း ရေးရပါမယ်)
+class Predicate(ABC):
+    def year_state(self, year_info: YearInfo) -> Optional[bool]:
+        return None
+
+    def month_state(self, year_info: YearInfo, month_info: MonthInfo) -> Optional[bool]:
+        return None
+
+    @abstractmethod
+    def select(self, columns: YearColumns, indexes: List[int]) -> List[int]:
+        pass
+
+    def __and__(self, other: "Predicate") -> "Predicate":
+        if not isinstance(other, Predicate):
+            return NotImplemented
+
+        return And(self, other)
+
+    def __or__(self, other: "Predicate") -> "Predicate":
+        if not isinstance(other, Predicate):
+            return NotImplemented
+
+        return Or(self, other)
+
+    def __invert__(self) -> "Predicate":
+        return Not(self)
+
+
+class And(Predicate):
+    def __init__(self, *predicates: Predicate) -> None:
+        self.predicates = tuple(predicates)
+
+    def year_state(self, year_info: YearInfo) -> Optional[bool]:
+        return _all_states(predicate.year_state(year_info) for predicate in self.predicates)
+
+    def month_state(self, year_info: YearInfo, month_info: MonthInfo) -> Optional[bool]:
+        return _all_states(predicate.month_state(year_info, month_info) for predicate in self.predicates)
+
+    def select(self, columns: YearColumns, indexes: List[int]) -> List[int]:
+        for predicate in self.predicates:
+            if not indexes:
+                break
+
+            indexes = predicate.select(columns, indexes)
+
+        return indexes
+
+    def __repr__(self) -> str:
+        return "(" + " & ".join(repr(predicate) for predicate in self.predicates) + ")"
+
+
+class Or(Predicate):
+    def __init__(self, *predicates: Predicate) -> None:
+        self.predicates = tuple(predicates)
+
+    def year_state(self, year_info: YearInfo) -> Optional[bool]:
+        return _any_states(predicate.year_state(year_info) for predicate in self.predicates)
+
+    def month_state(self, year_info: YearInfo, month_info: MonthInfo) -> Optional[bool]:
+        return _any_states(predicate.month_state(year_info, month_info) for predicate in self.predicates)
+
+    def select(self, columns: YearColumns, indexes: List[int]) -> List[int]:
+        selected = set()
+        remaining = indexes
+        for predicate in self.predicates:
+            if not remaining:
+                break
+
+            matched = predicate.select(columns, remaining)
+            selected.update(matched)
+            remaining = [index for index in remaining if index not in selected]
+
+        return [index for index in indexes if index in selected]
+
+    def __repr__(self) -> str:
+        return "(" + " | ".join(repr(predicate) for predicate in self.predicates) + ")"
+
+
+class Not(Predicate):
+    def __init__(self, predicate: Predicate) -> None:
+        self.predicate = predicate
+
+    def year_state(self, year_info: YearInfo) -> Optional[bool]:
+        return _invert_state(self.predicate.year_state(year_info))
+
+    def month_state(self, year_info: YearInfo, month_info: MonthInfo) -> Optional[bool]:
+        return _invert_state(self.predicate.month_state(year_info, month_info))
+
+    def select(self, columns: YearColumns, indexes: List[int]) -> List[int]:
+        matched = set(self.predicate.select(columns, indexes))
+
+        return [index for index in indexes if index not in matched]
+
+    def __repr__(self) -> str:
+        return f"~{self.predicate!r}"
+
+
+def _all_states(states: Iterable[Optional[bool]]) -> Optional[bool]:
+    result = True
+    for state in states:
+        if state is False:
+            return False
+
+        if state is None:
+            result = None
+
+    return result
+
+
+def _any_states(states: Iterable[Optional[bool]]) -> Optional[bool]:
+    result = False
+    for state in states:
+        if state is True:
+            return True
+
+        if state is None:
+            result = None
+
+    return result
+
+
+def _invert_state(state: Optional[bool]) -> Optional[bool]:
+    return None if state is None else not state
+
+
+# column တစ်ခုရဲ့ တန်ဖိုးက values ထဲမှာ ပါတဲ့ ရက်တွေကို ရွေးပါတယ်။
+class _ColumnPredicate(Predicate):
+    column = None
+
+    def __init__(self, *values) -> None:
+        self.labels = values
+        self.values = frozenset(getattr(value, 'value', value) for value in values)
+
+    def select(self, columns: YearColumns, indexes: List[int]) -> List[int]:
+        column = getattr(columns, self.column)
+        values = self.values
+
+        return [index for index in indexes if column[index] in values]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({', '.join(str(getattr(label, 'name', label)) for label in self.labels)})"
+
+
+class YearIs(Predicate):
+    def __init__(self, start_year: int, end_year: int = None) -> None:
+        self.start_year = start_year
+        self.end_year = start_year if end_year is None else end_year
+
+    def year_state(self, year_info: YearInfo) -> Optional[bool]:
+        return self.start_year <= year_info.year <= self.end_year
+
+    def month_state(self, year_info: YearInfo, month_info: MonthInfo) -> Optional[bool]:
+        return self.year_state(year_info)
+
+    def select(self, columns: YearColumns, indexes: List[int]) -> List[int]:
+        return indexes if self.year_state(columns.year_info) else []
+
+    def __repr__(self) -> str:
+        return f"YearIs({self.start_year}, {self.end_year})"
+
+
+class YearTypeIs(Predicate):
+    def __init__(self, *year_types: YearType) -> None:
+        self.year_types = frozenset(year_types)
+
+    def year_state(self, year_info: YearInfo) -> Optional[bool]:
+        return year_info.year_type in self.year_types
+
+    def month_state(self, year_info: YearInfo, month_info: MonthInfo) -> Optional[bool]:
+        return self.year_state(year_info)
+
+    def select(self, columns: YearColumns, indexes: List[int]) -> List[int]:
+        return indexes if self.year_state(columns.year_info) else []
+
+    def __repr__(self) -> str:
+        return f"YearTypeIs({', '.join(year_type.name for year_type in self.year_types)})"
+
+
+class MonthIs(_ColumnPredicate):
+    column = 'month'
+
+    def __init__(self, *months: MyanmarMonth) -> None:
+        super().__init__(*months)
+
+    def month_state(self, year_info: YearInfo, month_info: MonthInfo) -> Optional[bool]:
+        return month_info.month.value in self.values
+
+
+# လရဲ့ ရက် (၁ - ၃၀)
+class DayIs(_ColumnPredicate):
+    column = 'day'
+
+    def month_state(self, year_info: YearInfo, month_info: MonthInfo) -> Optional[bool]:
+        first_day = month_info.first_jdn - month_info.start_jdn + 1
+        last_day = month_info.last_jdn - month_info.start_jdn + 1
+        if not any(first_day <= day <= last_day for day in self.values):
+            return False
+
+        return None
+
+
+# လဆန်း၊ လဆုတ် ရက် (၁ - ၁၅)
+class FornightDayIs(_ColumnPredicate):
+    column = 'fornight_day'
+
+
+class MoonPhaseIs(_ColumnPredicate):
+    column = 'moon_phase'
+
+    def __init__(self, *moon_phases: MoonPhase) -> None:
+        super().__init__(*moon_phases)
+
+
+class WeekDayIs(_ColumnPredicate):
+    column = 'week_day'
+
+    def __init__(self, *week_days: MMWeekDay) -> None:
+        super().__init__(*week_days)
+
+
+# ပေးထားတဲ့ flag အားလုံး ပါတဲ့ ရက်တွေကို ရွေးပါတယ်။ တစ်ခုခု ပါရင် ရမယ်ဆိုရင် | နဲ့ ပေါင်းပါ။
+class HasAstroFlags(Predicate):
+    def __init__(self, flags: AstroFlags) -> None:
+        self.flags = AstroFlags(flags)
+
+    def select(self, columns: YearColumns, indexes: List[int]) -> List[int]:
+        column = columns.astro_flags
+        mask = int(self.flags)
+
+        return [index for index in indexes if column[index] & mask == mask]
+
+    def __repr__(self) -> str:
+        return f"HasAstroFlags({self.flags!r})"
+
+
+# holidays မပေးရင် ရုံးပိတ်ရက် တစ်ခုခု ရှိတဲ့ ရက်တွေကို ရွေးပါတယ်။
+class HasHoliday(Predicate):
+    def __init__(self, *holidays: Holiday) -> None:
+        self.holidays = frozenset(holidays)
+
+    def select(self, columns: YearColumns, indexes: List[int]) -> List[int]:
+        year_holidays = columns.holidays
+        if not year_holidays:
+            return []
+
+        start_jdn = columns.start_jdn
+        holidays = self.holidays
+        result = []
+        for index in indexes:
+            day_holidays = year_holidays.get(start_jdn + index)
+            if day_holidays and (not holidays or not holidays.isdisjoint(day_holidays)):
+                result.append(index)
+
+        return result
+
+    def __repr__(self) -> str:
+        return f"HasHoliday({', '.join(holiday.name for holiday in self.holidays)})"
+
+
+def _to_jdn(value) -> int:
+    if isinstance(value, int):
+        return value
+
+    from .mm_date import MMDate
+
+    mm_date = value if isinstance(value, MMDate) else MMDate(value)
+    return mm_date.jdn
+
+
+# start မှ end (မပါ) အထိ predicate နဲ့ ကိုက်တဲ့ ဂျူလီယန်ရက်တွေကို အစဉ်လိုက် ထုတ်ပေးပါတယ်။
+# start နဲ့ end က ဂျူလီယန်ရက် (int)၊ date ဒါမှမဟုတ် MMDate ဖြစ်နိုင်ပါတယ်။
+# ဥပမာ find_dates(MoonPhaseIs(MoonPhase.FullMoon) & HasAstroFlags(AstroFlags.Yatyaza) & ~HasAstroFlags(AstroFlags.Pyathada), start, end)
+def find_dates(predicate: Predicate, start, end):
+    start_jdn = _to_jdn(start)
+    end_jdn = _to_jdn(end)
+    if end_jdn <= start_jdn:
+        return
+
+    for year in range(get_year_from_jdn(start_jdn), get_year_from_jdn(end_jdn - 1) + 1):
+        year_info = YearInfoCache.get(year)
+        if predicate.year_state(year_info) is False:
+            continue
+
+        columns = YearColumnsCache.get(year)
+        first_index = max(start_jdn - columns.start_jdn, 0)
+        last_index = min(end_jdn - columns.start_jdn, len(columns.day))
+
+        for month_info, month_start, month_end in columns.months:
+            month_start = max(month_start, first_index)
+            month_end = min(month_end, last_index)
+            if month_start >= month_end:
+                continue
+
+            state = predicate.month_state(year_info, month_info)
+            if state is False:
+                continue
+
+            indexes = list(range(month_start, month_end))
+            if state is None:
+                indexes = predicate.select(columns, indexes)
+
+            for index in indexes:
+                yield columns.start_jdn + index
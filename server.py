@@ -0,0 +1,324 @@
+import json
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .cache import LRUCache
+from .constants import START_OF_GREGORIAN_JDN
+from .convert import DEFAULT_COLUMNS, _column_getters
+from .enums.moon_phase import MoonPhase
+from .enums.myanmar_month import MyanmarMonth
+from .holidays import HolidayCalendar
+from .julian_day import date_to_jdn, jdn_to_date, jdn_to_iso_date
+from .mm_date import MMDate
+from .year_info import MIN_JDN, MIN_YEAR
+
+# python -m mm_calendar serve နဲ့ run တဲ့ standard library သက်သက် HTTP server ဖြစ်ပါတယ်။
+# HTTP/1.1 keep-alive သုံးပြီး endpoint တိုင်းမှာ GET (query string နဲ့ တစ်ရက်) ရော POST (JSON body နဲ့ အများကြီး) ရော ရပါတယ်။
+#
+#   /convert   date=YYYY-MM-DD                                   {"dates": ["2024-05-01", ...]}
+#   /reverse   year=&month=&day= (ဒါမှမဟုတ် moon_phase=&fornight_day=)   {"dates": [{"year": 1386, "month": "Waso", "day": 20}, ...]}
+#   /format    date=&format=                                     {"dates": [...], "format": "&y &M &P &f"}
+#   /holidays  start=&end= (end မပါ)                             {"ranges": [{"start": ..., "end": ...}, ...]}
+#
+# /convert နဲ့ /reverse မှာ fields (comma ခြားထားတဲ့ string ဒါမှမဟုတ် JSON list) နဲ့ convert.COLUMNS ထဲက column တွေ၊ get_date_str format တွေကို ရွေးနိုင်ပါတယ်။
+# POST ရလဒ်က {"results": [...]} ဖြစ်ပြီး မမှန်တဲ့ item အတွက် {"error": "..."} ကို ထည့်ပေးပါတယ်။
+
+MAX_BATCH = 10000
+MAX_BODY = 8 * 1024 * 1024
+
+
+class RequestError(ValueError):
+    def __init__(self, message: str, status: int = 400) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+# (ဂျူလီယန်ရက်, fields) အလိုက် ရက်တစ်ရက်စာ ရလဒ် dict ကို cache လုပ်ပါတယ်။ (ပြန်ပေးတဲ့ dict ကို မပြင်ရပါ)
+class ResponseCache:
+    _cache = LRUCache(65536)
+
+    @classmethod
+    def get(cls, key: Tuple[int, Tuple[str, ...]], builder: Callable[[Hashable], dict]) -> dict:
+        return cls._cache.get(key, builder)
+
+    @classmethod
+    def set_max_size(cls, max_size: int) -> None:
+        cls._cache.set_max_size(max_size)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._cache.clear()
+
+    @classmethod
+    def cache_info(cls) -> dict:
+        return cls._cache.cache_info()
+
+
+def _build_row(key: Hashable) -> dict:
+    jdn, fields = key
+    mm_date = MMDate.from_jdn(jdn)
+    # ဂျူလီယန် ပြက္ခဒိန်မှာပဲ ရှိတဲ့ ဖေဖော်ဝါရီ ၂၉ ရက် (ဥပမာ 1700-02-29) ကို en_date နဲ့ မဖော်ပြနိုင်တာမို့ ဂျူလီယန်ရက်ကနေ ရေးပါတယ်။
+    row = {"jdn": jdn, "date": jdn_to_iso_date(jdn)}
+    row.update(zip(fields, (getter(mm_date) for getter in _column_getters(fields))))
+
+    return row
+
+
+def _row(jdn: int, fields: Tuple[str, ...]) -> dict:
+    return ResponseCache.get((jdn, fields), _build_row)
+
+
+def _parse_fields(value) -> Tuple[str, ...]:
+    if value is None:
+        return DEFAULT_COLUMNS
+
+    fields = tuple(field.strip() for field in value.split(",")) if isinstance(value, str) else tuple(value)
+    if not fields or not all(isinstance(field, str) and field for field in fields):
+        raise RequestError("fields must be a non-empty list of column names or formats")
+
+    try:
+        _column_getters(fields)
+    except ValueError as error:
+        raise RequestError(str(error))
+
+    return fields
+
+
+# date.fromisoformat က ဂျူလီယန် ပြက္ခဒိန်မှာပဲ ရှိတဲ့ ဖေဖော်ဝါရီ ၂၉ ရက် (ဥပမာ 1700-02-29) ကို လက်မခံတာမို့ ကိုယ်တိုင် စစ်ပါတယ်။
+def _julian_only_jdn(value: str) -> Optional[int]:
+    parts = value.split("-")
+    if len(parts) != 3 or parts[1:] != ["02", "29"] or len(parts[0]) != 4 or not parts[0].isdigit():
+        return None
+
+    year = int(parts[0])
+    jdn = date_to_jdn(year, 2, 29)
+
+    return jdn if year % 4 == 0 and jdn < START_OF_GREGORIAN_JDN else None
+
+
+def _parse_jdn(value) -> int:
+    if not isinstance(value, str):
+        raise RequestError(f"date must be a YYYY-MM-DD string, got {value!r}")
+
+    try:
+        en_date = date.fromisoformat(value.strip())
+        jdn = date_to_jdn(en_date.year, en_date.month, en_date.day)
+    except ValueError:
+        jdn = _julian_only_jdn(value.strip())
+        if jdn is None:
+            raise RequestError(f"invalid date: {value!r}")
+
+    if jdn < MIN_JDN:
+        raise RequestError(f"date {value!r} is before Myanmar year {MIN_YEAR} ({jdn_to_date(MIN_JDN).isoformat()})")
+
+    return jdn
+
+
+def _parse_enum(enum_class, value, name: str):
+    try:
+        if isinstance(value, str) and not value.isdigit():
+            return enum_class[value]
+
+        return enum_class(int(value))
+    except (KeyError, ValueError, TypeError):
+        choices = ", ".join(member.name for member in enum_class)
+        raise RequestError(f"invalid {name}: {value!r} (use one of {choices} or its number)")
+
+
+def _parse_int(value, name: str) -> int:
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        raise RequestError(f"{name} must be an integer, got {value!r}")
+
+
+def _reverse_jdn(fields: dict) -> int:
+    if not isinstance(fields, dict) or "year" not in fields or "month" not in fields:
+        raise RequestError("reverse needs year, month and either day or moon_phase (and fornight_day)")
+
+    year = _parse_int(fields["year"], "year")
+    month = _parse_enum(MyanmarMonth, fields["month"], "month")
+
+    # from_mm_date က မရှိတဲ့ ရက်စွဲကိုလည်း တွက်ပေးတာမို့ (ဥပမာ တန်ခူး ၄၀ ရက်) အရင်စစ်ပြီး 400 ပြန်ပေးပါတယ်။
+    try:
+        if "day" in fields:
+            day = _parse_int(fields["day"], "day")
+        elif "moon_phase" in fields:
+            # လပြည့်နဲ့ လကွယ် မှာ fornight_day မပါလည်း ရပါတယ်။
+            moon_phase = _parse_enum(MoonPhase, fields["moon_phase"], "moon_phase")
+            fornight_day = fields.get("fornight_day")
+            fornight_day = None if fornight_day is None else _parse_int(fornight_day, "fornight_day")
+            day = MMDate._get_checked_day_from_fornight_day(year, month, moon_phase, fornight_day)
+        else:
+            raise RequestError("reverse needs either day or moon_phase (and fornight_day)")
+
+        return MMDate._get_checked_jdn(year, month, day)
+    except RequestError:
+        raise
+    except ValueError as error:
+        raise RequestError(str(error))
+
+
+def _holidays(start, end) -> List[dict]:
+    start_jdn = _parse_jdn(start)
+    end_jdn = _parse_jdn(end)
+    if end_jdn - start_jdn > 366 * 100:
+        raise RequestError("holiday ranges are limited to 100 years")
+
+    return [
+        {"jdn": jdn, "date": jdn_to_iso_date(jdn), "holidays": [holiday.name for holiday in holidays]}
+        for jdn, holidays in HolidayCalendar.holidays_between(jdn_to_date(start_jdn), jdn_to_date(end_jdn))
+    ]
+
+
+def convert_one(query: dict) -> dict:
+    return _row(_parse_jdn(query.get("date")), _parse_fields(query.get("fields")))
+
+
+def reverse_one(query: dict) -> dict:
+    return _row(_reverse_jdn(query), _parse_fields(query.get("fields")))
+
+
+def format_one(query: dict) -> dict:
+    format = query.get("format", "&y &M &P &f")
+    row = _row(_parse_jdn(query.get("date")), _parse_fields([format]))
+
+    return {"jdn": row["jdn"], "date": row["date"], "text": row[format]}
+
+
+def holidays_one(query: dict) -> dict:
+    return {"holidays": _holidays(query.get("start"), query.get("end"))}
+
+
+# batch တစ်ခုထဲက item တစ်ခု မှားရင် အဲဒီ item နေရာမှာပဲ error ထည့်ပြီး ကျန်တာတွေကို ဆက်တွက်ပါတယ်။
+def _batch(items, convert: Callable) -> dict:
+    if not isinstance(items, list):
+        raise RequestError("expected a JSON list")
+
+    if len(items) > MAX_BATCH:
+        raise RequestError(f"batches are limited to {MAX_BATCH} items", 413)
+
+    results = []
+    for item in items:
+        try:
+            results.append(convert(item))
+        except (ValueError, TypeError, OverflowError) as error:
+            results.append({"error": str(error)})
+
+    return {"results": results}
+
+
+def convert_batch(body: dict) -> dict:
+    fields = _parse_fields(body.get("fields"))
+    return _batch(body.get("dates"), lambda value: _row(_parse_jdn(value), fields))
+
+
+def reverse_batch(body: dict) -> dict:
+    fields = _parse_fields(body.get("fields"))
+    return _batch(body.get("dates"), lambda value: _row(_reverse_jdn(value), fields))
+
+
+def format_batch(body: dict) -> dict:
+    return _batch(body.get("dates"), lambda value: format_one({"date": value, "format": body.get("format", "&y &M &P &f")}))
+
+
+def holidays_batch(body: dict) -> dict:
+    return _batch(body.get("ranges"), lambda value: holidays_one(value if isinstance(value, dict) else {}))
+
+
+# path -> (GET handler, POST handler)
+ROUTES: Dict[str, Tuple[Callable[[dict], dict], Callable[[dict], dict]]] = {
+    "/convert": (convert_one, convert_batch),
+    "/reverse": (reverse_one, reverse_batch),
+    "/format": (format_one, format_batch),
+    "/holidays": (holidays_one, holidays_batch),
+}
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 ဆိုရင် connection ကို client က မပိတ်မချင်း ပြန်သုံးပါတယ်။ (Content-Length အမြဲ ပို့ရပါတယ်)
+    protocol_version = "HTTP/1.1"
+    server_version = "mm_calendar"
+    # header နဲ့ body ကို သီးခြား ရေးတာမို့ Nagle ကို မပိတ်ရင် keep-alive request တိုင်း delayed ACK (~40ms) စောင့်ရပါတယ်။
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        self._handle(url.path, 0, query)
+
+    def do_POST(self) -> None:
+        url = urlsplit(self.path)
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            return self._send(411, {"error": "Content-Length is required"})
+
+        # အနုတ် ဆိုရင် rfile.read(-1) က client ချိတ်ဆက်မှု မပိတ်မချင်း စောင့်နေမှာမို့ မဖတ်ခင် ပယ်ပါတယ်။
+        if length < 0:
+            self.close_connection = True
+            return self._send(400, {"error": "Content-Length must not be negative"})
+
+        if length > MAX_BODY:
+            self.close_connection = True
+            return self._send(413, {"error": f"request bodies are limited to {MAX_BODY} bytes"})
+
+        try:
+            body = json.loads(self.rfile.read(length))
+        except ValueError:
+            return self._send(400, {"error": "request body must be valid JSON"})
+
+        if not isinstance(body, dict):
+            return self._send(400, {"error": "request body must be a JSON object"})
+
+        self._handle(url.path, 1, body)
+
+    def _handle(self, path: str, method: int, data: dict) -> None:
+        route = ROUTES.get(path.rstrip("/") or "/")
+        if route is None:
+            return self._send(404, {"error": f"unknown path: {path}", "paths": sorted(ROUTES)})
+
+        try:
+            self._send(200, route[method](data))
+        except RequestError as error:
+            self._send(error.status, {"error": str(error)})
+        except (ValueError, TypeError, OverflowError) as error:
+            self._send(400, {"error": str(error)})
+
+    def _send(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload, ensure_ascii = False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class CalendarServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], verbose: bool = False) -> None:
+        self.verbose = verbose
+        super().__init__(address, RequestHandler)
+
+
+# port 0 ဆိုရင် လွတ်နေတဲ့ port ကို ယူပြီး server.server_address နဲ့ ကြည့်နိုင်ပါတယ်။
+def make_server(host: str = "127.0.0.1", port: int = 8000, verbose: bool = False) -> CalendarServer:
+    return CalendarServer((host, port), verbose)
+
+
+def serve(host: str = "127.0.0.1", port: int = 8000, verbose: bool = False, cache_size: Optional[int] = None) -> None:
+    if cache_size is not None:
+        ResponseCache.set_max_size(cache_size)
+
+    with make_server(host, port, verbose) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,91 @@
+from datetime import datetime
+from typing import Tuple
+
+from .cache import LRUCache
+from .time_obj import TimeObj
+from .year_info import YearInfo, YearInfoCache
+
+
+# မြန်မာနှစ် တစ်နှစ်ရဲ့ သင်္ကြန် (အကြို - အကျ - အကြတ် - အတက် - နှစ်ဆန်းတစ်ရက်) ဂျူလီယန်ရက်တွေ ဖြစ်ပါတယ်။
+# akya_time နဲ့ atat_time ကတော့ အကျချိန်၊ အတက်ချိန် (အချိန်ပါတဲ့ ဂျူလီယန်ရက်စွဲ) ဖြစ်ပါတယ်။
+class ThingyanInfo:
+    __slots__ = ('year', 'akya_time', 'atat_time', 'akyo_day', 'akya_day', 'atat_day', 'new_year_day')
+
+    def __init__(self, year: int, akya_time: float, atat_time: float) -> None:
+        self.year = year
+        self.akya_time = akya_time
+        self.atat_time = atat_time
+        self.akya_day = round(akya_time)
+        self.atat_day = round(atat_time)
+        self.akyo_day = self.akya_day - 1
+        # အတက်နေ့ရဲ့ နောက်တစ်နေ့ (နှစ်ဆန်းတစ်ရက်နေ့)မှ မြန်မာနှစ်သစ် စပါတယ်။
+        self.new_year_day = self.atat_day + 1
+
+    # အကျနေ့နဲ့ အတက်နေ့ကြားက နေ့တွေဟာ အကြတ်နေ့ (တစ်ရက် ဒါမှမဟုတ် နှစ်ရက်) ဖြစ်ပါတယ်။
+    @property
+    def akyat_days(self) -> Tuple[int, ...]:
+        return tuple(range(self.akya_day + 1, self.atat_day))
+
+    @property
+    def akya_moment(self) -> TimeObj:
+        return _time_of(self.akya_time)
+
+    @property
+    def atat_moment(self) -> TimeObj:
+        return _time_of(self.atat_time)
+
+    @property
+    def akya_datetime(self) -> datetime:
+        return _to_datetime(self.akya_time)
+
+    @property
+    def atat_datetime(self) -> datetime:
+        return _to_datetime(self.atat_time)
+
+    def __repr__(self) -> str:
+        return f"ThingyanInfo(year={self.year}, akya_day={self.akya_day}, atat_day={self.atat_day})"
+
+
+# ဂျူလီယန်ရက်စွဲက မွန်းတည့်ကနေ စတာမို့ ၀.၅ ပေါင်းပြီး ညသန်းခေါင်ကစတဲ့ အချိန်ကို ယူပါတယ်။
+def _time_of(jd: float) -> TimeObj:
+    from .mm_date import MMDate
+
+    return MMDate._calculate_time(jd + 0.5 - (int) (jd + 0.5))
+
+
+def _to_datetime(jd: float) -> datetime:
+    from .mm_date import MMDate
+
+    return MMDate._julian_date_to_western(jd)
+
+
+def build_thingyan_info(year: int) -> ThingyanInfo:
+    year_info: YearInfo = YearInfoCache.get(year)
+
+    return ThingyanInfo(year, year_info.thingyan_akya_time, year_info.thingyan_atat_time)
+
+
+class ThingyanCache:
+    _cache = LRUCache(2048)
+
+    @classmethod
+    def get(cls, year: int) -> ThingyanInfo:
+        return cls._cache.get(year, build_thingyan_info)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._cache.clear()
+
+    @classmethod
+    def cache_info(cls) -> dict:
+        return cls._cache.cache_info()
+
+
+def get_thingyan(year: int) -> ThingyanInfo:
+    return ThingyanCache.get(year)
+
+
+# start_year မှ end_year (အပါ) အထိ နှစ်တွေရဲ့ သင်္ကြန်ကို အစဉ်လိုက် ထုတ်ပေးပါတယ်။
+def iter_thingyan(start_year: int, end_year: int):
+    for year in range(start_year, end_year + 1):
+        yield ThingyanCache.get(year)
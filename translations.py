@@ -0,0 +1,37 @@
+from types import MappingProxyType
+
+# မြန်မာဘာသာ ပြန်ဆိုဖို့ ဇယားတွေကို MMDate အားလုံး မျှသုံးနိုင်အောင် module အဆင့်မှာ ပြောင်းလဲလို့မရတဲ့ ပုံစံနဲ့ ထားပါတယ်။
+DIGITS_MAPPING = MappingProxyType({'0': '၀', '1': '၁', '2': '၂', '3': '၃', '4': '၄', '5': '၅', '6': '၆', '7': '၇', '8': '၈', '9': '၉'})
+MONTH_MAPPING = ('ပ-ဝါဆို', 'တန်ခူး', 'ကဆုန်', 'နယုန်', 'ဝါဆို', 'ဝါခေါင်', 'တော်သလင်း', 'သီတင်းကျွတ်', 'တန်ဆောင်မုန်း', 'နတ်တော်', 'ပြာသို', 'တပိုတွဲ', 'တပေါင်း', 'နှောင်းတန်ခူး', 'နှောင်းကဆုန်')
+MOON_PHASE_MAPPING = ('လဆန်း', 'လပြည့်', 'လဆုတ်', 'လကွယ်')
+WEEK_DAY_MAPPING = ("စနေ", "တနင်္ဂနွေ", "တနင်္လာ", "အင်္ဂါ", "ဗုဒ္ဓဟူး", "ကြာသပတေး", "သောကြာ")
+DIRECTION_MAPPING = ('အနောက်', 'မြောက်', 'အရှေ့', 'တောင်')
+
+# AstroFlags အစဉ်အတိုင်း
+ASTRO_DAY_MAPPING = ('အဖိတ်နေ့', 'ဥပုသ်နေ့', 'ရက်ရာဇာ', 'ပြဿဒါး', 'သမားညို', 'သမားဖြူ', 'အမြိတ္တစုတ်', 'ဝါရမိတ္တုကြီး', 'ဝါရမိတ္တုငယ်', 'ရက်ပုပ်', 'နဂါးပေါ်', 'ရက်ယုတ်မာ', 'မဟာရက်ကြမ်း', 'ရှမ်းရက်')
+
+# Holiday member နာမည် အလိုက်
+HOLIDAY_MAPPING = MappingProxyType({
+    'Normal': 'ရုံးပိတ်ရက်',
+    'MyanmarNewYearDay': 'မြန်မာနှစ်ဆန်းတစ်ရက်နေ့',
+    'ThingyanAtatDay': 'သင်္ကြန်အတက်နေ့',
+    'ThingyanAkyaDay': 'သင်္ကြန်အကျနေ့',
+    'ThingyanAkyatDay': 'သင်္ကြန်အကြတ်နေ့',
+    'ThingyanAkyoDay': 'သင်္ကြန်အကြိုနေ့',
+    'ThingyanHoliday': 'သင်္ကြန် ရုံးပိတ်ရက်',
+    'NewYearDay': 'နိုင်ငံတကာ နှစ်သစ်ကူးနေ့',
+    'IndependenceDay': 'လွတ်လပ်ရေးနေ့',
+    'UnionDay': 'ပြည်ထောင်စုနေ့',
+    'PeasantsDay': 'တောင်သူလယ်သမားနေ့',
+    'ResistanceDay': 'တော်လှန်ရေးနေ့',
+    'LabourDay': 'အလုပ်သမားနေ့',
+    'MartyrsDay': 'အာဇာနည်နေ့',
+    'ChristmasDay': 'ခရစ္စမတ်နေ့',
+    'BuddhaDay': 'ကဆုန်လပြည့် ဗုဒ္ဓနေ့',
+    'StartOfBuddhistLent': 'ဝါဆိုလပြည့် ဓမ္မစကြာနေ့',
+    'EndOfBuddhistLent': 'သီတင်းကျွတ်လပြည့် အဘိဓမ္မာနေ့',
+    'Tazaungdaing': 'တန်ဆောင်မုန်းလပြည့် တန်ဆောင်တိုင်နေ့',
+    'NationalDay': 'အမျိုးသားနေ့',
+    'KarenNewYearDay': 'ကရင်နှစ်သစ်ကူးနေ့',
+    'TabaungPwe': 'တပေါင်းလပြည့်နေ့',
+})
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from .first_era_watat_strategy import FirstEraWatatStrategy
 
 # ပထမခေတ်က ရတနာပူရ အင်းဝခေတ် လထပ် စည်းကမ်းကို သုံးခဲ့တဲ့ ခေတ်ဖြစ်ပြီး 
@@ -10,9 +12,9 @@ from .first_era_watat_strategy import FirstEraWatatStrategy
 # မြန်မာ ပြက္ခဒိန် ပထမခေတ်မှာ တွက်နည်း သုံးမျိုးရှိခဲ့ပါတယ်။
 # မြန်မာနှစ် ၀ ခုနှစ်မှ ၇၉၇ ခုနှစ်ထိ (ပုပ္ပားစောရဟန်း သက္ကရာဇ် ဖြိုကြွင်းမှ စသည်။) မကာရန္တကျမ်း တွက်နည်းကိုသုံးသည်။
 class FirstEraMakranata1WatatStrategy(FirstEraWatatStrategy):
-    def __init__(self, year) -> None:
-        super().__init__(year)
-        self.to_check_months = -1
-        self.watat_offset = -1.1
-        self.watat_exceptions = {}
-        self.offset_exceptions = {205: -0.1, 246: -0.1, 471: -0.1, 572: -2.1, 651: -0.1, 653: 0.9, 656: -0.1, 672: -0.1, 729: -0.1, 767: -2.1}
\ No newline at end of file
+    __slots__ = ()
+
+    to_check_months = -1
+    watat_offset = -1.1
+    watat_exceptions = MappingProxyType({})
+    offset_exceptions = MappingProxyType({205: -0.1, 246: -0.1, 471: -0.1, 572: -2.1, 651: -0.1, 653: 0.9, 656: -0.1, 672: -0.1, 729: -0.1, 767: -2.1})
\ No newline at end of file
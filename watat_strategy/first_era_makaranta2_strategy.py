@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from .first_era_watat_strategy import FirstEraWatatStrategy
 
 # ပထမခေတ်က ရတနာပူရ အင်းဝခေတ် လထပ် စည်းကမ်းကို သုံးခဲ့တဲ့ ခေတ်ဖြစ်ပြီး 
@@ -10,10 +12,10 @@ from .first_era_watat_strategy import FirstEraWatatStrategy
 # မြန်မာ ပြက္ခဒိန် ပထမခေတ်မှာ တွက်နည်း သုံးမျိုးရှိခဲ့ပါတယ်။
 # မြန်မာနှစ် ၇၉၈ ခုနှစ် မှ ၁၀၉၉ ခုနှစ်ထိ (အင်းဝမိုးညှင်းမင်း လက်ထက်မှ စသည်။) မကာရန္တကျမ်း တွက်နည်းကိုသုံးသည်။
 class FirstEraMakranata2WatatStrategy(FirstEraWatatStrategy):
-    def __init__(self, year: int) -> None:
-        super().__init__(year)
-        self.to_check_months = -1
-        self.watat_offset = -1.1
-        self.watat_exceptions = {}
-        self.offset_exceptions = {813: -2.1, 849: -2.1, 851: -2.1, 854: -2.1, 927: -2.1, 933: -2.1, 936: -2.1,
-			938: -2.1, 949: -2.1, 952: -2.1, 963: -2.1, 968: -2.1, 1039: -2.1}
\ No newline at end of file
+    __slots__ = ()
+
+    to_check_months = -1
+    watat_offset = -1.1
+    watat_exceptions = MappingProxyType({})
+    offset_exceptions = MappingProxyType({813: -2.1, 849: -2.1, 851: -2.1, 854: -2.1, 927: -2.1, 933: -2.1, 936: -2.1,
+        938: -2.1, 949: -2.1, 952: -2.1, 963: -2.1, 968: -2.1, 1039: -2.1})
\ No newline at end of file
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from .third_era_watat_strategy import ThirdEraWatatStrategy
 
 # ပထမခေတ်က ရတနာပူရ အင်းဝခေတ် လထပ် စည်းကမ်းကို သုံးခဲ့တဲ့ ခေတ်ဖြစ်ပြီး 
@@ -10,14 +12,14 @@ from .third_era_watat_strategy import ThirdEraWatatStrategy
 # မြန်မာ ပြက္ခဒိန် ပထမခေတ်မှာ တွက်နည်း သုံးမျိုးရှိခဲ့ပါတယ်။
 # မြန်မာနှစ် ၁၁၀၀ ခုနှစ်မှ ၁၂၁၆ ခုနှစ်ထိိကို သံဒိဋ္ဌတွက်နည်းကိုသုံးပါတယ်။
 class FirstEraWatatStrategy(ThirdEraWatatStrategy):
-    def __init__(self, year: int) -> None:
-        super().__init__(year)
-        self.to_check_months = -1
-        self.watat_offset = -0.85
-        self.watat_exceptions = {1202: False, 1201: True}
-        self.offset_exceptions = {1120: 0.15, 1126: -1.85, 1150: 0.15, 1172: -1.85, 1207: 0.15}
+    __slots__ = ()
+
+    to_check_months = -1
+    watat_offset = -0.85
+    watat_exceptions = MappingProxyType({1202: False, 1201: True})
+    offset_exceptions = MappingProxyType({1120: 0.15, 1126: -1.85, 1150: 0.15, 1172: -1.85, 1207: 0.15})
 
-    def is_watat(self) -> bool:
+    def _calculate_is_watat(self) -> bool:
         if self.year in self.watat_exceptions:
             return self.watat_exceptions.get(self.year)
 
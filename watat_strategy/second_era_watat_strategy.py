@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from .third_era_watat_strategy import ThirdEraWatatStrategy
 
 # သူရိယသိဒ္ဓန္တကျမ်းကို မြန်မာဘာသာ ပြန်ဆိုခဲ့တဲ့ ညောင်ကန်ဆရာတော်ရဲ့ နည်းကိုသုံးတဲ့ နှစ်ပေါင်းတစ်ရာ ကြာတဲ့ခေတ်ဖြစ်ပါတယ်။ 
@@ -9,9 +11,9 @@ from .third_era_watat_strategy import ThirdEraWatatStrategy
 # ရက်ပို မပို ဆုံးဖြတ်မယ့်အချိန်ကို သတ်မှတ်ထားတဲ့ လအရေအတွက်က ရှစ်လအစား လေးလဖြစ်ပြီး 
 # ကျန်တာက တတိယခေတ်နဲ့ အတူတူပဲ ဖြစ်ပါတယ်။
 class SecondEraWatatStrategy(ThirdEraWatatStrategy):
-    def __init__(self, year) -> None:
-        super().__init__(year)
-        self.to_check_months = 4
-        self.watat_offset = -1
-        self.watat_exceptions = {1264: False, 1263: True} # key is year and value is whether watat or not
-        self.offset_exceptions = {1234: 0, 1261: -2} # key is year and value is offset
\ No newline at end of file
+    __slots__ = ()
+
+    to_check_months = 4
+    watat_offset = -1
+    watat_exceptions = MappingProxyType({1264: False, 1263: True}) # key is year and value is whether watat or not
+    offset_exceptions = MappingProxyType({1234: 0, 1261: -2}) # key is year and value is offset
\ No newline at end of file
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from mm_calendar.constants import LUNAR_MONTH, SOLAR_YEAR, ZERO_YEAR_JDN
 from .watat_strategy_base import WatatStrategyBase
 
@@ -13,15 +15,28 @@ from .watat_strategy_base import WatatStrategyBase
 # ဝါထပ်/မထပ် သိရဖို့ စန္ဒြမာသလတစ်လစာရက်တွေနဲ့ ညှိပြီးသားရက်ပိုရယ် ၈လစာရက်ပိုရယ်ပေါင်းခြင်းနဲ့နှိုင်းယှဉ်ရပါမယ်။
 # တကယ်လို့ ညှိပြီးသားရက်ပိုနဲ့ ၈လစာရက်ပိုပေါင်းခြင်းက စန္ဒြမာသတစ်လနဲ့ညီရင် ကြီးရင် ဝါထပ်ပါတယ်။
 class ThirdEraWatatStrategy(WatatStrategyBase):
+    __slots__ = ('_excess_days', '_is_watat', '_second_waso_full_moon_day')
+
+    # ခေတ်အလိုက် ပုံသေ ကိန်းတွေကို instance တိုင်းမှာ ပြန်မဆောက်ဘဲ class အဆင့်မှာ ထားပါတယ်။
+    to_check_months = 8 # check based on 8 months
+    excess_days_per_month = (SOLAR_YEAR / 12) - LUNAR_MONTH
+    watat_offset = -0.5
+    watat_exceptions = MappingProxyType({1345: False, 1344: True}) # key is year and value is whether watat or not
+    offset_exceptions = MappingProxyType({1377: 0.5}) # key is year and value is offset
+
     def __init__(self, year) -> None:
         super().__init__(year)
-        self.to_check_months = 8 # check based on 8 months
-        self.excess_days_per_month = (SOLAR_YEAR / 12) - LUNAR_MONTH
-        self.watat_offset = -0.5
-        self.watat_exceptions = {1345: False, 1344: True} # key is year and value is whether watat or not
-        self.offset_exceptions = {1377: 0.5} # key is year and value is offset
+        self._excess_days: float = None
+        self._is_watat: bool = None
+        self._second_waso_full_moon_day: int = None
 
     def is_watat(self) -> bool:
+        if self._is_watat is None:
+            self._is_watat = self._calculate_is_watat()
+
+        return self._is_watat
+
+    def _calculate_is_watat(self) -> bool:
         # ဒီနည်းနဲ့ တွက်ကြည့်ပြီး ရှိပြီးသား မြန်မာပြက္ခဒိန် မှတ်တမ်းတွေနဲ့ တိုက်ကြည့်လိုက်တော့ နှစ်အားလုံးကိုက်ညီပေမယ့်
         # တစ်နှစ်ပဲ ၁၃၄၅ ခုနှစ်မှာ ဝါထပ်ရမယ့် အစား ၁၃၄၄ ခုနှစ်မှာ ဝါထပ်ထားတာကို ခြွင်းချက်အနေနဲ့ တွေ့ရပါတယ်။
         if self.year in self.watat_exceptions:
@@ -44,17 +59,27 @@ class ThirdEraWatatStrategy(WatatStrategyBase):
     # အောက်က ပုံသေနည်းနဲ့ ရှာနိုင်ပါတယ်။
     # ဒုတိယဝါဆိုလပြည့်နေ့ = (သူရိယမာသနှစ် x ရှာလိုသောနှစ်) + မြန်မာနှစ် သုညနှစ်(ဂျူလီယန်ရက်) - ရက်ပို + (၄.၈ x စန္ဒြမာသလ) - ၀.၅
     def get_second_waso_full_moon_day(self) -> int:
+        if self._second_waso_full_moon_day is None:
+            self._second_waso_full_moon_day = self._calculate_second_waso_full_moon_day()
+
+        return self._second_waso_full_moon_day
+
+    def _calculate_second_waso_full_moon_day(self) -> int:
         excess_days = self._calculate_excess_days()
         watat_offset = self.offset_exceptions.get(self.year) if self.year in self.offset_exceptions else self.watat_offset
 
         return round(SOLAR_YEAR * self.year + ZERO_YEAR_JDN - excess_days + 4.5 * LUNAR_MONTH + watat_offset)
     
     def _calculate_excess_days(self) -> float:
+        if self._excess_days is not None:
+            return self._excess_days
+
         excess_days = (SOLAR_YEAR * (self.year + 3739)) % LUNAR_MONTH
         to_check_excess_days = (12 - self.to_check_months) * self.excess_days_per_month
         
         # if excess days is less than 4 months excess days
         # then this must be watat and need to adjust
         excess_days += LUNAR_MONTH if excess_days < to_check_excess_days else 0
+        self._excess_days = excess_days
 
         return excess_days
\ No newline at end of file
@@ -2,6 +2,8 @@ from abc import abstractmethod
 
 
 class WatatStrategyBase:
+    __slots__ = ('year',)
+
     def __init__(self, year: int) -> None:
         self.year = year
 
@@ -1,23 +1,132 @@
-from .first_era_makaranta2_strategy import FirstEraMakranata2WatatStrategy
-from .first_era_watat_strategy import FirstEraWatatStrategy
-from .second_era_watat_strategy import SecondEraWatatStrategy
-from .third_era_watat_strategy import ThirdEraWatatStrategy
-from .first_era_makaranta1_strategy import FirstEraMakranata1WatatStrategy
+from array import array
+
+from .watat_strategy_base import WatatStrategyBase
 
 class WatatStrategyFactory:
+    WATAT_COUNT_BLOCK = 512
+    WATAT_COUNT_MAX_YEAR = 16383
+
+    # strategy တစ်ခုရဲ့ ရလဒ်က နှစ်ပေါ်မှာပဲ မူတည်တာမို့ နှစ်တစ်နှစ်ကို strategy တစ်ခုပဲ ဆောက်ပြီး မျှသုံးပါတယ်။
+    _strategies: "dict[int, WatatStrategyBase]" = {}
+
+    # build_table နဲ့ ကြိုတွက်ထားတဲ့ (စနှစ်၊ ဝါထပ်/မထပ်၊ ဒုတိယ ဝါဆိုလပြည့်နေ့) ဇယား
+    # thread တွေ တစ်ဝက်တစ်ပျက် မဖတ်မိအောင် tuple တစ်ခုတည်းနဲ့ အစားထိုးပါတယ်။
+    _table = (0, array('b'), array('q'))
+
+    # _watat_counts[year] က ၀ ခုနှစ် ကနေ year (မပါ) အထိ ဝါထပ်နှစ် အရေအတွက် ဖြစ်ပါတယ်။ (prefix count)
+    # လိုတော့မှ iter_watat_years နဲ့ WATAT_COUNT_BLOCK နှစ်စီ ချဲ့ပြီး array အသစ်တစ်ခုတည်းနဲ့ အစားထိုးပါတယ်။
+    _watat_counts = array('l', [0])
 
     @classmethod
     def get_strategy(cls, year: int):
+        strategy = cls._strategies.get(year)
+        if strategy is None:
+            strategy = cls._strategies.setdefault(year, cls._create_strategy(year))
+
+        return strategy
+
+    # ခေတ်တစ်ခုရဲ့ strategy module ကို အဲဒီခေတ်က နှစ်တစ်နှစ်ကို ပထမဆုံး တွက်တော့မှ import လုပ်ပါတယ်။
+    @staticmethod
+    def _create_strategy(year: int) -> WatatStrategyBase:
         if year >= 1312:
+            from .third_era_watat_strategy import ThirdEraWatatStrategy
             return ThirdEraWatatStrategy(year)
-        
+
         if year >= 1217:
+            from .second_era_watat_strategy import SecondEraWatatStrategy
             return SecondEraWatatStrategy(year)
-        
+
         if year >= 1100:
+            from .first_era_watat_strategy import FirstEraWatatStrategy
             return FirstEraWatatStrategy(year)
-        
+
         if year >= 798:
+            from .first_era_makaranta2_strategy import FirstEraMakranata2WatatStrategy
             return FirstEraMakranata2WatatStrategy(year)
-        
-        return FirstEraMakranata1WatatStrategy(year)
\ No newline at end of file
+
+        from .first_era_makaranta1_strategy import FirstEraMakranata1WatatStrategy
+        return FirstEraMakranata1WatatStrategy(year)
+
+    # ရှာလိုတဲ့နှစ် မတိုင်ခင် အနီးဆုံး ဝါထပ်နှစ် (အများဆုံး ၃ နှစ်အလိုအထိ) ရဲ့ strategy ကို ပြန်ပေးပါတယ်။
+    @classmethod
+    def get_nearest_watat_strategy(cls, year: int) -> WatatStrategyBase:
+        year_count = 1
+        while not cls.is_watat(year - year_count) and year_count < 3:
+            year_count += 1
+
+        return cls.get_strategy(year - year_count)
+
+    # ဇယားထဲမှာ ရှိတဲ့နှစ်ဆိုရင် array ထဲကနေ တိုက်ရိုက်ယူပြီး မရှိရင် strategy နဲ့ တွက်ပါတယ်။
+    @classmethod
+    def is_watat(cls, year: int) -> bool:
+        start_year, watat_table, _ = cls._table
+        index = year - start_year
+        if 0 <= index < len(watat_table):
+            return bool(watat_table[index])
+
+        return cls.get_strategy(year).is_watat()
+
+    @classmethod
+    def get_second_waso_full_moon_day(cls, year: int) -> int:
+        start_year, _, second_waso_full_moon_table = cls._table
+        index = year - start_year
+        if 0 <= index < len(second_waso_full_moon_table):
+            return second_waso_full_moon_table[index]
+
+        return cls.get_strategy(year).get_second_waso_full_moon_day()
+
+    # start_year မှ end_year (အပါ) အထိ နှစ်တစ်နှစ်ချင်းစီရဲ့ (နှစ်၊ ဝါထပ်/မထပ်၊ ဒုတိယ ဝါဆိုလပြည့်နေ့) ကို အစဉ်လိုက် ထုတ်ပေးပါတယ်။
+    # ဇယားထဲမှာ ရှိရင် ဇယားကနေ ယူပြီး မရှိရင် နှစ်တစ်နှစ်ကို strategy တစ်ခုပဲ ဆောက်ပါတယ်။ (strategy cache ထဲ မထည့်ပါ)
+    @classmethod
+    def iter_watat_years(cls, start_year: int, end_year: int):
+        table_start_year, watat_table, second_waso_full_moon_table = cls._table
+        for year in range(start_year, end_year + 1):
+            index = year - table_start_year
+            if 0 <= index < len(watat_table):
+                yield year, bool(watat_table[index]), second_waso_full_moon_table[index]
+            else:
+                strategy = cls._strategies.get(year) or cls._create_strategy(year)
+                yield year, strategy.is_watat(), strategy.get_second_waso_full_moon_day()
+
+    # start_year မှ end_year (အပါ) အထိ နှစ်တွေအတွက် ဇယားကို ကြိုတည်ဆောက်ပါတယ်။ ဥပမာ build_table(0, 2000)
+    @classmethod
+    def build_table(cls, start_year: int = 0, end_year: int = 2000) -> None:
+        if end_year < start_year:
+            raise ValueError("end_year must not be less than start_year")
+
+        watat_table = array('b')
+        second_waso_full_moon_table = array('q')
+        for year in range(start_year, end_year + 1):
+            strategy = cls._create_strategy(year)
+            watat_table.append(strategy.is_watat())
+            second_waso_full_moon_table.append(strategy.get_second_waso_full_moon_day())
+
+        cls._table = (start_year, watat_table, second_waso_full_moon_table)
+
+    # year နှစ်ရဲ့ ဝါထပ်/မထပ် (counts[year + 1] - counts[year]) အထိ ပါတဲ့ _watat_counts ကို ပြန်ပေးပါတယ်။
+    # 0 မှ WATAT_COUNT_MAX_YEAR အပြင်ဘက်က နှစ်ဆိုရင် None ဖြစ်ပါတယ်။
+    @classmethod
+    def get_watat_counts(cls, year: int) -> "array | None":
+        watat_counts = cls._watat_counts
+        if year + 1 < len(watat_counts):
+            return watat_counts if year >= 0 else None
+
+        if not 0 <= year <= cls.WATAT_COUNT_MAX_YEAR:
+            return None
+
+        watat_counts = array('l', watat_counts)
+        count = watat_counts[-1]
+        end_year = min(((int) (year / cls.WATAT_COUNT_BLOCK) + 1) * cls.WATAT_COUNT_BLOCK, cls.WATAT_COUNT_MAX_YEAR)
+        for _, is_watat, _ in cls.iter_watat_years(len(watat_counts) - 1, end_year):
+            count += is_watat
+            watat_counts.append(count)
+
+        cls._watat_counts = watat_counts
+
+        return watat_counts
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._table = (0, array('b'), array('q'))
+        cls._watat_counts = array('l', [0])
+        cls._strategies.clear()
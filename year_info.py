@@ -0,0 +1,193 @@
+from .cache import LRUCache
+from .constants import SOLAR_YEAR, START_OF_THIRD_ERA, ZERO_YEAR_JDN
+from .enums.year_type import YearType
+from .watat_strategy.watat_strategy_factory import WatatStrategyFactory
+
+
+# မြန်မာနှစ်တစ်နှစ်အတွက် တစ်ကြိမ်သာ တွက်ဖို့လိုတဲ့ တန်ဖိုးတွေကို စုထားတာ ဖြစ်ပါတယ်။
+# ရက်စွဲ သန်းချီ ပြောင်းရင်လည်း မြန်မာနှစ် ရာဂဏန်းလောက်ပဲ ရှိတာမို့ နှစ်တစ်နှစ်ကို တစ်ခါပဲ တွက်ပြီး cache လုပ်ထားပါတယ်။
+class YearInfo:
+    def __init__(self, year: int, is_watat: bool, year_type: YearType, second_waso_full_moon_day: int,
+                 nearest_watat_year: int, first_day_of_tagu: int, thingyan_akya_time: float, thingyan_atat_time: float,
+                 new_year_day: int) -> None:
+        self.year = year
+        self.is_watat = is_watat
+        self.year_type = year_type
+        self.year_length = 354 + 30 * is_watat + (year_type == YearType.BigWatat)
+        self.second_waso_full_moon_day = second_waso_full_moon_day
+        self.nearest_watat_year = nearest_watat_year
+        self.first_day_of_tagu = first_day_of_tagu
+        # အကျချိန်၊ အတက်ချိန် (အချိန်ပါတဲ့ ဂျူလီယန်ရက်စွဲ) နဲ့ round ယူထားတဲ့ ဂျူလီယန်ရက်
+        self.thingyan_akya_time = thingyan_akya_time
+        self.thingyan_atat_time = thingyan_atat_time
+        self.thingyan_akya_day = round(thingyan_akya_time)
+        self.thingyan_atat_day = round(thingyan_atat_time)
+        self.new_year_day = new_year_day
+
+    def __repr__(self) -> str:
+        return f"YearInfo(year={self.year}, year_type={self.year_type.name}, first_day_of_tagu={self.first_day_of_tagu})"
+
+
+def build_year_info(year: int) -> YearInfo:
+    nearest_watat_year = WatatStrategyFactory.get_nearest_watat_strategy(year).year
+
+    return _make_year_info(
+        year,
+        WatatStrategyFactory.is_watat(year),
+        WatatStrategyFactory.get_second_waso_full_moon_day(year),
+        nearest_watat_year,
+        WatatStrategyFactory.get_second_waso_full_moon_day(nearest_watat_year),
+    )
+
+
+# build_year_info နဲ့ iter_year_info နှစ်ခုလုံး ဒီ function နဲ့ပဲ ဆောက်တာမို့ ရလဒ် ထပ်တူ ဖြစ်ပါတယ်။
+def _make_year_info(year: int, is_watat: bool, second_waso_full_moon_day: int, nearest_watat_year: int,
+                    nearest_second_waso_full_moon_day: int) -> YearInfo:
+    # ဝါထပ်နှစ်ဆိုရင် အနီးဆုံး ဝါထပ်နှစ်ရဲ့ ဒုတိယ ဝါဆိုလပြည့်နဲ့ ကွာတဲ့ရက်ကို ၃၅၄ နဲ့စားပြီး ဝါငယ်/ဝါကြီး ခွဲပါတယ်။
+    year_type = YearType.Common
+    if is_watat:
+        total_days = second_waso_full_moon_day - nearest_second_waso_full_moon_day
+        year_type = YearType(((int)((total_days % 354) / 31)) + 1)
+
+    year_count = year - nearest_watat_year
+    first_day_of_tagu = nearest_second_waso_full_moon_day + 354 * year_count - 102
+
+    # နှစ်တစ်နှစ်ရဲ့ နှစ်ကူးချိန် (အတက်ချိန်) ကိုလိုချင်ရင် နှစ်တစ်နှစ်မှာရှိတဲ့ ဂျူလီယန်ရက်အရေအတွက်နဲ့
+    # ရှာလိုတဲ့နှစ်နဲ့မြှောက်ပြီး မြန်မာနှစ် ၀ နှစ်မှာရှိတဲ့ ဂျူလီယန်ရက်နဲ့ပေါင်းလိုက်ရင် ရပါပြီ။
+    thingyan_atat_time = SOLAR_YEAR * year + ZERO_YEAR_JDN
+
+    # အကြမ်းအားဖြင့် အကြနေ့ဟာ (အကြ - အကြတ် - အတက်) ဖြစ်လို့ အတက်နေ့ထဲက ၂ ရက်နှုတ်ပေးရင် အကြနေ့ကို ရပါတယ်။
+    # အချိန်ပါတဲ့ ဂျူလီယန်ရက်စွဲ ဖြစ်နေလို့ YearInfo က ဂျူလီယန်ရက် ရအောင် round ယူပါတယ်။
+    akya_day_offset = 2.169918982 if year >= START_OF_THIRD_ERA else 2.1675
+
+    return YearInfo(
+        year,
+        is_watat,
+        year_type,
+        second_waso_full_moon_day,
+        nearest_watat_year,
+        first_day_of_tagu,
+        thingyan_atat_time - akya_day_offset,
+        thingyan_atat_time,
+        get_new_year_day(year),
+    )
+
+
+# MMDate._get_year နဲ့ အတူတူပဲ ဂျူလီယန်ရက်ကနေ မြန်မာနှစ်ကို ရှာပါတယ်။
+def get_year_from_jdn(jdn: int) -> int:
+    return (int) ((round(jdn) - ZERO_YEAR_JDN - 0.5) / SOLAR_YEAR)
+
+
+# get_year_from_jdn အရ နှစ်သစ်ကူးတဲ့ ပထမဆုံးရက် (နှစ်ဆန်းတစ်ရက်နေ့) ကို ပြန်ပေးပါတယ်။
+# ခန့်မှန်းရက်ကနေ စပြီး float ကြောင့် လွဲနိုင်တာကို ရှေ့နောက်ရွှေ့ပြီး ညှိပါတယ်။
+def get_new_year_day(year: int) -> int:
+    jdn = round(SOLAR_YEAR * year + ZERO_YEAR_JDN) + 1
+    while get_year_from_jdn(jdn) < year:
+        jdn += 1
+
+    while get_year_from_jdn(jdn - 1) >= year:
+        jdn -= 1
+
+    return jdn
+
+
+# ရက်စွဲ ပြောင်းလို့ရတဲ့ အပိုင်းအခြားက မြန်မာနှစ် ၁ ခုနှစ်ရဲ့ နှစ်ဆန်းတစ်ရက်နေ့ ကနေ ခရစ်နှစ် 9999/Dec/31 အထိ ဖြစ်ပါတယ်။
+# (မြန်မာနှစ် ၀ ခုနှစ်မှာ ပြက္ခဒိန် ပုံသေနည်းနဲ့ မတွက်နိုင်တဲ့ ရက်တွေ ပါပြီး datetime က ခရစ်နှစ် 9999 ထိပဲ ရပါတယ်)
+MIN_YEAR = 1
+MIN_JDN = get_new_year_day(MIN_YEAR)
+MAX_JDN = 5373484 # 9999/Dec/31
+MAX_YEAR = get_year_from_jdn(MAX_JDN)
+
+
+def check_year(year: int) -> None:
+    if not MIN_YEAR <= year <= MAX_YEAR:
+        raise ValueError(f"Myanmar year {year} is out of range ({MIN_YEAR}-{MAX_YEAR})")
+
+
+def check_jdn(jdn: int) -> None:
+    if not MIN_JDN <= jdn <= MAX_JDN:
+        raise ValueError(f"JDN {jdn} is out of range (Myanmar year {MIN_YEAR} to 9999-12-31, JDN {MIN_JDN}-{MAX_JDN})")
+
+
+# MMDate ရဲ့ _get_month၊ _get_actual_month နဲ့ _get_day ပုံသေနည်းတွေကို နှစ်အလိုက် တန်ဖိုးတွေနဲ့ တစ်ခါတည်း တွက်ပြီး
+# (လ၊ ရက်၊ လရဲ့ ရက်အရေအတွက်) ကို ပြန်ပေးပါတယ်။
+def get_month_and_day(year_info: YearInfo, jdn: int) -> tuple:
+    year_type = year_info.year_type
+    total_days = (int) (jdn - year_info.first_day_of_tagu + 1)
+    is_late_tagu = total_days > year_info.year_length
+    total_days -= year_info.year_length if is_late_tagu else 0
+
+    days = total_days
+    day_threshold = (int) ((days + 423) / 512)
+    days -= day_threshold if year_type == YearType.BigWatat else 0
+    days += (day_threshold * 30) if year_type == YearType.Common else 0
+    month = (int) ((days + 29.26) / 29.544)
+
+    e = (int) ((month + 12) / 16)
+    f = (int) ((month + 11) / 16)
+
+    day = total_days - (int) (29.544 * month - 29.26)
+    day -= e if year_type == YearType.BigWatat else 0
+    day += f * 30 if year_type == YearType.Common else 0
+
+    month += f * 3 - e * 4
+    month += 12 if is_late_tagu else 0
+
+    month_length = 30 - month % 2
+    month_length += 1 if month == 3 and year_type == YearType.BigWatat else 0
+
+    return month, day, month_length
+
+
+# process တစ်ခုလုံးမှာ MMDate အားလုံး မျှသုံးတဲ့ LRU cache ဖြစ်ပါတယ်။
+class YearInfoCache:
+    _cache = LRUCache(2048)
+
+    @classmethod
+    def get(cls, year: int) -> YearInfo:
+        return cls._cache.get(year, build_year_info)
+
+    @classmethod
+    def put(cls, year_info: YearInfo) -> None:
+        cls._cache.put(year_info.year, year_info)
+
+    @classmethod
+    def set_max_size(cls, max_size: int) -> None:
+        cls._cache.set_max_size(max_size)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._cache.clear()
+
+    @classmethod
+    def cache_info(cls) -> dict:
+        return cls._cache.cache_info()
+
+
+# start_year မှ end_year (အပါ) အထိ နှစ်တွေရဲ့ YearInfo ကို တစ်ကြိမ်တည်း ဖြတ်သွားပြီး အစဉ်လိုက် ထုတ်ပေးပါတယ်။
+# နှစ်တစ်နှစ်ချင်းစီအတွက် နောက်ပြန် ၃ နှစ်အထိ အနီးဆုံး ဝါထပ်နှစ်ကို ပြန်ရှာမယ့်အစား ပြီးခဲ့တဲ့ ၃ နှစ်ရဲ့
+# (ဝါထပ်/မထပ်၊ ဒုတိယ ဝါဆိုလပြည့်နေ့) ကို မှတ်ထားပြီး ရှေ့ဆက်သွားတာမို့ နှစ်တစ်နှစ်ကို strategy တစ်ကြိမ်ပဲ တွက်ပါတယ်။
+# ခေတ်တိုင်းရဲ့ watat_exceptions/offset_exceptions တွေက WatatStrategyFactory ကနေ ပါပြီးသား ဖြစ်ပါတယ်။
+# prefill ဆိုရင် ထုတ်ပေးတဲ့ YearInfo တွေကို YearInfoCache ထဲ ထည့်ပါတယ်။ (cache ထက် ကြီးတဲ့ အပိုင်းအခြားဆိုရင် အစပိုင်းက ပြန်ထွက်သွားပါမယ်)
+def iter_year_info(start_year: int, end_year: int, prefill: bool = True):
+    if end_year < start_year:
+        raise ValueError("end_year must not be less than start_year")
+
+    # get_nearest_watat_strategy နဲ့ အတူတူ ရှေ့ ၁-၂ နှစ်ထဲက အနီးဆုံး ဝါထပ်နှစ်၊ မရှိရင် ၃ နှစ်အရင်ကို ယူပါတယ်။
+    watat_years = WatatStrategyFactory.iter_watat_years(start_year - 3, end_year)
+    previous = [next(watat_years), next(watat_years), next(watat_years)]
+
+    for year, is_watat, second_waso_full_moon_day in watat_years:
+        nearest_watat_year, _, nearest_second_waso_full_moon_day = previous[0]
+        if previous[2][1]:
+            nearest_watat_year, _, nearest_second_waso_full_moon_day = previous[2]
+        elif previous[1][1]:
+            nearest_watat_year, _, nearest_second_waso_full_moon_day = previous[1]
+
+        year_info = _make_year_info(year, is_watat, second_waso_full_moon_day, nearest_watat_year, nearest_second_waso_full_moon_day)
+        if prefill:
+            YearInfoCache.put(year_info)
+
+        yield year_info
+
+        previous = [previous[1], previous[2], (year, is_watat, second_waso_full_moon_day)]